@@ -0,0 +1,63 @@
+"""
+Benchmark grouping a full-slate scoreboard into per-game records.
+
+Compares the old approach (one boolean mask over the whole DataFrame per game, then
+several iterrows() passes) with main.index_games, which groups in a single pass.
+
+    python benchmarks/bench_game_index.py [--games 15] [--repeat 200]
+"""
+import argparse
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import main  # noqa: E402
+from espn_payloads import scoreboard_payload  # noqa: E402
+
+
+def legacy_group(games_df):
+    """The per-game filtering get_games_list and team_page used before index_games."""
+    games = []
+    for game_id in games_df['game_id'].unique():
+        game = games_df[games_df['game_id'] == game_id]
+        teams = [row['team_name'] for _, row in game.iterrows()]
+        scores = [row['score'] for _, row in game.iterrows()]
+        abbrs = [row['team_abbr'] for _, row in game.iterrows()]
+        status = game['status'].iloc[0]
+        event_time_utc = game['event_time_utc'].iloc[0]
+        games.append((game_id, teams, scores, abbrs, status, event_time_utc))
+    return games
+
+
+def peak_allocated(func, *args):
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def run():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    games_df = main.parse_scoreboard(scoreboard_payload(games=args.games))
+    assert len(main.index_games(games_df)) == len(legacy_group(games_df))
+
+    print(f"Scoreboard: {args.games} games, {len(games_df)} rows, {args.repeat} repeats")
+    results = {}
+    for label, func in [("legacy mask + iterrows", legacy_group), ("index_games", main.index_games)]:
+        seconds = min(timeit.repeat(lambda: func(games_df), number=args.repeat, repeat=3)) / args.repeat
+        results[label] = seconds
+        print(f"  {label:<24} {seconds * 1e6:10.1f} us/call   peak {peak_allocated(func, games_df) / 1024:8.1f} KiB")
+    legacy, indexed = results.values()
+    print(f"  speedup: {legacy / indexed:.1f}x")
+
+
+if __name__ == "__main__":
+    run()
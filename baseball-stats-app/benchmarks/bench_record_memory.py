@@ -0,0 +1,129 @@
+"""
+Benchmark the memory held by player, team, game and roster records at league scale.
+
+Builds the same data with the old representations (PlayerStats/TeamStats holding a
+stats dict per player, loose dicts for games and roster entries) and with the
+__slots__/shared-layout ones in main, and reports what tracemalloc sees still allocated
+afterwards. Players come from every season CSV, repeated --copies times and spread
+over the 30 clubs.
+
+    python benchmarks/bench_record_memory.py [--copies 10]
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import main  # noqa: E402
+from espn_payloads import MLB_TEAMS, roster_payload, scoreboard_payload  # noqa: E402
+
+
+class LegacyPlayerStats:
+    def __init__(self, name, team):
+        self.name = name
+        self.team = team
+        self.stats = {}
+
+    def add_stat(self, stat_name, value):
+        self.stats[stat_name] = value
+
+
+class LegacyTeamStats:
+    def __init__(self, team_name):
+        self.team_name = team_name
+        self.players = {}
+
+    def add_player(self, player):
+        self.players[player.name] = player
+
+
+def season_rows(copies):
+    """(name, stats) for every player-season in the CSVs, `copies` times over."""
+    rows = []
+    for year in main.season_store.years():
+        df = main.season_store.get(year)
+        stat_columns = [col for col in df.columns if col != main.PLAYER_NAME_COLUMN]
+        for record in df.to_dict("records"):
+            stats = [(col, record[col]) for col in stat_columns]
+            rows.append((f"{record[main.PLAYER_NAME_COLUMN]} {year}", stats))
+    return [(f"{name} #{copy}", stats) for copy in range(copies) for name, stats in rows]
+
+
+def build_teams(rows, player_class, team_class):
+    teams = {abbr: team_class(abbr) for abbr, *_ in MLB_TEAMS}
+    abbrs = list(teams)
+    for i, (name, stats) in enumerate(rows):
+        player = player_class(name, abbrs[i % len(abbrs)])
+        for stat_name, value in stats:
+            player.add_stat(stat_name, value)
+        teams[player.team].add_player(player)
+    return teams
+
+
+def legacy_games(payloads):
+    """index_games output as it was: a dict per game and per side."""
+    games = []
+    for payload in payloads:
+        for game in main.index_games(main.parse_scoreboard(payload)).values():
+            record = {name: game[name] for name in main.GameRecord.__slots__}
+            for side in ("home", "away"):
+                record[side] = game[side].to_dict() if game[side] is not None else None
+            games.append(record)
+    return games
+
+
+def record_games(payloads):
+    games = []
+    for payload in payloads:
+        games.extend(main.index_games(main.parse_scoreboard(payload)).values())
+    return games
+
+
+def legacy_rosters():
+    return [[player.to_dict() for group in main.build_roster(roster_payload(team[1])) for player in group]
+            for team in MLB_TEAMS]
+
+
+def record_rosters():
+    return [[player for group in main.build_roster(roster_payload(team[1])) for player in group]
+            for team in MLB_TEAMS]
+
+
+def retained(build, *args):
+    """Bytes still allocated by build(*args) once its result is the only thing kept."""
+    gc.collect()
+    tracemalloc.start()
+    result = build(*args)
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def run():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--copies", type=int, default=10)
+    parser.add_argument("--days", type=int, default=180, help="scoreboards (one per day) kept in memory")
+    args = parser.parse_args()
+
+    rows = season_rows(args.copies)
+    payloads = [scoreboard_payload(seed=day) for day in range(args.days)]
+    cases = [
+        (f"{len(rows)} players in 30 teams", (build_teams, rows, LegacyPlayerStats, LegacyTeamStats),
+         (build_teams, rows, main.PlayerStats, main.TeamStats)),
+        (f"{args.days * 15} games", (legacy_games, payloads), (record_games, payloads)),
+        ("30 rosters", (legacy_rosters,), (record_rosters,)),
+    ]
+    print(f"{'records':<28}{'dicts KiB':>12}{'compact KiB':>14}{'saved':>8}")
+    for label, legacy, compact in cases:
+        before = retained(*legacy)
+        after = retained(*compact)
+        print(f"{label:<28}{before / 1024:>12.1f}{after / 1024:>14.1f}{1 - after / before:>8.0%}")
+
+
+if __name__ == "__main__":
+    run()
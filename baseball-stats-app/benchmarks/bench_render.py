@@ -0,0 +1,82 @@
+"""
+Benchmark template rendering for each HTML route.
+
+ESPN responses come from the synthetic payloads in espn_payloads.py, and the caches are
+warmed first, so the numbers reflect the route's own work. For every route this reports
+the mean time spent inside render_template, the mean time for a whole request with the
+page cache cleared, and the mean time for a request served from the page cache.
+
+    python benchmarks/bench_render.py [--repeat 200]
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import main  # noqa: E402
+import espn_payloads  # noqa: E402
+
+ROUTES = ["/", "/team?team=NYY", "/teams", "/news", "/about", "/season/2024"]
+
+
+def synthetic_upstream(url):
+    """Stand-in for main._request_api_data that serves espn_payloads instead of ESPN."""
+    path = url.split("?", 1)[0].rstrip("/")
+    if path.endswith("/scoreboard"):
+        return espn_payloads.scoreboard_payload()
+    if path.endswith("/news"):
+        return espn_payloads.news_payload()
+    match = re.search(r"/teams/(\d+)/roster$", path)
+    if match:
+        return espn_payloads.roster_payload(match.group(1))
+    match = re.search(r"/teams/(\d+)$", path)
+    if match:
+        return espn_payloads.team_details_payload(match.group(1))
+    return espn_payloads.teams_payload()
+
+
+def run():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    main._request_api_data = synthetic_upstream
+    render_seconds = []
+    original_render = main.render_template
+
+    def timed_render(*a, **kw):
+        start = time.perf_counter()
+        try:
+            return original_render(*a, **kw)
+        finally:
+            render_seconds.append(time.perf_counter() - start)
+
+    main.render_template = timed_render
+    main.precompile_templates()
+    client = main.app.test_client()
+
+    print(f"{'route':<18}{'render ms':>12}{'request ms':>12}{'cached ms':>12}")
+    for route in ROUTES:
+        response = client.get(route)  # warm caches
+        assert response.status_code == 200, (route, response.status_code)
+        render_seconds.clear()
+        uncached = 0.0
+        for _ in range(args.repeat):
+            main.page_cache.clear()
+            start = time.perf_counter()
+            client.get(route)
+            uncached += time.perf_counter() - start
+        render_ms = sum(render_seconds) / len(render_seconds) * 1000
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            client.get(route)
+        cached = time.perf_counter() - start
+        print(f"{route:<18}{render_ms:>12.3f}{uncached / args.repeat * 1000:>12.3f}"
+              f"{cached / args.repeat * 1000:>12.3f}")
+
+
+if __name__ == "__main__":
+    run()
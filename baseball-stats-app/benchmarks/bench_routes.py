@@ -0,0 +1,236 @@
+"""
+End-to-end load benchmark for the app's HTTP routes.
+
+Serves the app over real HTTP (werkzeug's threaded server, in this process) with ESPN
+replaced by the local stand-in from espn_standin.py, then drives each route from
+`--concurrency` client threads. For every route and concurrency level it reports
+p50/p95/p99 latency, requests per second and errors, followed by a serial pass under
+tracemalloc that reports the peak memory allocated while serving one request and what
+the request left allocated afterwards.
+
+Results can be saved as JSON and compared with an earlier run; a comparison exits with
+status 1 when any route's p95 latency or throughput got worse by more than --threshold.
+
+    python benchmarks/bench_routes.py [--concurrency 1 8] [--requests 400] [--output run.json]
+    python benchmarks/bench_routes.py --baseline run.json          # run, then compare
+    python benchmarks/bench_routes.py --compare old.json new.json  # compare saved runs
+    python benchmarks/bench_routes.py --url http://127.0.0.1:8000  # an already running app
+
+The load generator shares the GIL with the server when run in-process, so absolute
+throughput is lower than a multi-worker deployment; use --url against a separate server
+for that, and compare in-process runs with in-process runs.
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import espn_standin  # noqa: E402
+
+ROUTES = ["/", "/team?team=NYY", "/teams", "/news", "/about", "/season/2024"]
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def start_app(standin_base):
+    """Import the app against the stand-in and serve it on a free port; returns (main, base url)."""
+    from werkzeug.serving import WSGIRequestHandler, make_server
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_request(self, *args, **kwargs):
+            pass
+
+    # main reads ESPN_API_BASE at import time, so it is imported only once the stand-in is up
+    os.environ["ESPN_API_BASE"] = standin_base
+    import main
+
+    main.precompile_templates()
+    server = make_server("127.0.0.1", 0, main.app, threaded=True, request_handler=QuietHandler)
+    threading.Thread(target=server.serve_forever, name="bench-app", daemon=True).start()
+    return main, f"http://127.0.0.1:{server.server_port}"
+
+
+def load(base, route, concurrency, total):
+    """Issue `total` GETs of `route` from `concurrency` threads; returns (latencies in s, errors, elapsed s)."""
+    counter = itertools.count()
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+
+    def worker():
+        session = requests.Session()
+        local, failed = [], 0
+        while next(counter) < total:
+            start = time.perf_counter()
+            try:
+                response = session.get(base + route, timeout=30)
+                ok = response.status_code == 200
+            except requests.RequestException:
+                ok = False
+            local.append(time.perf_counter() - start)
+            failed += not ok
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors[0], time.perf_counter() - start
+
+
+def allocations(main, route, samples):
+    """Median peak and mean retained bytes allocated per request, served through the test client."""
+    client = main.app.test_client()
+    client.get(route)
+    peaks, retained = [], []
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            client.get(route).close()
+            current, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+            retained.append(current - before)
+    finally:
+        tracemalloc.stop()
+    return percentile(peaks, 0.5), sum(retained) / len(retained)
+
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def print_results(results):
+    print(f"{'route':<18}{'conc':>5}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}{'errors':>8}"
+          f"{'peak KiB':>10}{'kept KiB':>10}")
+    for r in results:
+        peak = f"{r['alloc_peak_bytes'] / 1024:>10.1f}" if r.get("alloc_peak_bytes") is not None else f"{'-':>10}"
+        kept = f"{r['alloc_retained_bytes'] / 1024:>10.1f}" if r.get("alloc_retained_bytes") is not None else f"{'-':>10}"
+        print(f"{r['route']:<18}{r['concurrency']:>5}{r['p50_ms']:>9.2f}{r['p95_ms']:>9.2f}{r['p99_ms']:>9.2f}"
+              f"{r['rps']:>9.0f}{r['errors']:>8}{peak}{kept}")
+
+
+def compare(old, new, threshold):
+    """Print p95 and throughput changes per (route, concurrency); returns the number of regressions."""
+    previous = {(r["route"], r["concurrency"]): r for r in old["results"]}
+    differing = [key for key in ("url", "no_page_cache", "fixtures", "latency", "scoreboard_interval", "requests")
+                 if old["settings"].get(key) != new["settings"].get(key)]
+    if differing:
+        print(f"note: the runs used different settings: {', '.join(differing)}")
+    regressions = 0
+    print(f"{'route':<18}{'conc':>5}{'p95 ms':>18}{'change':>9}{'req/s':>16}{'change':>9}")
+    for r in new["results"]:
+        before = previous.get((r["route"], r["concurrency"]))
+        if before is None:
+            continue
+        p95_change = r["p95_ms"] / before["p95_ms"] - 1 if before["p95_ms"] else 0.0
+        rps_change = r["rps"] / before["rps"] - 1 if before["rps"] else 0.0
+        worse = p95_change > threshold or rps_change < -threshold or r["errors"] > before["errors"]
+        regressions += worse
+        print(f"{r['route']:<18}{r['concurrency']:>5}{before['p95_ms']:>9.2f}{r['p95_ms']:>9.2f}{p95_change:>+9.1%}"
+              f"{before['rps']:>8.0f}{r['rps']:>8.0f}{rps_change:>+9.1%}{'  REGRESSION' if worse else ''}")
+    return regressions
+
+
+def run():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--routes", nargs="+", default=ROUTES)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--requests", type=int, default=400, help="requests per route and concurrency level")
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured requests per route first")
+    parser.add_argument("--alloc-samples", type=int, default=50, help="requests per route traced for allocations")
+    parser.add_argument("--no-page-cache", action="store_true", help="render every request instead of serving cached pages")
+    parser.add_argument("--url", help="benchmark an already running app instead (no stand-in, no allocation pass)")
+    parser.add_argument("--fixtures", help="stand-in fixture directory (default: synthetic payloads)")
+    parser.add_argument("--latency", type=float, default=0.0, help="stand-in latency per ESPN request, ms")
+    parser.add_argument("--scoreboard-interval", type=float, default=None,
+                        help="seconds between stand-in scoreboard changes, to include page cache invalidation")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare the results with this earlier JSON output")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative change counted as a regression")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="only compare two saved runs")
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as f_old, open(args.compare[1]) as f_new:
+            sys.exit(1 if compare(json.load(f_old), json.load(f_new), args.threshold) else 0)
+
+    main = None
+    base = args.url.rstrip("/") if args.url else None
+    if base is None:
+        _, standin_base = espn_standin.start(fixtures=args.fixtures, latency_ms=args.latency,
+                                             scoreboard_interval=args.scoreboard_interval, seed=0)
+        main, base = start_app(standin_base)
+        if args.no_page_cache:
+            main.page_cache.max_bytes = 0  # every page is larger, so nothing is stored
+
+    results = []
+    for route in args.routes:
+        _, warmup_errors, _ = load(base, route, 1, args.warmup)
+        if args.warmup and warmup_errors == args.warmup:
+            print(f"skipping {route}: every warmup request failed")
+            continue
+        alloc_peak = alloc_retained = None
+        if main is not None and args.alloc_samples:
+            alloc_peak, alloc_retained = allocations(main, route, args.alloc_samples)
+        for concurrency in args.concurrency:
+            latencies, errors, elapsed = load(base, route, concurrency, args.requests)
+            results.append({
+                "route": route,
+                "concurrency": concurrency,
+                "requests": len(latencies),
+                "errors": errors,
+                "rps": len(latencies) / elapsed,
+                "p50_ms": percentile(latencies, 0.50) * 1000,
+                "p95_ms": percentile(latencies, 0.95) * 1000,
+                "p99_ms": percentile(latencies, 0.99) * 1000,
+                "mean_ms": sum(latencies) / len(latencies) * 1000,
+                "alloc_peak_bytes": alloc_peak,
+                "alloc_retained_bytes": alloc_retained,
+            })
+    print_results(results)
+
+    run_data = {"environment": environment(), "settings": vars(args), "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(run_data, f, indent=2)
+        print(f"wrote {args.output}")
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print()
+        sys.exit(1 if compare(baseline, run_data, args.threshold) else 0)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,96 @@
+"""
+Benchmark main.PlayerSearchIndex on the bundled seasons and on larger synthetic pools.
+
+Reports build time and per-query latency (p50/p99) for prefix, full-name and typo
+queries. Synthetic players combine generated first and last names, so the vocabulary
+grows with the pool the way real rosters do.
+
+    python benchmarks/bench_search.py [--players 10000 100000] [--queries 300]
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import main  # noqa: E402
+from espn_payloads import FIRST_NAMES, LAST_NAMES  # noqa: E402
+
+
+def synthetic_players(count, seed=0):
+    rng = random.Random(seed)
+
+    def made_up(names):
+        base = rng.choice(names)
+        cut = rng.randint(3, len(base))
+        return base[:cut] + "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(0, 4)))
+
+    firsts = [made_up(FIRST_NAMES) for _ in range(max(count // 20, 50))]
+    lasts = [made_up(LAST_NAMES).capitalize() for _ in range(max(count // 4, 50))]
+    for player_id in range(count):
+        first_year = rng.randint(1950, 2024)
+        yield player_id, f"{rng.choice(firsts)} {rng.choice(lasts)}", first_year, min(first_year + rng.randint(0, 15), 2024)
+
+
+def typo(word, rng):
+    if len(word) < 5:
+        return word
+    i = rng.randrange(1, len(word) - 1)
+    return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+
+def queries(index, count, seed=0):
+    """(kind, query) pairs drawn from names in the index."""
+    rng = random.Random(seed)
+    names = [player["name"] for player in rng.sample(index.players, min(count, len(index.players)))]
+    out = []
+    for name in names:
+        first, last = main.normalize_search_text(name)[0], main.normalize_search_text(name)[-1]
+        out.append(("prefix", last[:3]))
+        out.append(("full name", f"{first} {last}"))
+        out.append(("typo", f"{first[:3]} {typo(last, rng)}"))
+    return out
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def report(label, index, query_count):
+    samples = {}
+    for kind, query in queries(index, query_count):
+        index.search(query)
+        start = time.perf_counter()
+        index.search(query)
+        samples.setdefault(kind, []).append((time.perf_counter() - start) * 1e6)
+    for kind, values in samples.items():
+        print(f"  {label:<22}{kind:<12}{percentile(values, 0.5):>9.1f}{percentile(values, 0.99):>9.1f}")
+
+
+def run():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--players", type=int, nargs="*", default=[10000, 100000])
+    parser.add_argument("--queries", type=int, default=300)
+    args = parser.parse_args()
+
+    print(f"  {'pool':<22}{'query':<12}{'p50 us':>9}{'p99 us':>9}")
+    start = time.perf_counter()
+    bundled = main.player_search.get()
+    print(f"bundled CSVs: {len(bundled.players)} players, {len(bundled.words)} words, "
+          f"built in {(time.perf_counter() - start) * 1000:.0f} ms (with career stats)")
+    report("bundled", bundled, args.queries)
+    for count in args.players:
+        players = list(synthetic_players(count))
+        start = time.perf_counter()
+        index = main.PlayerSearchIndex(players)
+        print(f"synthetic: {count} players, {len(index.words)} words, "
+              f"built in {(time.perf_counter() - start) * 1000:.0f} ms")
+        report(f"{count} players", index, args.queries)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,95 @@
+"""
+Benchmark start-time and published-date formatting for a full slate.
+
+Compares the old per-call code (strptime with two formats, pytz.timezone lookup and
+four strftime calls per game) with main.format_start_time and
+main.format_local_timestamp, both cold (caches cleared before every pass) and warm.
+
+    python benchmarks/bench_time_format.py [--games 15] [--repeat 2000]
+"""
+import argparse
+import os
+import sys
+import timeit
+from datetime import datetime
+
+import pytz
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import main  # noqa: E402
+from espn_payloads import news_payload, scoreboard_payload  # noqa: E402
+
+
+def legacy_start_time(event_time_utc, zone):
+    """The start-time block get_games_list and team_page each used to inline."""
+    tz = pytz.timezone(zone)
+    try:
+        dt_utc = datetime.strptime(event_time_utc, "%Y-%m-%dT%H:%MZ")
+    except ValueError:
+        dt_utc = datetime.strptime(event_time_utc, "%Y-%m-%dT%H:%M:%SZ")
+    dt_local = dt_utc.replace(tzinfo=pytz.utc).astimezone(tz)
+    hour = dt_local.strftime("%I").lstrip('0')
+    minute = dt_local.strftime("%M")
+    ampm = dt_local.strftime("%p")
+    tzname = dt_local.strftime("%Z")
+    return f"Starts @ {hour}:{minute} {ampm} {tzname}"
+
+
+def legacy_published_date(date_str):
+    utc_time = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ")
+    local_time = utc_time.replace(tzinfo=pytz.utc).astimezone(pytz.timezone('America/New_York'))
+    return local_time.strftime("%B %d, %Y %I:%M %p")
+
+
+def clear_caches():
+    main.format_start_time.cache_clear()
+    main.format_local_timestamp.cache_clear()
+    main.get_tzinfo.cache_clear()
+
+
+def run():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    games = main.index_games(main.parse_scoreboard(scoreboard_payload(games=args.games))).values()
+    starts = [(game["event_time_utc"], main.get_team_timezone(game["abbrs"][0])) for game in games]
+    published = [article["published"] for article in news_payload()["articles"]]
+
+    def legacy():
+        for timestamp, zone in starts:
+            legacy_start_time(timestamp, zone)
+        for date_str in published:
+            legacy_published_date(date_str)
+
+    def memoized():
+        for timestamp, zone in starts:
+            main.format_start_time(timestamp, zone)
+        for date_str in published:
+            main.format_published_date(date_str)
+
+    def cold():
+        clear_caches()
+        memoized()
+
+    for timestamp, zone in starts:
+        assert legacy_start_time(timestamp, zone) == main.format_start_time(timestamp, zone)
+    for date_str in published:
+        assert legacy_published_date(date_str) == main.format_published_date(date_str)
+
+    print(f"Slate: {len(starts)} start times + {len(published)} news dates, {args.repeat} repeats")
+    results = {}
+    for label, func in [("legacy strptime/strftime", legacy), ("single parse, cold cache", cold),
+                        ("memoized, warm cache", memoized)]:
+        seconds = min(timeit.repeat(func, number=args.repeat, repeat=3)) / args.repeat
+        results[label] = seconds
+        print(f"  {label:<26} {seconds * 1e6:10.1f} us/slate")
+    legacy_seconds = results["legacy strptime/strftime"]
+    print(f"  speedup cold: {legacy_seconds / results['single parse, cold cache']:.1f}x   "
+          f"warm: {legacy_seconds / results['memoized, warm cache']:.1f}x")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,175 @@
+"""
+Synthetic ESPN MLB API payloads for benchmarks.
+
+The payloads follow the shape of the real endpoints closely enough for the parsers in
+src/main.py (teams, scoreboard, news, team details and rosters), and are deterministic
+for a given seed so benchmark runs are comparable.
+"""
+import random
+from datetime import datetime, timedelta
+
+# (abbreviation, ESPN id, location, name)
+MLB_TEAMS = [
+    ("ARI", 29, "Arizona", "Diamondbacks"),
+    ("ATL", 15, "Atlanta", "Braves"),
+    ("BAL", 1, "Baltimore", "Orioles"),
+    ("BOS", 2, "Boston", "Red Sox"),
+    ("CHC", 16, "Chicago", "Cubs"),
+    ("CWS", 4, "Chicago", "White Sox"),
+    ("CIN", 17, "Cincinnati", "Reds"),
+    ("CLE", 5, "Cleveland", "Guardians"),
+    ("COL", 27, "Colorado", "Rockies"),
+    ("DET", 6, "Detroit", "Tigers"),
+    ("HOU", 18, "Houston", "Astros"),
+    ("KC", 7, "Kansas City", "Royals"),
+    ("LAA", 3, "Los Angeles", "Angels"),
+    ("LAD", 19, "Los Angeles", "Dodgers"),
+    ("MIA", 28, "Miami", "Marlins"),
+    ("MIL", 8, "Milwaukee", "Brewers"),
+    ("MIN", 9, "Minnesota", "Twins"),
+    ("NYM", 21, "New York", "Mets"),
+    ("NYY", 10, "New York", "Yankees"),
+    ("ATH", 11, "Oakland", "Athletics"),
+    ("PHI", 22, "Philadelphia", "Phillies"),
+    ("PIT", 23, "Pittsburgh", "Pirates"),
+    ("SD", 25, "San Diego", "Padres"),
+    ("SF", 26, "San Francisco", "Giants"),
+    ("SEA", 12, "Seattle", "Mariners"),
+    ("STL", 24, "St. Louis", "Cardinals"),
+    ("TB", 30, "Tampa Bay", "Rays"),
+    ("TEX", 13, "Texas", "Rangers"),
+    ("TOR", 14, "Toronto", "Blue Jays"),
+    ("WSH", 20, "Washington", "Nationals"),
+]
+
+ROSTER_POSITIONS = ["C", "C", "1B", "2B", "3B", "SS", "SS", "LF", "CF", "RF", "OF", "DH", "UT"] + \
+    ["SP"] * 5 + ["RP"] * 8
+
+FIRST_NAMES = ["Aaron", "Bryce", "Carlos", "Dylan", "Eddie", "Freddie", "Gerrit", "Hunter", "Ian",
+               "Jose", "Kyle", "Luis", "Mookie", "Nolan", "Ozzie", "Pete", "Ronald", "Shohei"]
+LAST_NAMES = ["Abreu", "Betts", "Correa", "Devers", "Escobar", "Freeman", "Garcia", "Harper",
+              "Iglesias", "Judge", "Kelenic", "Lindor", "Machado", "Nimmo", "Ohtani", "Perez",
+              "Ramirez", "Soto", "Turner", "Urias", "Vogelbach", "Witt", "Yelich", "Zunino"]
+
+
+def _team_json(abbr, team_id, location, name):
+    return {
+        "id": str(team_id),
+        "location": location,
+        "name": name,
+        "displayName": f"{location} {name}",
+        "abbreviation": abbr,
+        "logos": [{"href": f"https://a.espncdn.com/i/teamlogos/mlb/500/{abbr.lower()}.png"}],
+    }
+
+
+def teams_payload():
+    """Payload of /teams with all 30 clubs."""
+    return {
+        "sports": [{
+            "leagues": [{
+                "teams": [{"team": _team_json(*team)} for team in MLB_TEAMS],
+            }],
+        }],
+    }
+
+
+def team_details_payload(team_id):
+    """Payload of /teams/<id>."""
+    for team in MLB_TEAMS:
+        if team[1] == int(team_id):
+            details = _team_json(*team)
+            details["record"] = {"items": [{"summary": "81-81", "type": "total"}]}
+            details["links"] = [{"href": f"https://www.espn.com/mlb/team/_/name/{team[0].lower()}"}]
+            return {"team": details}
+    return {"team": {}}
+
+
+def scoreboard_payload(seed=0, games=15, start=datetime(2024, 7, 4, 17, 5)):
+    """
+    Payload of /scoreboard for a full slate: every club plays once, with a mix of
+    final, in-progress and scheduled games.
+    """
+    rng = random.Random(seed)
+    clubs = list(MLB_TEAMS)
+    rng.shuffle(clubs)
+    events = []
+    for i in range(games):
+        home, away = clubs[(2 * i) % len(clubs)], clubs[(2 * i + 1) % len(clubs)]
+        kind = i % 3
+        if kind == 0:
+            status, state, detail, period = "Final", "post", "Final", 9
+        elif kind == 1:
+            inning = rng.randint(1, 9)
+            half = rng.choice(["Top", "Bot"])
+            status, state, detail, period = "In Progress", "in", f"{half} {inning}th", inning
+        else:
+            status, state, detail, period = "Scheduled", "pre", "7:05 PM ET", 0
+        scores = [0, 0] if kind == 2 else [rng.randint(0, 10), rng.randint(0, 10)]
+        competition = {
+            "id": str(401570000 + i),
+            "status": {
+                "period": period,
+                "type": {"state": state, "description": status, "detail": detail, "shortDetail": detail},
+            },
+            "competitors": [
+                {"homeAway": "home", "score": str(scores[0]), "team": _team_json(*home)},
+                {"homeAway": "away", "score": str(scores[1]), "team": _team_json(*away)},
+            ],
+        }
+        if kind == 1:
+            competition["situation"] = {
+                "balls": rng.randint(0, 3),
+                "strikes": rng.randint(0, 2),
+                "outs": rng.randint(0, 2),
+                "onFirst": rng.random() < 0.4,
+                "onSecond": rng.random() < 0.3,
+                "onThird": rng.random() < 0.2,
+            }
+        events.append({
+            "id": competition["id"],
+            "date": (start + timedelta(minutes=30 * (i % 6))).strftime("%Y-%m-%dT%H:%MZ"),
+            "competitions": [competition],
+        })
+    return {"events": events}
+
+
+def news_payload(articles=20):
+    """Payload of /news."""
+    return {
+        "articles": [
+            {
+                "headline": f"MLB headline number {i}",
+                "links": {"web": {"href": f"https://www.espn.com/mlb/story/_/id/{40000000 + i}"}},
+                "published": (datetime(2024, 7, 4, 12, 0) - timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            }
+            for i in range(articles)
+        ],
+    }
+
+
+def roster_payload(team_id, seed=0):
+    """Payload of /teams/<id>/roster with a 26-man roster split into position groups."""
+    rng = random.Random(f"{seed}-{team_id}")
+    groups = {"pitchers": [], "catchers": [], "infield": [], "outfield": [], "designatedHitter": []}
+    jerseys = rng.sample(range(1, 100), len(ROSTER_POSITIONS))
+    for pos, jersey in zip(ROSTER_POSITIONS, jerseys):
+        if pos in ("SP", "RP"):
+            group = "pitchers"
+        elif pos == "C":
+            group = "catchers"
+        elif pos in ("LF", "CF", "RF", "OF"):
+            group = "outfield"
+        elif pos == "DH":
+            group = "designatedHitter"
+        else:
+            group = "infield"
+        athlete_id = rng.randint(30000, 45000)
+        groups[group].append({
+            "id": str(athlete_id),
+            "fullName": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "jersey": str(jersey),
+            "position": {"abbreviation": pos},
+            "headshot": {"href": f"https://a.espncdn.com/i/headshots/mlb/players/full/{athlete_id}.png"},
+        })
+    return {"athletes": [{"position": name, "items": items} for name, items in groups.items()]}
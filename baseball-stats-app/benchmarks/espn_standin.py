@@ -0,0 +1,231 @@
+"""
+Local stand-in for the ESPN MLB site API, for load tests without network access.
+
+Serves the endpoints the app uses (teams, team details, rosters, scoreboard, news)
+under the same paths as ESPN. Payloads come from recorded fixtures when a fixture
+directory is given, otherwise from the synthetic payloads in espn_payloads.py.
+Latency, jitter and error responses can be injected, and GET /_standin/stats reports
+how many requests each endpoint received, which shows what the app's caches let through.
+
+Record fixtures from the live API once:
+
+    python benchmarks/espn_standin.py record benchmarks/fixtures
+
+Serve them (or synthetic payloads, without --fixtures) and point the app at it:
+
+    python benchmarks/espn_standin.py serve --fixtures benchmarks/fixtures --latency 80 --error-rate 0.02
+    ESPN_API_BASE=http://127.0.0.1:8900/apis/site/v2/sports/baseball/mlb python src/main.py
+"""
+import argparse
+import gzip
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+import espn_payloads
+
+API_PATH = "/apis/site/v2/sports/baseball/mlb"
+ESPN_LIVE_BASE = "https://site.api.espn.com" + API_PATH
+ENDPOINT_RE = re.compile(r"^/(teams|scoreboard|news)(?:/(\d+)(/roster)?)?$")
+
+
+def fixture_name(endpoint):
+    """Fixture file for an endpoint path such as "/teams/10/roster": teams/10/roster.json."""
+    return endpoint.strip("/") + ".json"
+
+
+def endpoint_kind(endpoint):
+    match = ENDPOINT_RE.match(endpoint)
+    if not match:
+        return None
+    section, team_id, roster = match.groups()
+    if section != "teams" or team_id is None:
+        return section
+    return "roster" if roster else "team_details"
+
+
+class PayloadSource:
+    """
+    Encoded payloads by endpoint path, from a fixture directory or synthesized. Each
+    payload is serialized (and gzipped) once. With `scoreboard_interval` set, the
+    synthetic scoreboard changes every that many seconds so pollers see live updates.
+    """
+
+    def __init__(self, fixtures=None, scoreboard_interval=None):
+        self.fixtures = fixtures
+        self.scoreboard_interval = scoreboard_interval
+        self._encoded = {}
+        self._lock = threading.Lock()
+
+    def payload(self, endpoint):
+        kind = endpoint_kind(endpoint)
+        if kind is None:
+            return None
+        if self.fixtures:
+            path = os.path.join(self.fixtures, fixture_name(endpoint))
+            if not os.path.exists(path):
+                return None
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        team_id = ENDPOINT_RE.match(endpoint).group(2)
+        if kind == "scoreboard":
+            seed = int(time.time() // self.scoreboard_interval) if self.scoreboard_interval else 0
+            return espn_payloads.scoreboard_payload(seed=seed)
+        if kind == "news":
+            return espn_payloads.news_payload()
+        if kind == "roster":
+            return espn_payloads.roster_payload(team_id)
+        if kind == "team_details":
+            return espn_payloads.team_details_payload(team_id)
+        return espn_payloads.teams_payload()
+
+    def encoded(self, endpoint):
+        """(body, gzipped body) for an endpoint, or None if it has no payload."""
+        version = 0
+        if self.scoreboard_interval and endpoint_kind(endpoint) == "scoreboard":
+            version = int(time.time() // self.scoreboard_interval)
+        with self._lock:
+            cached = self._encoded.get(endpoint)
+            if cached is None or cached[0] != version:
+                payload = self.payload(endpoint)
+                body = None if payload is None else json.dumps(payload).encode("utf-8")
+                cached = self._encoded[endpoint] = (version, None if body is None else (body, gzip.compress(body, 5)))
+            return cached[1]
+
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, source, latency=0.0, jitter=0.0, error_rate=0.0, seed=None):
+        super().__init__(address, StandinHandler)
+        self.source = source
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.counts = {}
+        self.lock = threading.Lock()
+
+    def handle_error(self, request, client_address):
+        # Clients dropping keep-alive connections is routine under load, not worth a traceback
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+    def count(self, kind, status):
+        with self.lock:
+            per_kind = self.counts.setdefault(kind or "unknown", {})
+            per_kind[status] = per_kind.get(status, 0) + 1
+
+    def delay(self):
+        with self.lock:
+            jitter = self.rng.uniform(-self.jitter, self.jitter) if self.jitter else 0.0
+            failed = self.rng.random() < self.error_rate
+        return max(self.latency + jitter, 0.0), failed
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path == "/_standin/stats":
+            with self.server.lock:
+                body = json.dumps(self.server.counts).encode("utf-8")
+            return self.send_body(200, body)
+        if not path.startswith(API_PATH):
+            return self.send_body(404, b'{"error":"not found"}')
+        endpoint = path[len(API_PATH):]
+        kind = endpoint_kind(endpoint)
+        wait, failed = self.server.delay()
+        if wait:
+            time.sleep(wait)
+        if failed:
+            self.server.count(kind, 503)
+            return self.send_body(503, b'{"error":"injected failure"}')
+        encoded = self.server.source.encoded(endpoint)
+        if encoded is None:
+            self.server.count(kind, 404)
+            return self.send_body(404, b'{"error":"no payload"}')
+        self.server.count(kind, 200)
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            return self.send_body(200, encoded[1], gzipped=True)
+        return self.send_body(200, encoded[0])
+
+    def send_body(self, status, body, gzipped=False):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start(host="127.0.0.1", port=0, fixtures=None, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0,
+          scoreboard_interval=None, seed=None):
+    """Start a stand-in in a background thread; returns (server, ESPN_API_BASE url for it)."""
+    source = PayloadSource(fixtures, scoreboard_interval)
+    server = StandinServer((host, port), source, latency_ms / 1000, jitter_ms / 1000, error_rate, seed)
+    threading.Thread(target=server.serve_forever, name="espn-standin", daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}{API_PATH}"
+
+
+def record(directory, base=ESPN_LIVE_BASE):
+    """Save the live payloads of every endpoint the app uses under `directory`."""
+    session = requests.Session()
+    endpoints = ["/teams", "/scoreboard", "/news"]
+    for _, team_id, _, _ in espn_payloads.MLB_TEAMS:
+        endpoints += [f"/teams/{team_id}", f"/teams/{team_id}/roster"]
+    for endpoint in endpoints:
+        response = session.get(base + endpoint, timeout=(3.05, 10))
+        response.raise_for_status()
+        path = os.path.join(directory, fixture_name(endpoint))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(response.json(), f)
+        print(f"recorded {endpoint}")
+
+
+def run():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="serve fixtures or synthetic payloads")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8900)
+    serve.add_argument("--fixtures", help="directory written by the record command")
+    serve.add_argument("--latency", type=float, default=0.0, help="added latency per request, ms")
+    serve.add_argument("--jitter", type=float, default=0.0, help="uniform +/- jitter on the latency, ms")
+    serve.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    serve.add_argument("--scoreboard-interval", type=float, default=None,
+                       help="seconds between changes of the synthetic scoreboard")
+    serve.add_argument("--seed", type=int, default=None)
+    rec = commands.add_parser("record", help="record live ESPN payloads as fixtures")
+    rec.add_argument("directory")
+    rec.add_argument("--base", default=ESPN_LIVE_BASE)
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record(args.directory, args.base)
+        return
+    server, base = start(args.host, args.port, args.fixtures, args.latency, args.jitter, args.error_rate,
+                         args.scoreboard_interval, args.seed)
+    print(f"Serving ESPN stand-in; run the app with ESPN_API_BASE={base}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    run()
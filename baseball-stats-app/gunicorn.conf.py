@@ -0,0 +1,84 @@
+"""
+Gunicorn settings for running the app in production (gunicorn reads this file from the
+working directory):
+
+    cd baseball-stats-app && gunicorn wsgi:app
+
+Every setting below can be overridden from the environment (or on the command line).
+"""
+import gc
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+chdir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+
+# Worker processes. Rendering is CPU-bound Python, so processes (not threads) are what
+# scale with cores; each one holds its own copy of whatever it changes after the fork.
+workers = int(os.environ.get("WEB_CONCURRENCY", min(multiprocessing.cpu_count() * 2 + 1, 8)))
+# Threads per worker. They cover ESPN waits and the long-lived /stream/scores connections,
+# each of which occupies a thread for as long as the browser keeps the page open.
+worker_class = "gthread"
+threads = int(os.environ.get("THREADS", 16))
+# So streams can only ever take a quarter of each worker's threads: beyond that, clients
+# are refused and poll the JSON API. For many viewers, serve /stream/scores from asgi.py
+# instead (see the README), where a stream holds no thread. Set before the app is
+# imported, which reads it.
+os.environ.setdefault("SCORE_STREAM_MAX_CLIENTS", str(max(1, threads // 4)))
+
+# Seconds a worker may go without checking in before the master restarts it, and seconds
+# in-flight requests get to finish on SIGTERM/SIGHUP before workers are stopped. Open
+# score streams never finish on their own; browsers reconnect to the next worker.
+timeout = int(os.environ.get("TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("GRACEFUL_TIMEOUT", 20))
+keepalive = int(os.environ.get("KEEPALIVE", 5))
+
+# Import the app and warm its caches (wsgi.py) once in the master, before forking, so
+# the workers share the seasons, career stats, search index and rosters copy-on-write.
+preload_app = True
+
+accesslog = os.environ.get("ACCESS_LOG", "-")
+errorlog = "-"
+
+# Each worker counts its own requests; they write snapshots to this directory so that
+# /metrics, whichever worker answers it, reports the totals for all of them. Set before
+# the app is imported, which reads it.
+created_metrics_dir = None
+if not os.environ.get("METRICS_DIR"):
+    created_metrics_dir = os.environ["METRICS_DIR"] = tempfile.mkdtemp(prefix="baseball-stats-metrics-")
+
+
+def on_starting(server):
+    # Snapshots left by an earlier run would be added to this run's totals
+    metrics_dir = os.environ["METRICS_DIR"]
+    os.makedirs(metrics_dir, exist_ok=True)
+    for name in os.listdir(metrics_dir):
+        if name.endswith((".json", ".json.tmp")):
+            os.remove(os.path.join(metrics_dir, name))
+
+
+def pre_fork(server, worker):
+    # Move everything loaded so far out of the collector's reach, so collections in the
+    # workers do not write to (and so copy) the shared pages
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    # Threads do not survive a fork: start this worker's poller, roster refresher and metrics flusher
+    import main
+
+    main.start_background_threads()
+
+
+def worker_exit(server, worker):
+    # Keep what this worker counted since its last snapshot in the totals, and drop its gauges
+    import main
+
+    main.metrics.flush(gauges=False)
+
+
+def on_exit(server):
+    if created_metrics_dir:
+        shutil.rmtree(created_metrics_dir, ignore_errors=True)
@@ -0,0 +1,308 @@
+"""
+ASGI entry point, for serving the app from an event loop, e.g. with uvicorn:
+
+    cd baseball-stats-app && uvicorn asgi:app --app-dir src
+
+The routes whose data comes from ESPN (ASYNC_VIEWS) have async handlers here: they
+await ESPN through httpx (async_fetch_api_data and the async loaders in main.py), so
+no thread is held while ESPN answers, and only the template rendering runs in the
+thread pool. /stream/scores is served natively too: each open stream is a coroutine
+waiting on ScoreStream.alisten, so thousands can stay open. Every other route is the
+plain Flask view, run in the thread pool.
+"""
+import asyncio
+import contextvars
+import io
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+
+from werkzeug.exceptions import HTTPException
+
+import main
+
+# Threads running templates and the Flask views that do not call ESPN
+THREADS = int(os.environ.get("THREADS", 16))
+# Streams cost a coroutine and a socket each here, not a thread
+main.score_stream.max_clients = int(os.environ.get("SCORE_STREAM_MAX_CLIENTS", 5000))
+
+_thread_pool = ThreadPoolExecutor(max_workers=THREADS, thread_name_prefix="wsgi")
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        await lifespan(receive, send)
+    elif scope["type"] == "http":
+        if scope["path"] == "/stream/scores" and scope["method"] == "GET":
+            await stream_scores(scope, receive, send)
+        else:
+            await call_view(scope, receive, send)
+
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, main.warm_caches)
+                main.start_background_threads()
+            except Exception as e:
+                await send({"type": "lifespan.startup.failed", "message": str(e)})
+                return
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await main.close_async_client()
+            _thread_pool.shutdown(wait=False)
+            main.metrics.flush(gauges=False)  # as gunicorn.conf.py's worker_exit does
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+def in_thread(func, *args):
+    """Run `func` in the thread pool, in the current context (so it sees the Flask request)."""
+    return asyncio.get_running_loop().run_in_executor(_thread_pool, contextvars.copy_context().run, func, *args)
+
+
+# --- Async views ---
+# Each mirrors the Flask view of the same endpoint in main.py, with the same page cache
+# versions; they share the render and response helpers.
+async def home():
+    versions = tuple(await asyncio.gather(in_thread(main.scoreboard_poller.get_version),
+                                          main.async_navbar_versions()))
+    return await from_page_cache(versions, lambda: in_thread(main.render_home_page))
+
+
+async def team_page():
+    abbr = main.request.args.get("team")
+    roster_url = main.TEAM_ROSTER_API.get(abbr)
+    scoreboard_version, registry, *roster_version = await asyncio.gather(
+        in_thread(main.scoreboard_poller.get_version),
+        main.async_get_team_registry(),
+        *([main.async_get_api_data_version(roster_url)] if roster_url else []),
+    )
+    versions = (scoreboard_version, registry.version, roster_version[0] if roster_version else None)
+
+    async def build():
+        stream_since = main.score_stream.seq
+        roster = await main.roster_store.aget(abbr)
+        return await in_thread(main.render_team_page, abbr, registry, roster, stream_since)
+
+    return await from_page_cache(versions, build)
+
+
+async def teams_page():
+    async def build():
+        return await in_thread(main.render_teams_page, await main.async_get_team_registry())
+
+    return await from_page_cache(await main.async_navbar_versions(), build)
+
+
+async def news_page():
+    versions = tuple(await asyncio.gather(main.async_get_api_data_version(main.NEWS_URL),
+                                          main.async_navbar_versions()))
+
+    async def build():
+        return await in_thread(main.render_news_page, await main.async_get_news_list())
+
+    return await from_page_cache(versions, build)
+
+
+async def api_team(abbr):
+    registry = await main.async_get_team_registry()
+    return await in_thread(main.team_api_response, abbr, registry)  # reads the scoreboard snapshot
+
+
+async def api_roster(abbr):
+    return main.roster_api_response(abbr, await main.roster_store.aget(abbr))
+
+
+async def api_news():
+    return main.news_api_response(await main.async_get_news_list())
+
+
+ASYNC_VIEWS = {
+    "home": home,
+    "team_page": team_page,
+    "teams_page": teams_page,
+    "news_page": news_page,
+    "api_team": api_team,
+    "api_roster": api_roster,
+    "api_news": api_news,
+}
+
+
+async def from_page_cache(versions, build):
+    """main.cached_page for async views: the cached page for `versions`, or await build() and cache it."""
+    key = main.page_cache_key()
+    response = main.cached_response(key, versions)
+    if response is None:
+        response = main.cache_response(key, versions, await build())
+    return response
+
+
+# --- Dispatch ---
+async def call_view(scope, receive, send):
+    environ = wsgi_environ(scope, await read_body(receive))
+    try:
+        endpoint, _ = main.app.url_map.bind_to_environ(environ).match()
+    except HTTPException:
+        endpoint = None  # Flask answers with the 404, 405 or redirect
+    view = ASYNC_VIEWS.get(endpoint)
+    if view is None:
+        status, headers, content = await asyncio.get_running_loop().run_in_executor(
+            _thread_pool, run_wsgi, environ)
+    else:
+        status, headers, content = await run_async_view(view, environ)
+    await send({"type": "http.response.start", "status": status,
+                "headers": [(name.lower().encode("latin1"), value.encode("latin1")) for name, value in headers]})
+    await send({"type": "http.response.body", "body": content})
+
+
+async def run_async_view(view, environ):
+    """
+    Flask's request handling (Flask.wsgi_app and full_dispatch_request) around an async
+    view: before/after request hooks, error handlers and teardown all run as for the
+    Flask views. Returns (status code, headers, body).
+    """
+    with main.app.request_context(environ):
+        try:
+            try:
+                rv = main.app.preprocess_request()
+                if rv is None:
+                    rv = await view(**main.request.view_args)
+            except Exception as e:
+                rv = main.app.handle_user_exception(e)
+            response = main.app.finalize_request(rv)
+        except Exception as e:
+            response = main.app.handle_exception(e)
+        body, status, headers = response.get_wsgi_response(environ)
+        try:
+            content = b"".join(body)
+        finally:
+            response.close()
+    return int(status.split(" ", 1)[0]), headers, content
+
+
+async def read_body(receive):
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            break
+    return b"".join(chunks)
+
+
+def wsgi_environ(scope, body):
+    """The WSGI environ for an ASGI http scope (PEP 3333 strings: latin-1 decoded bytes)."""
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode("utf8").decode("latin1"),
+        "PATH_INFO": scope["path"].encode("utf8").decode("latin1"),
+        "QUERY_STRING": scope["query_string"].decode("latin1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": client[0],
+        "REMOTE_PORT": str(client[1]),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    for name, value in scope["headers"]:
+        name, value = name.decode("latin1"), value.decode("latin1")
+        if name == "content-type":
+            environ["CONTENT_TYPE"] = value
+        elif name == "content-length":
+            environ["CONTENT_LENGTH"] = value
+        else:
+            key = "HTTP_" + name.upper().replace("-", "_")
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+
+def run_wsgi(environ):
+    """Call the Flask app; returns (status code, headers, body). Responses are read in full."""
+    response = {}
+    chunks = []
+
+    def start_response(status, headers, exc_info=None):
+        response["status"] = int(status.split(" ", 1)[0])
+        response["headers"] = headers
+        return chunks.append
+
+    result = main.app(environ, start_response)
+    try:
+        for chunk in result:
+            chunks.append(chunk)
+    finally:
+        if hasattr(result, "close"):
+            result.close()
+    return response["status"], response["headers"], b"".join(chunks)
+
+
+# --- Live score stream ---
+async def stream_scores(scope, receive, send):
+    """main.stream_scores, with the stream itself a coroutine instead of a thread."""
+    started = time.perf_counter()
+    query = parse_qs(scope["query_string"].decode("latin1"))
+    team = (query.get("team") or [None])[0] or None
+    last_seq = dict(scope["headers"]).get(b"last-event-id", b"").decode("latin1") or (query.get("since") or [""])[0]
+    last_seq = int(last_seq) if last_seq.isdigit() else None
+
+    if not main.score_stream.connect():
+        await send_response(send, 503, b"Too many live score streams; poll the JSON API instead.\n",
+                            [(b"content-type", b"text/plain; charset=utf-8"),
+                             (b"retry-after", str(main.SCORE_STREAM_RETRY_MS // 1000).encode())])
+        record_request(503, started)
+        return
+    try:
+        main.scoreboard_poller.start()
+        await send({"type": "http.response.start", "status": 200, "headers": [
+            (b"content-type", b"text/event-stream; charset=utf-8"),
+            (b"cache-control", b"no-cache"),
+            (b"x-accel-buffering", b"no"),
+        ]})
+        record_request(200, started)
+
+        async def relay():
+            async for message in main.score_stream.alisten(team, last_seq):
+                await send({"type": "http.response.body", "body": message.encode(), "more_body": True})
+
+        # Stop as soon as the client leaves, not at the next message or keep-alive
+        streaming = asyncio.ensure_future(relay())
+        disconnected = asyncio.ensure_future(wait_for_disconnect(receive))
+        try:
+            await asyncio.wait({streaming, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            streaming.cancel()
+            disconnected.cancel()
+            await asyncio.gather(streaming, disconnected, return_exceptions=True)
+    finally:
+        main.score_stream.disconnect()
+
+
+async def wait_for_disconnect(receive):
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+async def send_response(send, status, body, headers):
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+def record_request(status, started):
+    # What the Flask app's after_request records for its own routes
+    main.metrics.inc("app_requests_total", route="/stream/scores", method="GET", status=status)
+    main.metrics.observe("app_request_duration_seconds", time.perf_counter() - started, route="/stream/scores")
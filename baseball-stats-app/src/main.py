@@ -1,14 +1,45 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-from flask import Flask, render_template_string, request, url_for, send_from_directory
+from flask import Flask, g, request, url_for, send_from_directory
+from flask import render_template as flask_render_template
+from markupsafe import Markup
 import pytz
 from datetime import datetime
+from urllib.parse import urlencode
 import os
+import re
+import json
+import hashlib
+import threading
+import bisect
+import heapq
+import itertools
+import unicodedata
+import time
+import random
+import asyncio
+import weakref
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, wait
+from collections import OrderedDict, deque
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from functools import wraps, lru_cache
 
 app = Flask(__name__)
 
+def precompile_templates():
+    """
+    Compile every template in templates/ into Jinja's cache up front, so the first
+    request to each route does not pay for parsing and compiling its template.
+    """
+    for name in app.jinja_env.list_templates(extensions=["html"]):
+        app.jinja_env.get_template(name)
+
 # Add a mapping of team abbreviations to their time zones (partial example, expand as needed)
 TEAM_TIMEZONES = {
     "ARI": "America/Phoenix",         # Arizona Diamondbacks
@@ -43,52 +74,798 @@ TEAM_TIMEZONES = {
     "WSH": "America/New_York",        # Washington Nationals
 }
 
-TEAM_ROSTER_API = {
-    "ARI": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/29/roster",
-    "ATL": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/15/roster",
-    "BAL": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/1/roster",
-    "BOS": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/2/roster",
-    "CHC": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/16/roster",
-    "CWS": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/4/roster",
-    "CIN": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/17/roster",
-    "CLE": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/5/roster",
-    "COL": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/27/roster",
-    "DET": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/6/roster",
-    "HOU": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/18/roster",
-    "KC":  "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/7/roster",
-    "LAA": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/3/roster",
-    "LAD": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/19/roster",
-    "MIA": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/28/roster",
-    "MIL": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/8/roster",
-    "MIN": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/9/roster",
-    "NYM": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/21/roster",
-    "NYY": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/10/roster",
-    "ATH": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/11/roster",
-    "PHI": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/22/roster",
-    "PIT": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/23/roster",
-    "SD":  "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/25/roster",
-    "SF":  "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/26/roster",
-    "SEA": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/12/roster",
-    "STL": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/24/roster",
-    "TB":  "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/30/roster",
-    "TEX": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/13/roster",
-    "TOR": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/14/roster",
-    "WSH": "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/20/roster",
+# ESPN's MLB site API. Point ESPN_API_BASE at another server (for example the stand-in in
+# benchmarks/espn_standin.py) to run without reaching ESPN.
+ESPN_API_BASE = os.environ.get(
+    "ESPN_API_BASE", "http://site.api.espn.com/apis/site/v2/sports/baseball/mlb"
+).rstrip("/")
+
+# ESPN team ids by abbreviation
+TEAM_ESPN_IDS = {
+    "ARI": 29,
+    "ATL": 15,
+    "BAL": 1,
+    "BOS": 2,
+    "CHC": 16,
+    "CWS": 4,
+    "CIN": 17,
+    "CLE": 5,
+    "COL": 27,
+    "DET": 6,
+    "HOU": 18,
+    "KC":  7,
+    "LAA": 3,
+    "LAD": 19,
+    "MIA": 28,
+    "MIL": 8,
+    "MIN": 9,
+    "NYM": 21,
+    "NYY": 10,
+    "ATH": 11,
+    "PHI": 22,
+    "PIT": 23,
+    "SD":  25,
+    "SF":  26,
+    "SEA": 12,
+    "STL": 24,
+    "TB":  30,
+    "TEX": 13,
+    "TOR": 14,
+    "WSH": 20,
 }
 
+TEAM_ROSTER_API = {abbr: f"{ESPN_API_BASE}/teams/{team_id}/roster" for abbr, team_id in TEAM_ESPN_IDS.items()}
+
 def get_team_timezone(team_abbr):
     return TEAM_TIMEZONES.get(team_abbr, "America/New_York")
 
-def fetch_api_data(url):
-    """Fetch data from the given ESPN MLB API endpoint."""
-    response = requests.get(url)
+# --- Section: Time formatting ---
+# ESPN timestamps are UTC ISO 8601, with or without seconds: 2024-07-04T23:05Z, 2024-07-04T12:00:00Z
+ESPN_TIMESTAMP_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2})(?::(\d{2})(?:\.\d+)?)?Z")
+PUBLISHED_DATE_ZONE = "America/New_York"
+
+def parse_espn_timestamp(value):
+    """Parse an ESPN UTC timestamp into an aware datetime in one pass; raises ValueError otherwise."""
+    match = ESPN_TIMESTAMP_RE.fullmatch(value)
+    if match is None:
+        raise ValueError(f"Unrecognized ESPN timestamp: {value!r}")
+    year, month, day, hour, minute, second = match.groups()
+    return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second or 0), tzinfo=pytz.utc)
+
+@lru_cache(maxsize=None)
+def get_tzinfo(zone):
+    """pytz zone object for a name, created once (TEAM_TIMEZONES only holds a few distinct zones)."""
+    return pytz.timezone(zone)
+
+@lru_cache(maxsize=4096)
+def format_start_time(timestamp, zone):
+    """'Starts @ 7:05 PM EDT' for an ESPN timestamp in `zone`, memoized per (timestamp, zone)."""
+    local = parse_espn_timestamp(timestamp).astimezone(get_tzinfo(zone))
+    hour = local.hour % 12 or 12
+    ampm = "AM" if local.hour < 12 else "PM"
+    return f"Starts @ {hour}:{local.minute:02d} {ampm} {local.tzname()}"
+
+@lru_cache(maxsize=4096)
+def format_local_timestamp(timestamp, zone, fmt):
+    """strftime an ESPN timestamp after converting it to `zone`, memoized per (timestamp, zone, fmt)."""
+    return parse_espn_timestamp(timestamp).astimezone(get_tzinfo(zone)).strftime(fmt)
+
+# --- Section: Compact records ---
+class Record:
+    """
+    Base for the app's parsed records (games, roster entries): fields live in __slots__
+    instead of a per-object dict. Fields read as attributes (templates) or as
+    record["field"], and to_dict() gives the JSON form.
+    """
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+    def __getitem__(self, name):
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def get(self, name, default=None):
+        return getattr(self, name, default)
+
+    def to_dict(self):
+        return {name: getattr(self, name, None) for name in self.__slots__}
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={value!r}" for name, value in self.to_dict().items())
+        return f"{type(self).__name__}({fields})"
+
+# --- Section: Metrics ---
+# Histogram bucket upper bounds, in seconds
+METRICS_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_HELP = {
+    "app_requests_total": ("counter", "HTTP requests by route, method and status code."),
+    "app_request_duration_seconds": ("histogram", "Time to produce a response, by route."),
+    "app_span_duration_seconds": ("histogram", "Time spent in each instrumented step: ESPN fetches, parsing, shaping and rendering."),
+    "app_upstream_requests_total": ("counter", "ESPN API calls by endpoint kind and outcome."),
+    "app_cache_lookups_total": ("counter", "Cache lookups by cache and result (hit, miss, stale, or shared with a concurrent fetch)."),
+    "app_background_errors_total": ("counter", "Failures in background refresh threads, by task."),
+}
+# A request carrying this header gets its span breakdown back in a Server-Timing header
+DEBUG_TIMING_HEADER = "X-Debug-Timing"
+# Shared directory where each server process writes its metrics, so /metrics on any of
+# them reports totals for all (gunicorn.conf.py sets one); unset, metrics are per process
+METRICS_DIR = os.environ.get("METRICS_DIR") or None
+METRICS_FLUSH_INTERVAL = 5  # seconds between a process's metrics snapshots
+# A process whose snapshot is older than this is taken to have exited; its gauges are dropped
+METRICS_GAUGE_MAX_AGE = 3 * METRICS_FLUSH_INTERVAL
+
+class Metrics:
+    """
+    In-process counters, histograms and gauges, rendered in the Prometheus text format
+    by /metrics.
+
+    Series are keyed by metric name plus label pairs. Without a `directory` every process
+    reports only its own, so behind one port of a multi-worker server each scrape would
+    see a random worker. With one, each process also writes its series there as a JSON
+    snapshot (on render, every METRICS_FLUSH_INTERVAL seconds and before forking), and
+    render() merges all the snapshots, which lag by up to that interval:
+    - counters and histograms are summed, including those of workers that have exited,
+      so totals never go backwards when a worker is replaced;
+    - gauges are listed per live process, with a pid label.
+    A forked child starts from zero; what its parent counted stays in the parent's snapshot.
+    """
+
+    def __init__(self, buckets=METRICS_BUCKETS, directory=None):
+        self.buckets = buckets
+        self.directory = directory
+        self._counters = {}    # (name, labels) -> value
+        self._histograms = {}  # (name, labels) -> [count per bucket..., count above the last bucket, sum]
+        self._gauges = {}      # name -> (help, zero-argument callable returning the value)
+        self._lock = threading.Lock()
+        self._snapshot_path = None
+        self._flusher = None
+        self._flusher_pid = None
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._snapshot_path = self._new_snapshot_path()
+            # The forking process (a server's master) counts, but its gauges describe no worker
+            os.register_at_fork(before=lambda: self.flush(gauges=False), after_in_child=self._forked)
+
+    def _new_snapshot_path(self):
+        # The start time as well as the pid, so a new process reusing a pid gets its own file
+        return os.path.join(self.directory, f"{os.getpid()}-{time.time_ns()}.json")
+
+    def _forked(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self._snapshot_path = self._new_snapshot_path()
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name, seconds, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        bucket = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._histograms.get(key)
+            if series is None:
+                series = self._histograms[key] = [0] * (len(self.buckets) + 2)
+            series[bucket] += 1
+            series[-1] += seconds
+
+    def gauge(self, name, help_text, read):
+        """Report `read()` as a gauge whenever metrics are rendered."""
+        self._gauges[name] = (help_text, read)
+
+    def _read_gauges(self):
+        values = {}
+        for name, (_, read) in self._gauges.items():
+            try:
+                values[name] = read()
+            except Exception as e:
+                print(f"Error reading metric {name}: {e}")
+        return values
+
+    def flush(self, gauges=True):
+        """
+        Write this process's series to its snapshot file in `directory` (no-op without
+        one). gauges=False leaves the process's gauges out, e.g. as it exits.
+        """
+        if not self.directory:
+            return
+        with self._lock:
+            counters = [[name, labels, value] for (name, labels), value in self._counters.items()]
+            histograms = [[name, labels, list(series)] for (name, labels), series in self._histograms.items()]
+        snapshot = {"pid": os.getpid(), "written_at": time.time(), "counters": counters,
+                    "histograms": histograms, "gauges": self._read_gauges() if gauges else {}}
+        path = self._snapshot_path
+        try:
+            # Written aside and renamed into place, so readers never see half a snapshot
+            with open(path + ".tmp", "w") as f:
+                json.dump(snapshot, f)
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            print(f"Error writing metrics snapshot {path}: {e}")
+
+    def start_flusher(self):
+        """Flush every METRICS_FLUSH_INTERVAL seconds from a background thread (again, after a fork)."""
+        pid = os.getpid()
+        if not self.directory or (self._flusher is not None and self._flusher_pid == pid):
+            return
+        self._flusher_pid = pid
+        self._flusher = threading.Thread(target=self._run_flusher, name="metrics-flusher", daemon=True)
+        self._flusher.start()
+
+    def _run_flusher(self):
+        while True:
+            time.sleep(METRICS_FLUSH_INTERVAL)
+            self.flush()
+
+    def _collect(self):
+        """(counters, histograms, gauges) to render: this process's, or merged from every snapshot."""
+        if not self.directory:
+            with self._lock:
+                counters = dict(self._counters)
+                histograms = {key: list(series) for key, series in self._histograms.items()}
+            gauges = {(name, ()): value for name, value in self._read_gauges().items()}
+            return counters, histograms, gauges
+
+        self.flush()
+        counters, histograms, gauges = {}, {}, {}
+        now = time.time()
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                with open(entry.path) as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Error reading metrics snapshot {entry.path}: {e}")
+                continue
+            for name, labels, value in snapshot["counters"]:
+                key = (name, tuple(map(tuple, labels)))
+                counters[key] = counters.get(key, 0) + value
+            for name, labels, series in snapshot["histograms"]:
+                key = (name, tuple(map(tuple, labels)))
+                total = histograms.get(key)
+                histograms[key] = series if total is None else [a + b for a, b in zip(total, series)]
+            if now - snapshot["written_at"] < METRICS_GAUGE_MAX_AGE:
+                for name, value in snapshot["gauges"].items():
+                    gauges[(name, (("pid", snapshot["pid"]),))] = value
+        return counters, histograms, gauges
+
+    def render(self):
+        counters, histograms, gauges = self._collect()
+        lines = []
+        described = set()
+
+        def describe(name, kind, help_text):
+            if name not in described:
+                described.add(name)
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), value in sorted(counters.items()):
+            describe(name, *METRICS_HELP.get(name, ("counter", name)))
+            lines.append(f"{name}{format_metric_labels(labels)} {value}")
+        for (name, labels), series in sorted(histograms.items()):
+            describe(name, *METRICS_HELP.get(name, ("histogram", name)))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else format(bound, "g")
+                lines.append(f"{name}_bucket{format_metric_labels(labels + (('le', le),))} {cumulative}")
+            lines.append(f"{name}_sum{format_metric_labels(labels)} {series[-1]:.6f}")
+            lines.append(f"{name}_count{format_metric_labels(labels)} {cumulative}")
+        for (name, labels), value in sorted(gauges.items()):
+            help_text = self._gauges[name][0] if name in self._gauges else name
+            describe(name, "gauge", help_text)
+            lines.append(f"{name}{format_metric_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+def format_metric_labels(labels):
+    """A Prometheus label set such as {route="/",status="200"}, or "" for no labels."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{escape_metric_label(value)}"' for key, value in labels) + "}"
+
+def escape_metric_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+metrics = Metrics(directory=METRICS_DIR)
+
+# Spans recorded during the current request, for the Server-Timing breakdown. A context
+# variable rather than flask.g so spans from run_concurrently's pool threads count too.
+_request_spans = contextvars.ContextVar("request_spans", default=None)
+
+@contextmanager
+def span(name):
+    """
+    Time a block (or, as a decorator, a function) as the step `name`: into the
+    app_span_duration_seconds histogram and the current request's timing breakdown.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        metrics.observe("app_span_duration_seconds", elapsed, span=name)
+        spans = _request_spans.get()
+        if spans is not None:
+            spans.append((name, elapsed))
+
+def render_template(template_name, **context):
+    """flask.render_template, timed as a render_<template> span."""
+    with span("render_" + template_name.rsplit(".", 1)[0]):
+        return flask_render_template(template_name, **context)
+
+def server_timing(spans, total):
+    """A Server-Timing header value: each span name's total duration (and call count), then the total."""
+    durations = {}
+    for name, elapsed in spans:
+        count, seconds = durations.get(name, (0, 0.0))
+        durations[name] = (count + 1, seconds + elapsed)
+    parts = [
+        f'{name};dur={seconds * 1000:.2f}' + (f';desc="{count} calls"' if count > 1 else "")
+        for name, (count, seconds) in durations.items()
+    ]
+    parts.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(parts)
+
+@app.before_request
+def start_request_metrics():
+    g.request_started = time.perf_counter()
+    g.request_spans_token = _request_spans.set([])
+
+@app.after_request
+def record_request_metrics(response):
+    started = g.get("request_started")
+    if started is None:
+        return response
+    elapsed = time.perf_counter() - started
+    # The route pattern, not the path, so /player/<id> is one series rather than one per player
+    route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+    metrics.inc("app_requests_total", route=route, method=request.method, status=response.status_code)
+    metrics.observe("app_request_duration_seconds", elapsed, route=route)
+    if DEBUG_TIMING_HEADER in request.headers:
+        response.headers["Server-Timing"] = server_timing(_request_spans.get() or (), elapsed)
+    return response
+
+@app.teardown_request
+def end_request_metrics(exc=None):
+    token = g.pop("request_spans_token", None)
+    if token is not None:
+        _request_spans.reset(token)
+
+# --- Section: ESPN response cache ---
+# How long (in seconds) a response from each kind of ESPN endpoint stays fresh.
+# Teams, team details and rosters barely change during a day; the scoreboard is live.
+API_CACHE_TTLS = {
+    "teams": 6 * 60 * 60,
+    "team_details": 6 * 60 * 60,
+    "roster": 12 * 60 * 60,
+    "scoreboard": 15,
+    "news": 5 * 60,
+}
+DEFAULT_API_CACHE_TTL = 60
+# Seconds an expired response keeps being served after a failed background refresh before the next try
+API_REFRESH_RETRY_DELAY = 30
+# How long past its TTL a response may still be served while refreshes keep failing.
+# Beyond that, requests wait for ESPN again and see its errors rather than old data.
+API_MAX_STALENESS = {
+    "teams": 24 * 60 * 60,
+    "team_details": 24 * 60 * 60,
+    "roster": 24 * 60 * 60,
+    "scoreboard": 5 * 60,
+    "news": 60 * 60,
+}
+DEFAULT_API_MAX_STALENESS = 10 * 60
+
+_api_cache = {}          # url -> (expires_at, data, servable_until)
+_api_inflight = {}       # url -> threading.Event set once the fetch for that url finishes
+_api_versions = {}       # url -> number of times the payload for that url has changed
+_api_cache_lock = threading.Lock()
+
+def get_endpoint_kind(url):
+    """Classify an ESPN MLB API url as teams, team_details, roster, scoreboard or news."""
+    path = url.split("?", 1)[0].rstrip("/")
+    if path.endswith("/scoreboard"):
+        return "scoreboard"
+    if path.endswith("/news"):
+        return "news"
+    if path.endswith("/roster"):
+        return "roster"
+    if path.endswith("/teams"):
+        return "teams"
+    if "/teams/" in path:
+        return "team_details"
+    return None
+
+def get_cache_ttl(url):
+    return API_CACHE_TTLS.get(get_endpoint_kind(url), DEFAULT_API_CACHE_TTL)
+
+def get_max_staleness(url):
+    return API_MAX_STALENESS.get(get_endpoint_kind(url), DEFAULT_API_MAX_STALENESS)
+
+def fetch_api_data(url, ttl=None, refresh=False):
+    """
+    Fetch data from the given ESPN MLB API endpoint.
+
+    Responses are cached per url for the endpoint's TTL (see API_CACHE_TTLS), and
+    concurrent requests for the same url share a single upstream call. Once a url has
+    been fetched, callers do not wait for ESPN again: an expired copy is returned
+    immediately while one background refresh replaces it. Only the first fetch of a
+    url blocks, refresh=True, which always fetches now, and a copy that has outlived
+    its TTL by more than API_MAX_STALENESS because refreshes kept failing.
+    """
+    if ttl is None:
+        ttl = get_cache_ttl(url)
+    while True:
+        data, pending, owner = _lookup_api_cache(url, refresh)
+        if owner:
+            break
+        if pending is None:
+            return data
+        pending.wait()
+        data = _shared_api_data(url)
+        if data is not None:
+            return data
+        # The leader's fetch failed and there is nothing to fall back on; try ourselves
+
+    if data is not None:
+        try:
+            get_fetch_pool().submit(_refresh_api_data, url, ttl, pending)
+        except Exception as e:
+            # No refresh will run (the pool is shut down, or no thread could start): release
+            # the marker, or later refresh=True callers would wait on it forever
+            print(f"Error refreshing {url}: {e}")
+            _release_api_fetch(url, pending)
+        return data
+    metrics.inc("app_cache_lookups_total", cache="espn", result="miss")
+    return _store_api_data(url, ttl, pending)
+
+def _lookup_api_cache(url, refresh):
+    """
+    The cache step of fetch_api_data and async_fetch_api_data. Returns (data, pending,
+    owner), where pending is the url's in-flight marker:
+    - (data, None, False): serve data, fresh or already being refreshed;
+    - (data, pending, True): serve data, but first start a refresh that sets pending;
+    - (None, pending, True): fetch now, then set pending;
+    - (None, pending, False): someone else is fetching; wait for pending, then use
+      _shared_api_data.
+    """
+    with _api_cache_lock:
+        cached = _api_cache.get(url)
+        if cached and cached[2] <= time.monotonic():
+            cached = None  # too old to serve, however ESPN is doing
+        if cached and not refresh:
+            if cached[0] > time.monotonic():
+                metrics.inc("app_cache_lookups_total", cache="espn", result="hit")
+                return cached[1], None, False
+            metrics.inc("app_cache_lookups_total", cache="espn", result="stale")
+            if url in _api_inflight:
+                return cached[1], None, False
+            pending = _api_inflight[url] = threading.Event()
+            return cached[1], pending, True
+        pending = _api_inflight.get(url)
+        if pending is None:
+            # This caller does the fetch; everyone else waits on the event
+            pending = _api_inflight[url] = threading.Event()
+            return None, pending, True
+        return None, pending, False
+
+def _shared_api_data(url):
+    """What another caller's fetch left in the cache, or None if there is nothing servable."""
+    with _api_cache_lock:
+        cached = _api_cache.get(url)
+    if cached and cached[2] > time.monotonic():
+        # Whatever the leader fetched (or the last good copy if its fetch failed),
+        # even when ttl is 0, so a burst of identical requests costs one call
+        metrics.inc("app_cache_lookups_total", cache="espn", result="shared")
+        return cached[1]
+    return None
+
+def _store_api_data(url, ttl, pending):
+    """Call ESPN for `url` and cache the payload, then release `pending` (this url's in-flight marker)."""
+    kind = get_endpoint_kind(url) or "other"
+    try:
+        try:
+            with span(f"espn_{kind}"):
+                data = _request_api_data(url)
+        except Exception:
+            metrics.inc("app_upstream_requests_total", endpoint=kind, outcome="error")
+            raise
+        metrics.inc("app_upstream_requests_total", endpoint=kind, outcome="ok")
+        return _cache_api_payload(url, ttl, data)
+    finally:
+        _release_api_fetch(url, pending)
+
+def _cache_api_payload(url, ttl, data):
+    """Cache a payload fetched for `url` and return it (or the equal copy already cached)."""
+    with _api_cache_lock:
+        previous = _api_cache.get(url)
+        if previous is not None and previous[1] == data:
+            # Unchanged: keep the existing object so anything derived from it stays valid
+            data = previous[1]
+        else:
+            _api_versions[url] = _api_versions.get(url, 0) + 1
+        now = time.monotonic()
+        _api_cache[url] = (now + ttl, data, now + ttl + get_max_staleness(url))
+    return data
+
+def _release_api_fetch(url, pending):
+    with _api_cache_lock:
+        _api_inflight.pop(url, None)
+    pending.set()
+
+def _refresh_api_data(url, ttl, pending):
+    """Background replacement of an expired cache entry, started by fetch_api_data."""
+    try:
+        _store_api_data(url, ttl, pending)
+    except Exception as e:
+        _api_refresh_failed(url, e)
+
+def _api_refresh_failed(url, error):
+    # Keep serving the expired copy; wait a while before the next attempt
+    print(f"Error refreshing {url}: {error}")
+    metrics.inc("app_background_errors_total", task="espn_refresh")
+    with _api_cache_lock:
+        cached = _api_cache.get(url)
+        if cached is not None:
+            _api_cache[url] = (time.monotonic() + API_REFRESH_RETRY_DELAY, cached[1], cached[2])
+
+# --- Section: ESPN HTTP session ---
+# (connect, read) timeouts in seconds, so a slow ESPN endpoint cannot hold a worker forever
+API_TIMEOUT = (3.05, 10)
+API_MAX_RETRIES = 3
+API_RETRY_STATUSES = (429, 500, 502, 503, 504)
+API_RETRY_BACKOFF = 0.3  # seconds before the first retry, doubling after each, plus up to this much jitter
+API_POOL_SIZE = 20
+
+_http_session = None
+_http_session_pid = None
+_http_session_lock = threading.Lock()
+
+def get_http_session():
+    """
+    Return the process-wide pooled session used for all ESPN calls.
+
+    Connections are kept alive and reused; failed connects and 429/5xx responses are
+    retried a bounded number of times with jittered exponential backoff. Read timeouts
+    are not retried, so a hung endpoint costs one read timeout rather than several. A
+    new session is created after a fork so worker processes never share sockets.
+    """
+    global _http_session, _http_session_pid
+    pid = os.getpid()
+    if _http_session is not None and _http_session_pid == pid:
+        return _http_session
+    with _http_session_lock:
+        if _http_session is None or _http_session_pid != pid:
+            retry = Retry(
+                total=API_MAX_RETRIES,
+                connect=API_MAX_RETRIES,
+                read=0,
+                status=API_MAX_RETRIES,
+                backoff_factor=API_RETRY_BACKOFF,
+                backoff_jitter=API_RETRY_BACKOFF,
+                status_forcelist=API_RETRY_STATUSES,
+                allowed_methods=frozenset(["GET"]),
+                respect_retry_after_header=True,
+            )
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=API_POOL_SIZE, max_retries=retry)
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({"Accept": "application/json", "Accept-Encoding": "gzip, deflate"})
+            _http_session = session
+            _http_session_pid = pid
+    return _http_session
+
+def close_http_session():
+    """Close the pooled ESPN connections; the next get_http_session opens a new session."""
+    global _http_session
+    with _http_session_lock:
+        session, _http_session = _http_session, None
+    if session is not None:
+        session.close()
+
+def _request_api_data(url):
+    response = get_http_session().get(url, timeout=API_TIMEOUT)
     response.raise_for_status()
     return response.json()
 
+# --- Section: Concurrent fetches ---
+FETCH_POOL_SIZE = 16
+
+_fetch_pool = None
+_fetch_pool_pid = None
+_fetch_pool_lock = threading.Lock()
+
+def get_fetch_pool():
+    """Return the process-wide thread pool used to fan out ESPN calls (recreated after a fork)."""
+    global _fetch_pool, _fetch_pool_pid
+    pid = os.getpid()
+    with _fetch_pool_lock:
+        if _fetch_pool is None or _fetch_pool_pid != pid:
+            _fetch_pool = ThreadPoolExecutor(max_workers=FETCH_POOL_SIZE, thread_name_prefix="espn-fetch")
+            _fetch_pool_pid = pid
+    return _fetch_pool
+
+def shutdown_fetch_pool():
+    """Stop the fetch pool's threads; the next get_fetch_pool starts a new pool."""
+    global _fetch_pool
+    with _fetch_pool_lock:
+        pool, _fetch_pool = _fetch_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+def run_concurrently(*calls):
+    """
+    Start every zero-argument callable at once and return their results in order.
+
+    Lets a route issue all of its independent ESPN calls together, so its latency is
+    close to the slowest call rather than the sum of them. The first exception raised
+    by any call is re-raised once all of them have finished.
+    """
+    if len(calls) == 1:
+        return [calls[0]()]
+    pool = get_fetch_pool()
+    # Each call runs in a copy of the caller's context, so its spans count toward the request
+    futures = [pool.submit(contextvars.copy_context().run, call) for call in calls]
+    wait(futures)
+    return [future.result() for future in futures]
+
+def get_api_data_version(url):
+    """
+    Fetch `url` through the cache (refreshing it if its TTL has passed) and return a
+    number that changes whenever the payload for that url changes.
+    """
+    fetch_api_data(url)
+    return _api_versions.get(url, 0)
+
+async def async_get_api_data_version(url):
+    await async_fetch_api_data(url)
+    return _api_versions.get(url, 0)
+
+def clear_api_cache():
+    with _api_cache_lock:
+        _api_cache.clear()
+
+# --- Section: Async ESPN client ---
+# The same cache as fetch_api_data, filled through httpx instead of requests, for the
+# ASGI entry point (asgi.py): there a route's ESPN calls are awaited on the event loop
+# instead of each holding a thread while ESPN answers.
+_async_clients = weakref.WeakKeyDictionary()  # event loop -> AsyncESPNClient
+
+class AsyncESPNClient:
+    """One event loop's pooled httpx client for ESPN, and the fetches that loop has in flight."""
+
+    def __init__(self):
+        import httpx  # only the async path needs it
+
+        self.http = httpx.AsyncClient(
+            timeout=httpx.Timeout(API_TIMEOUT[1], connect=API_TIMEOUT[0]),
+            # The transport retries failed connects; request() retries the statuses
+            transport=httpx.AsyncHTTPTransport(
+                retries=API_MAX_RETRIES,
+                limits=httpx.Limits(max_connections=API_POOL_SIZE, max_keepalive_connections=API_POOL_SIZE),
+            ),
+            headers={"Accept": "application/json"},
+        )
+        self.inflight = {}  # url -> asyncio.Event set once this loop's fetch of that url finishes
+        self._tasks = set()  # background refreshes, referenced until they finish
+
+    async def request(self, url):
+        """
+        GET `url` as JSON. 429/5xx responses are retried like get_http_session does, with
+        jittered exponential backoff or the server's Retry-After; read timeouts are not.
+        """
+        for attempt in range(API_MAX_RETRIES + 1):
+            response = await self.http.get(url)
+            if response.status_code not in API_RETRY_STATUSES or attempt == API_MAX_RETRIES:
+                break
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = int(retry_after)
+            else:
+                delay = API_RETRY_BACKOFF * 2 ** attempt + random.uniform(0, API_RETRY_BACKOFF)
+            await asyncio.sleep(delay)
+        response.raise_for_status()
+        return response.json()
+
+    def start(self, coroutine):
+        """Run `coroutine` in the background on this loop."""
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+def get_async_client():
+    """The running event loop's AsyncESPNClient, created on first use."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = AsyncESPNClient()
+    return client
+
+async def close_async_client():
+    """Close the running loop's ESPN connections; the next get_async_client opens new ones."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.http.aclose()
+
+async def _async_request_api_data(url):
+    return await get_async_client().request(url)
+
+async def async_fetch_api_data(url, ttl=None, refresh=False):
+    """
+    fetch_api_data for coroutines: the same cache, TTLs, stale copies and in-flight
+    sharing, with ESPN called through httpx on the running loop. Coroutines waiting for
+    a fetch of the same loop just await it; one waiting for a thread's fetch waits in
+    the loop's default executor.
+    """
+    if ttl is None:
+        ttl = get_cache_ttl(url)
+    client = get_async_client()
+    while True:
+        data, pending, owner = _lookup_api_cache(url, refresh)
+        if owner:
+            break
+        if pending is None:
+            return data
+        fetching = client.inflight.get(url)
+        if fetching is not None:
+            await fetching.wait()
+        else:
+            await asyncio.get_running_loop().run_in_executor(None, pending.wait)
+        data = _shared_api_data(url)
+        if data is not None:
+            return data
+
+    # Registered before anything is awaited, so this loop's other callers find it
+    client.inflight[url] = asyncio.Event()
+    if data is not None:
+        client.start(_async_refresh_api_data(url, ttl, pending))
+        return data
+    metrics.inc("app_cache_lookups_total", cache="espn", result="miss")
+    return await _async_store_api_data(url, ttl, pending)
+
+async def _async_store_api_data(url, ttl, pending):
+    """_store_api_data through httpx; also releases the loop's in-flight event."""
+    kind = get_endpoint_kind(url) or "other"
+    try:
+        try:
+            with span(f"espn_{kind}"):
+                data = await _async_request_api_data(url)
+        except Exception:
+            metrics.inc("app_upstream_requests_total", endpoint=kind, outcome="error")
+            raise
+        metrics.inc("app_upstream_requests_total", endpoint=kind, outcome="ok")
+        return _cache_api_payload(url, ttl, data)
+    finally:
+        _release_api_fetch(url, pending)
+        get_async_client().inflight.pop(url).set()
+
+async def _async_refresh_api_data(url, ttl, pending):
+    try:
+        await _async_store_api_data(url, ttl, pending)
+    except Exception as e:
+        _api_refresh_failed(url, e)
+
+TEAMS_URL = f"{ESPN_API_BASE}/teams"
+
 def load_teams():
     """Return a DataFrame of MLB teams with their city, name, id, abbreviation, and logo URL."""
-    url = "http://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams"
-    data = fetch_api_data(url)
+    return pd.DataFrame(parse_teams(fetch_api_data(TEAMS_URL)))
+
+@span("parse_teams")
+def parse_teams(data):
+    """Turn an ESPN teams payload into a list of team dicts (id, city, name, displayName, abbreviation, logo)."""
     teams = []
     for team_entry in data.get("sports", [])[0].get("leagues", [])[0].get("teams", []):
         team = team_entry.get("team", {})
@@ -104,32 +881,113 @@ def load_teams():
             "abbreviation": team.get("abbreviation"),
             "logo": logo_url  # Placeholder for logo
         })
-    return pd.DataFrame(teams)
-
-def load_scoreboard():
+    return teams
+
+# Per-game fields (the same on both of a game's rows) and per-team fields of the scoreboard frame
+SCOREBOARD_GAME_COLUMNS = [
+    "game_id", "status", "status_detail", "inning", "inning_half",
+    "balls", "strikes", "outs", "on_first", "on_second", "on_third", "event_time_utc",
+]
+SCOREBOARD_TEAM_COLUMNS = ["team_name", "team_abbr", "score", "home_away"]
+SCOREBOARD_COLUMNS = SCOREBOARD_GAME_COLUMNS + SCOREBOARD_TEAM_COLUMNS
+
+# ESPN's status shortDetail for live games: "Top 6th", "Bot 6th", "Mid 6th", "End 6th"
+INNING_HALF_RE = re.compile(r"(Top|Bot|Mid|End)", re.IGNORECASE)
+INNING_HALVES = {"top": "Top", "bot": "Bottom", "mid": "Middle", "end": "End"}
+# Status descriptions of games that have not started
+PREGAME_STATUSES = frozenset({"scheduled", "pre-game", "pre"})
+
+class TeamSide(Record):
+    """One team's side of a game."""
+    __slots__ = ("name", "abbr", "score")
+
+class GameRecord(Record):
+    """One game from index_games: the scoreboard's game-level columns plus both teams."""
+    __slots__ = tuple(SCOREBOARD_GAME_COLUMNS) + ("teams", "abbrs", "scores", "home", "away")
+
+def parse_inning_half(status_detail):
+    match = INNING_HALF_RE.match(status_detail or "")
+    return INNING_HALVES[match.group(1).lower()] if match else ""
+
+SCOREBOARD_URL = f"{ESPN_API_BASE}/scoreboard"
+NEWS_URL = f"{ESPN_API_BASE}/news"
+
+def load_scoreboard(refresh=False):
     """Return a DataFrame of games with teams, scores, status, and start time."""
-    url = "http://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard"
-    data = fetch_api_data(url)
+    return parse_scoreboard(fetch_api_data(SCOREBOARD_URL, refresh=refresh))
+
+@span("parse_scoreboard")
+def parse_scoreboard(data):
+    """Turn an ESPN scoreboard payload into a DataFrame with one row per team per game."""
     games = []
     for event in data.get("events", []):
         event_time_utc = event.get("date")
         for comp in event.get("competitions", []):
-            status = comp.get("status", {}).get("type", {}).get("description", "")
+            status_info = comp.get("status", {})
+            status_detail = status_info.get("type", {}).get("shortDetail", "")
+            # Live count and base runners; ESPN only sends "situation" for games in progress
+            situation = comp.get("situation") or {}
+            game = {
+                "game_id": comp.get("id"),
+                "status": status_info.get("type", {}).get("description", ""),
+                "status_detail": status_detail,
+                "inning": status_info.get("period", 0),
+                "inning_half": parse_inning_half(status_detail),
+                "balls": situation.get("balls", 0),
+                "strikes": situation.get("strikes", 0),
+                "outs": situation.get("outs", 0),
+                "on_first": bool(situation.get("onFirst")),
+                "on_second": bool(situation.get("onSecond")),
+                "on_third": bool(situation.get("onThird")),
+                "event_time_utc": event_time_utc,
+            }
             for team in comp.get("competitors", []):
                 games.append({
-                    "game_id": comp.get("id"),
-                    "status": status,
+                    **game,
                     "team_name": team['team']['displayName'],
                     "team_abbr": team['team']['abbreviation'],
                     "score": int(team['score']),
-                    "event_time_utc": event_time_utc,
+                    "home_away": team.get("homeAway"),
                 })
-    return pd.DataFrame(games)
+    return pd.DataFrame(games, columns=SCOREBOARD_COLUMNS)
+
+def index_games(games_df):
+    """
+    Group scoreboard rows into one GameRecord per game, keyed by game_id in scoreboard order.
+
+    Each record lists its teams, abbreviations and scores in competitor order and also
+    pairs them up as "home" and "away". Built in a single pass over the columns, so
+    consumers never filter the whole DataFrame once per game.
+    """
+    games = {}
+    if games_df.empty:
+        return games
+    columns = {col: games_df[col].tolist() for col in games_df.columns}
+    home_away = columns.get("home_away", [None] * len(games_df))
+    for i, game_id in enumerate(columns["game_id"]):
+        game = games.get(game_id)
+        if game is None:
+            game = games[game_id] = GameRecord(
+                teams=[], abbrs=[], scores=[], home=None, away=None,
+                **{col: columns[col][i] for col in SCOREBOARD_GAME_COLUMNS},
+            )
+        side = TeamSide(name=columns["team_name"][i], abbr=columns["team_abbr"][i], score=columns["score"][i])
+        game.teams.append(side.name)
+        game.abbrs.append(side.abbr)
+        game.scores.append(side.score)
+        if home_away[i] in ("home", "away"):
+            setattr(game, home_away[i], side)
+    return games
 
 def load_news():
     """Return a DataFrame of news headlines and links."""
-    url = "http://site.api.espn.com/apis/site/v2/sports/baseball/mlb/news"
-    data = fetch_api_data(url)
+    return parse_news(fetch_api_data(NEWS_URL))
+
+async def async_load_news():
+    """load_news, awaiting ESPN instead of blocking on it."""
+    return parse_news(await async_fetch_api_data(NEWS_URL))
+
+def parse_news(data):
     news_list = []
     for article in data.get("articles", []):
         news_list.append({
@@ -141,7 +999,7 @@ def load_news():
 
 def load_team_details(team_id):
     """Return a dictionary of details for a specific MLB team."""
-    url = f"http://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/{team_id}"
+    url = f"{ESPN_API_BASE}/teams/{team_id}"
     data = fetch_api_data(url)
     team = data.get("team", {})
     return {
@@ -154,15 +1012,320 @@ def load_team_details(team_id):
         "links": team.get("links", []),
     }
 
+# --- Section: Scoreboard changes ---
+# Fields compared between polls, with the name each change is reported under
+GAME_DIFF_FIELDS = (
+    ("scores", "score"),
+    ("status", "status"),
+    ("status_detail", "status"),
+    ("inning", "inning"),
+    ("inning_half", "inning"),
+    ("balls", "situation"),
+    ("strikes", "situation"),
+    ("outs", "situation"),
+    ("on_first", "situation"),
+    ("on_second", "situation"),
+    ("on_third", "situation"),
+    ("event_time_utc", "start_time"),
+)
+
+def diff_games(previous, current):
+    """
+    Compare two index_games results and return one change event per game that was
+    added, removed, or had its score, status, inning or start time change.
+    """
+    events = []
+    for game_id, game in current.items():
+        old = previous.get(game_id)
+        if old is None:
+            events.append(game_event("added", game, ["added"]))
+            continue
+        changes = []
+        for field, name in GAME_DIFF_FIELDS:
+            if old[field] != game[field] and name not in changes:
+                changes.append(name)
+        if changes:
+            events.append(game_event("changed", game, changes))
+    for game_id, game in previous.items():
+        if game_id not in current:
+            events.append(game_event("removed", game, ["removed"]))
+    return events
+
+def game_event(kind, game, changes):
+    """A compact, JSON-ready description of one game's change."""
+    return {
+        "type": kind,
+        "game_id": game["game_id"],
+        "changes": changes,
+        "abbrs": list(game["abbrs"]),
+        "scores": list(game["scores"]),
+        "status": game["status"],
+        "status_detail": game["status_detail"],
+        "inning": game["inning"],
+        "inning_half": game["inning_half"],
+        "balls": game["balls"],
+        "strikes": game["strikes"],
+        "outs": game["outs"],
+        "on_base": [game["on_first"], game["on_second"], game["on_third"]],
+    }
+
+class EventBus:
+    """Minimal publish/subscribe: subscribers are called with each published list of events."""
+
+    def __init__(self):
+        self._subscribers = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback):
+        with self._lock:
+            self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def publish(self, events):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(events)
+            except Exception as e:
+                print(f"Error in scoreboard event subscriber: {e}")
+                metrics.inc("app_background_errors_total", task="scoreboard_events")
+
+# Scoreboard change events (see diff_games), published by scoreboard_poller after each poll that changes games
+scoreboard_events = EventBus()
+
+# --- Section: Scoreboard poller ---
+SCOREBOARD_POLL_INTERVAL = 15  # seconds between scoreboard refreshes
+
+class ScoreboardPoller:
+    """
+    Keeps the parsed scoreboard (the DataFrame load_scoreboard builds) in memory and
+    refreshes it from a background thread every `interval` seconds.
+
+    Routes read the snapshot instead of calling ESPN, so their latency does not depend
+    on ESPN and upstream traffic is one scoreboard call per interval per process.
+    """
+
+    def __init__(self, interval=SCOREBOARD_POLL_INTERVAL):
+        self.interval = interval
+        self.updated_at = None
+        self.version = 0  # bumped whenever the snapshot's data changes
+        self._snapshot = None  # (games DataFrame, games indexed by game_id, get_games_list entries)
+        self._entries = {}  # game_id -> derived get_games_list entry
+        self._entries_registry_version = None
+        self._source = None  # the ESPN payload the snapshot was parsed from
+        self._ready = threading.Event()  # set once callers should stop waiting for a first poll
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+
+    def start(self):
+        """Start the polling thread (again, if this process was forked from the one that started it)."""
+        pid = os.getpid()
+        if self._thread is not None and self._pid == pid:
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == pid:
+                return
+            self._stop.clear()
+            self._pid = pid
+            self._thread = threading.Thread(target=self._run, name="scoreboard-poller", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def refresh(self):
+        """Fetch the scoreboard now and, if it changed, parse it into a new snapshot."""
+        data = fetch_api_data(SCOREBOARD_URL, refresh=True)
+        events = []
+        if data is not self._source:
+            games_df = parse_scoreboard(data)
+            games = index_games(games_df)
+            previous = self._snapshot[1] if self._snapshot else {}
+            events = diff_games(previous, games)
+            entries = self._update_entries(games, {event["game_id"] for event in events})
+            self._snapshot = (games_df, games, entries)
+            self._source = data
+            self.version += 1
+        self.updated_at = time.time()
+        if events:
+            scoreboard_events.publish(events)
+
+    def _update_entries(self, games, changed_ids):
+        """Derive get_games_list entries, recomputing only changed games (or all, if the teams changed)."""
+        try:
+            registry = get_team_registry()
+        except Exception as e:
+            print(f"Error loading teams for scoreboard: {e}")
+            registry = TeamRegistry([])
+        reuse = registry.version == self._entries_registry_version
+        entries = {}
+        for game_id, game in games.items():
+            entry = self._entries.get(game_id) if reuse and game_id not in changed_ids else None
+            entries[game_id] = entry if entry is not None else build_game_entry(game, registry)
+        self._entries = entries
+        self._entries_registry_version = registry.version
+        return list(entries.values())
+
+    def get_snapshot(self, timeout=API_TIMEOUT[1]):
+        """
+        Return the latest scoreboard DataFrame.
+
+        Only the calls made before the first poll in a process has finished wait for it,
+        for up to `timeout` seconds. If it failed or is still running, an empty scoreboard
+        is returned, and every later call returns immediately.
+        """
+        return self._get(timeout)[0]
+
+    def get_games(self, timeout=API_TIMEOUT[1]):
+        """Return the latest scoreboard grouped by game (see index_games)."""
+        return self._get(timeout)[1]
+
+    def get_games_list(self, timeout=API_TIMEOUT[1]):
+        """Return the latest get_games_list entries, derived incrementally at each poll."""
+        return self._get(timeout)[2]
+
+    def get_snapshot_parts(self):
+        """The current (DataFrame, games, entries) without waiting for a first poll."""
+        return self._snapshot or (pd.DataFrame(columns=SCOREBOARD_COLUMNS), {}, [])
+
+    def get_version(self, timeout=API_TIMEOUT[1]):
+        """The version of the snapshot get_snapshot/get_games would return right now."""
+        self._get(timeout)
+        return self.version
+
+    def _get(self, timeout):
+        self.start()
+        if self._snapshot is None and not self._ready.wait(timeout):
+            # Still no first poll (ESPN is hanging): don't make the next caller wait too
+            self._ready.set()
+        snapshot = self._snapshot
+        if snapshot is None:
+            return pd.DataFrame(columns=SCOREBOARD_COLUMNS), {}, []
+        return snapshot
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                # Keep serving the previous snapshot and try again next interval
+                print(f"Error refreshing scoreboard: {e}")
+                metrics.inc("app_background_errors_total", task="scoreboard")
+            # Failed or not, the first poll is over; later polls never block callers
+            self._ready.set()
+            self._stop.wait(self.interval)
+
+scoreboard_poller = ScoreboardPoller()
+
+def get_scoreboard_snapshot():
+    """Return the in-memory scoreboard DataFrame kept fresh by scoreboard_poller."""
+    return scoreboard_poller.get_snapshot()
+
+def get_scoreboard_games():
+    """Return the in-memory scoreboard grouped by game, kept fresh by scoreboard_poller."""
+    return scoreboard_poller.get_games()
+
+# --- Section: Team registry ---
+class TeamRegistry:
+    """
+    The teams from the ESPN teams endpoint, indexed once by abbreviation, ESPN id and
+    displayName so routes and templates can look a team up without scanning a DataFrame.
+    """
+
+    def __init__(self, teams, version=0, source=None):
+        self.teams = sorted(teams, key=lambda team: team["displayName"] or "")
+        self.by_abbr = {team["abbreviation"]: team for team in self.teams}
+        self.by_id = {team["id"]: team for team in self.teams}
+        self.by_display_name = {team["displayName"]: team for team in self.teams}
+        self.version = version
+        self.source = source
+
+    def get(self, abbr):
+        return self.by_abbr.get(abbr)
+
+    def short_name(self, abbr):
+        """Just the team "name" (not city) for an abbreviation, e.g. "Braves" for ATL."""
+        team = self.by_abbr.get(abbr)
+        return team["name"] if team else abbr
+
+    def logo(self, display_name):
+        team = self.by_display_name.get(display_name)
+        return team["logo"] if team else None
+
+_team_registry = None
+_team_registry_lock = threading.Lock()
+
+def get_team_registry():
+    """
+    Return the shared TeamRegistry, rebuilt (with a new version) only when the cached
+    teams payload from ESPN has been replaced.
+    """
+    return _team_registry_for(fetch_api_data(TEAMS_URL))
+
+async def async_get_team_registry():
+    """get_team_registry, awaiting ESPN instead of blocking on it."""
+    return _team_registry_for(await async_fetch_api_data(TEAMS_URL))
+
+def _team_registry_for(data):
+    global _team_registry
+    registry = _team_registry
+    if registry is not None and registry.source is data:
+        return registry
+    with _team_registry_lock:
+        if _team_registry is None or _team_registry.source is not data:
+            version = _team_registry.version + 1 if _team_registry else 1
+            _team_registry = TeamRegistry(parse_teams(data), version=version, source=data)
+        return _team_registry
+
+# --- Section: Navbar fragment ---
+_navbar_fragment = (None, None)  # (version key, rendered Markup)
+
+def get_navbar_html():
+    """
+    The navbar (teams and seasons menus) rendered once into an HTML fragment.
+
+    It is re-rendered only when its version key changes: the team registry version plus
+    the seasons that have CSV files. If the teams cannot be loaded, the last rendered
+    navbar is served.
+    """
+    global _navbar_fragment
+    key, html = _navbar_fragment
+    try:
+        registry = get_team_registry()
+    except Exception as e:
+        if html is not None:
+            return html
+        print(f"Error loading teams for navbar: {e}")
+        registry = TeamRegistry([])
+    seasons = season_store.years()
+    version = (registry.version, tuple(seasons))
+    if version != key:
+        with span("render_navbar"):
+            html = Markup(app.jinja_env.get_template("_navbar.html").render(teams=registry.teams, seasons=seasons))
+        _navbar_fragment = (version, html)
+    return html
+
+@app.context_processor
+def inject_navbar():
+    # Lazy so pages without a navbar (the team page) never build it
+    return {"navbar_html": get_navbar_html}
+
 # --- Section: MLB Team Name Definitions ---
 def get_mlb_team_names():
     """
     Returns a dictionary mapping 'City_TeamName' (e.g., 'Atlanta_Braves') to the official team display name.
     """
-    teams_df = load_teams()
     team_dict = {}
-    for _, team in teams_df.iterrows():
-        if pd.notnull(team["city"]) and pd.notnull(team["name"]):
+    for team in get_team_registry().teams:
+        if team["city"] and team["name"]:
             key = f"{team['city'].replace(' ', '')}_{team['name'].replace(' ', '')}"
             team_dict[key] = team["displayName"]
     return team_dict
@@ -170,33 +1333,29 @@ def get_mlb_team_names():
 # --- Section: Display all games' scores using live data ---
 def display_all_scores():
     """Fetch and display live scores for all MLB games."""
-    games_df = load_scoreboard()
-    if games_df.empty:
+    games = index_games(load_scoreboard())
+    if not games:
         print("No games found.")
         return
     print("All MLB Games' Scores:")
-    for game_id in games_df['game_id'].unique():
-        game = games_df[games_df['game_id'] == game_id]
-        matchup = " vs. ".join([f"{row['team_name']} ({row['score']})" for _, row in game.iterrows()])
-        status = game['status'].iloc[0]
-        print(f"{matchup} - {status}")
+    for game in games.values():
+        matchup = " vs. ".join(f"{name} ({score})" for name, score in zip(game["teams"], game["scores"]))
+        print(f"{matchup} - {game['status']}")
     print("-" * 40)
 
 # --- Section: Display scores for a specific team using live data ---
 def display_team_score(team_name):
     """Fetch and display live scores for games involving a specific team."""
-    games_df = load_scoreboard()
-    if games_df.empty:
+    games = index_games(load_scoreboard())
+    if not games:
         print("No games found.")
         return
     print(f"Scores for {team_name}:")
     found = False
-    for game_id in games_df['game_id'].unique():
-        game = games_df[games_df['game_id'] == game_id]
-        if team_name in game['team_name'].values:
-            matchup = " vs. ".join([f"{row['team_name']} ({row['score']})" for _, row in game.iterrows()])
-            status = game['status'].iloc[0]
-            print(f"{matchup} - {status}")
+    for game in games.values():
+        if team_name in game["teams"]:
+            matchup = " vs. ".join(f"{name} ({score})" for name, score in zip(game["teams"], game["scores"]))
+            print(f"{matchup} - {game['status']}")
             found = True
     if not found:
         print(f"No games found for {team_name}.")
@@ -237,27 +1396,99 @@ def display_latest_news(n=5):
     print("-" * 40)
 
 # --- Example Classes (unchanged) ---
+# Stat-name layouts shared by every PlayerStats with the same stats: names -> (names, {name: index})
+_stat_layouts = {(): ((), {})}
+
+def _stat_layout(names):
+    layout = _stat_layouts.get(names)
+    if layout is None:
+        layout = _stat_layouts.setdefault(names, (names, {name: i for i, name in enumerate(names)}))
+    return layout
+
 class PlayerStats:
+    """
+    One player's stats. Values are a plain list; the stat names are a layout shared by
+    all players that have the same stats, so a league of players stores them once.
+    """
+    __slots__ = ("name", "team", "_layout", "_values")
+
     def __init__(self, name, team):
         self.name = name
         self.team = team
-        self.stats = {}
+        self._layout = _stat_layouts[()]
+        self._values = []
+
+    @property
+    def stats(self):
+        """The stats as a live mapping: writes through it change the player."""
+        return PlayerStatsView(self)
+
+    @stats.setter
+    def stats(self, stats):
+        self._layout = _stat_layout(tuple(stats))
+        self._values = list(stats.values())
 
     def add_stat(self, stat_name, value):
-        self.stats[stat_name] = value
+        index = self._layout[1].get(stat_name)
+        if index is None:
+            self._layout = _stat_layout(self._layout[0] + (stat_name,))
+            self._values.append(value)
+        else:
+            self._values[index] = value
 
     def get_stat(self, stat_name):
-        return self.stats.get(stat_name, None)
+        index = self._layout[1].get(stat_name)
+        return None if index is None else self._values[index]
+
+    def remove_stat(self, stat_name):
+        index = self._layout[1][stat_name]
+        names = self._layout[0]
+        self._layout = _stat_layout(names[:index] + names[index + 1:])
+        del self._values[index]
 
     def display_stats(self):
         print(f"Stats for {self.name} ({self.team}):")
-        for stat_name, value in self.stats.items():
+        for stat_name, value in zip(self._layout[0], self._values):
             print(f"{stat_name}: {value}")
 
+class PlayerStatsView(MutableMapping):
+    """PlayerStats.stats: a dict-like view of one player's stats, in the order they were added."""
+    __slots__ = ("_player",)
+
+    def __init__(self, player):
+        self._player = player
+
+    def __getitem__(self, stat_name):
+        index = self._player._layout[1].get(stat_name)
+        if index is None:
+            raise KeyError(stat_name)
+        return self._player._values[index]
+
+    def __setitem__(self, stat_name, value):
+        self._player.add_stat(stat_name, value)
+
+    def __delitem__(self, stat_name):
+        self._player.remove_stat(stat_name)
+
+    def __iter__(self):
+        return iter(self._player._layout[0])
+
+    def __len__(self):
+        return len(self._player._values)
+
+    def __repr__(self):
+        return repr(dict(self))
+
 class TeamStats:
+    """
+    A team's players by name. The team holds the PlayerStats objects themselves, so a
+    player changed after add_player is changed in the team too.
+    """
+    __slots__ = ("team_name", "players")
+
     def __init__(self, team_name):
         self.team_name = team_name
-        self.players = {}
+        self.players = {}  # player name -> PlayerStats
 
     def add_player(self, player):
         self.players[player.name] = player
@@ -265,459 +1496,423 @@ class TeamStats:
     def get_player(self, player_name):
         return self.players.get(player_name, None)
 
+    def column(self, stat_name):
+        """One stat for every player, in the order they were added (None where missing)."""
+        return [player.get_stat(stat_name) for player in self.players.values()]
+
     def display_team_stats(self):
         print(f"Team Stats for {self.team_name}:")
         for player in self.players.values():
             player.display_stats()
 
+# --- Section: Page cache ---
+PAGE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+class PageCache:
+    """
+    LRU cache of rendered pages, bounded by the total size of the cached bodies.
+
+    Each entry remembers the versions of the data it was rendered from. A lookup whose
+    current versions differ evicts the entry instead of serving it.
+    """
+
+    def __init__(self, max_bytes=PAGE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()  # key -> (versions, body, mimetype)
+        self._lock = threading.Lock()
+
+    def get(self, key, versions):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != versions:
+                self._evict(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, versions, body, mimetype):
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._evict(key)
+            self._entries[key] = (versions, body, mimetype)
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                self._evict(next(iter(self._entries)))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _evict(self, key):
+        _, body, _ = self._entries.pop(key)
+        self.size -= len(body)
+
+page_cache = PageCache()
+
+def navbar_versions():
+    try:
+        return get_team_registry().version, tuple(season_store.years())
+    except Exception:
+        return _fallback_navbar_versions()
+
+async def async_navbar_versions():
+    try:
+        return (await async_get_team_registry()).version, tuple(season_store.years())
+    except Exception:
+        return _fallback_navbar_versions()
+
+def _fallback_navbar_versions():
+    # get_navbar_html falls back to the last rendered navbar, or to one without teams
+    # (registry versions start at 1), so the page is keyed by whichever is served
+    key = _navbar_fragment[0]
+    return key if key is not None else (0, tuple(season_store.years()))
+
+def team_page_versions():
+    roster_url = TEAM_ROSTER_API.get(request.args.get("team"))
+    registry, roster_version = run_concurrently(
+        get_team_registry,
+        lambda: get_api_data_version(roster_url) if roster_url else None,
+    )
+    return scoreboard_poller.get_version(), registry.version, roster_version
+
+def cached_page(get_versions):
+    """
+    Serve a route from page_cache, keyed by path and query arguments.
+
+    `get_versions` returns the versions of the data the page is built from (for example
+    the scoreboard snapshot or a roster payload). It is evaluated before the view runs,
+    so a page is never stored under versions newer than its content. Only 200 responses
+    are cached; a hit skips all data shaping and rendering.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = page_cache_key()
+            versions = get_versions()
+            response = cached_response(key, versions)
+            if response is None:
+                response = cache_response(key, versions, view(*args, **kwargs))
+            return response
+        return wrapper
+    return decorator
+
+def page_cache_key():
+    """The current request's page_cache key: its path and query arguments."""
+    return request.path, tuple(sorted(request.args.items(multi=True)))
+
+def cached_response(key, versions):
+    """The page cached under `key` for `versions` as a response, or None."""
+    entry = page_cache.get(key, versions)
+    metrics.inc("app_cache_lookups_total", cache="page", result="miss" if entry is None else "hit")
+    if entry is None:
+        return None
+    return app.response_class(entry[1], mimetype=entry[2])
+
+def cache_response(key, versions, rv):
+    """Make a response of view return value `rv`, storing it under `key` if it is a 200."""
+    response = app.make_response(rv)
+    if response.status_code == 200 and not response.direct_passthrough:
+        page_cache.put(key, versions, response.get_data(), response.mimetype)
+    return response
+
 # Homepage with dropdown to select favorite team
 @app.route("/", methods=["GET"])
+@cached_page(lambda: (scoreboard_poller.get_version(), navbar_versions()))
 def home():
-    teams_df = load_teams()
-    teams = teams_df.sort_values("displayName")[["displayName", "abbreviation", "logo"]].to_dict(orient="records")
-    return render_template_string("""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Earley First Pitch</title>
-        <!-- Reference the minimalist, modern CSS -->
-        <link rel="stylesheet" href="{{ url_for('static', filename='styles.css') }}">
-    </head>
-    <body>
-    <header class="navbar">
-        <div class="navbar-container">
-            <a href="/" class="navbar-item">Home</a>
-            <div class="navbar-item dropdown">
-                <span>Teams</span>
-                <div class="scrollable-menu">
-                    {% for team in teams %}
-                        <a href="/team?team={{ team.abbreviation }}" class="team-item">
-                            {{ team.displayName }}
-                        </a>
-                    {% endfor %}
-                </div>
-            </div>
-            <a href="/news" class="navbar-item">News</a>
-            <!-- Seasons dropdown moved here -->
-            <div class="navbar-item dropdown season-dropdown">
-                <span>Seasons</span>
-                <div class="scrollable-menu">
-                    {% for year in range(2024, 2014, -1) %}
-                        <a href="/season/{{ year }}" class="team-item">
-                            {{ year }}
-                        </a>
-                    {% endfor %}
-                </div>
-            </div>
-            <a href="/about" class="navbar-item">About Us</a>
-        </div>
-    </header>
-    <div class="container">
-            <h1>Earley First Pitch</h1>
-            <h2>Today's Games</h2>
-            <div class="games-table-container">
-                <table class="games-table">
-                    <thead>
-                        <tr>
-                            <th>Matchup</th>
-                            <th>Score</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {% for game in games %}
-                            <tr>
-                                <td class="matchup-cell">
-                                    {% for t in game.teams %}
-                                        {% set logo = None %}
-                                        {% for team in teams %}
-                                            {% if team['displayName'] == t %}
-                                                {% set logo = team['logo'] %}
-                                            {% endif %}
-                                        {% endfor %}
-                                        {% if logo %}
-                                            <img src="{{logo}}" alt="{{t}} logo" class="team-logo">
-                                        {% endif %}
-                                        <span>{{t}}</span>
-                                        {% if not loop.last %}
-                                            <span class="vs-text">vs.</span>
-                                        {% endif %}
-                                    {% endfor %}
-                                </td>
-                                <td style="min-width:180px; text-align:center;">
-                                    {% if game.start_time_str %}
-                                        <span class="game-start-time">{{ game.start_time_str }}</span>
-                                    {% else %}
-                                        {{ game.scores[0] }} - {{ game.scores[1] }}
-                                        {% if game.winner %}
-                                            <span class="winner-rect">
-                                                {{ game.winner }} Win
-                                            </span>
-                                        {% elif game.leader %}
-                                            <span class="leader-rect">
-                                                {{ game.leader }}
-                                            </span>
-                                        {% endif %}
-                                    {% endif %}
-                                </td>
-                            </tr>
-                        {% endfor %}
-                    </tbody>
-                </table>
-            </div>
-        </div>
-    </body>
-    </html>
-    """, teams=teams, news=get_news_list(), games=get_games_list())
+    return render_home_page()
+
+def render_home_page():
+    # Read before the games, so the page's stream position is never ahead of its content
+    stream_since = score_stream.seq
+    return render_template("home.html", games=get_games_list(), stream_since=stream_since)
 
 # Team page with logo and today's games for that team
 @app.route("/team", methods=["GET"])
+@cached_page(team_page_versions)
 def team_page():
     abbr = request.args.get("team")
-    teams_df = load_teams()
-    team = teams_df[teams_df["abbreviation"] == abbr].iloc[0]
-    games_df = load_scoreboard()
-    team_games = []
-    for game_id in games_df['game_id'].unique():
-        game = games_df[games_df['game_id'] == game_id]
-        if abbr in game['team_abbr'].values:
-            teams = [row['team_name'] for _, row in game.iterrows()]
-            scores = [row['score'] for _, row in game.iterrows()]
-            abbrs = [row['team_abbr'] for _, row in game.iterrows()]
-            matchup = " vs. ".join([f"{row['team_name']} ({row['score']})" for _, row in game.iterrows()])
-            status = game['status'].iloc[0]
-            event_time_utc = game['event_time_utc'].iloc[0]
-            # Determine score display
-            score_display = ""
-            start_time_str = None
-            if status.lower() in ["scheduled", "pre-game", "pre"]:
-                tz = pytz.timezone(get_team_timezone(abbrs[0]))
-                try:
-                    dt_utc = datetime.strptime(event_time_utc, "%Y-%m-%dT%H:%MZ")
-                except ValueError:
-                    dt_utc = datetime.strptime(event_time_utc, "%Y-%m-%dT%H:%M:%SZ")
-                dt_local = dt_utc.replace(tzinfo=pytz.utc).astimezone(tz)
-                hour = dt_local.strftime("%I").lstrip('0')
-                minute = dt_local.strftime("%M")
-                ampm = dt_local.strftime("%p")
-                tzname = dt_local.strftime("%Z")
-                start_time_str = f"Starts @ {hour}:{minute} {ampm} {tzname}"
-                score_display = start_time_str
-            elif status.lower() == "final" and len(teams) == 2 and len(scores) == 2:
-                if scores[0] > scores[1]:
-                    score_display = f"{scores[0]} - {scores[1]} ({teams[0]} Win)"
-                elif scores[1] > scores[0]:
-                    score_display = f"{scores[0]} - {scores[1]} ({teams[1]} Win)"
-                else:
-                    score_display = f"{scores[0]} - {scores[1]} (Currently Tied)"
-            elif len(teams) == 2 and len(scores) == 2:
-                if scores[0] > scores[1]:
-                    score_display = f"{scores[0]} - {scores[1]} ({teams[0]} Leading)"
-                elif scores[1] > scores[0]:
-                    score_display = f"{scores[0]} - {scores[1]} ({teams[1]} Leading)"
-                else:
-                    score_display = f"{scores[0]} - {scores[1]} (Currently Tied)"
-            else:
-                score_display = "N/A"
-            team_games.append({"matchup": " vs. ".join(teams), "score": score_display})
+    stream_since = score_stream.seq
+    registry, roster = run_concurrently(get_team_registry, lambda: roster_store.get(abbr))
+    return render_team_page(abbr, registry, roster, stream_since)
+
+def render_team_page(abbr, registry, roster, stream_since):
+    team = registry.get(abbr)
+    if team is None:
+        return f"No team found for {abbr}", 404
+    team_games = get_team_games(abbr)
+    position_players, pitchers = roster or ([], [])
+
+    return render_template("team.html", team=team, team_games=team_games, stream_since=stream_since,
+                           position_players=position_players, pitchers=pitchers)
+
+@span("shape_team_games")
+def get_team_games(abbr, games=None):
+    """Today's games involving a team, as matchup and score-display strings for the team page."""
+    if games is None:
+        games = get_scoreboard_games()
+    return [
+        {"game_id": game["game_id"], "matchup": " vs. ".join(game["teams"]), "score": team_score_display(game)}
+        for game in games.values()
+        if abbr in game["abbrs"]
+    ]
 
-    # --- Roster Section ---
-    roster_url = TEAM_ROSTER_API.get(abbr)
-    roster_data = fetch_api_data(roster_url) if roster_url else {}
-    players = roster_data.get("athletes", []) if roster_data else []
+def team_score_display(game):
+    """The team page's one-line score for an index_games record."""
+    teams = game["teams"]
+    scores = game["scores"]
+    abbrs = game["abbrs"]
+    status = game["status"]
+    event_time_utc = game["event_time_utc"]
+    # Determine score display
+    score_display = ""
+    if status.lower() in PREGAME_STATUSES:
+        score_display = format_start_time(event_time_utc, get_team_timezone(abbrs[0]))
+    elif status.lower() == "final" and len(teams) == 2 and len(scores) == 2:
+        if scores[0] > scores[1]:
+            score_display = f"{scores[0]} - {scores[1]} ({teams[0]} Win)"
+        elif scores[1] > scores[0]:
+            score_display = f"{scores[0]} - {scores[1]} ({teams[1]} Win)"
+        else:
+            score_display = f"{scores[0]} - {scores[1]} (Currently Tied)"
+    elif len(teams) == 2 and len(scores) == 2:
+        if scores[0] > scores[1]:
+            score_display = f"{scores[0]} - {scores[1]} ({teams[0]} Leading)"
+        elif scores[1] > scores[0]:
+            score_display = f"{scores[0]} - {scores[1]} ({teams[1]} Leading)"
+        else:
+            score_display = f"{scores[0]} - {scores[1]} (Currently Tied)"
+    else:
+        score_display = "N/A"
+    return score_display
+
+# Roster display order: infielders, outfielders, DH, utility, then pitchers (SP before RP)
+POSITION_ORDER = {
+    "C": 0, "1B": 1, "2B": 2, "3B": 3, "SS": 4,  # Infielders
+    "LF": 5, "CF": 6, "RF": 7, "OF": 8,          # Outfielders
+    "DH": 9,                                     # Designated Hitter
+    "UT": 10,                                    # Utility
+    "SP": 11, "RP": 12, "P": 13                  # Pitchers (if any in position_players)
+}
 
-    # Organize players
+def roster_sort_key(player):
+    """Position, then jersey number (players without one last), then last name."""
+    try:
+        number = int(player["number"])
+    except (TypeError, ValueError):
+        number = 999
+    name = player["name"]
+    return POSITION_ORDER.get(player["pos"], 99), number, name.split()[-1] if name else ""
+
+class RosterEntry(Record):
+    """One player on a team page roster."""
+    __slots__ = ("name", "number", "pos", "display_pos", "headshot")
+
+@span("build_roster")
+def build_roster(roster_data):
+    """Split an ESPN roster payload into (position players, pitchers), each in display order."""
     position_players = []
-    pitchers_sp = []
-    pitchers_rp = []
-
-    # Helper to extract last name for sorting
-    def get_last_name(full_name):
-        return full_name.split()[-1] if full_name else ""
-
-    # Infield and outfield position abbreviations
-    infield_positions = {"1B", "2B", "3B", "SS", "C"}
-    outfield_positions = {"LF", "CF", "RF", "OF"}
-
+    pitchers = []
+    players = roster_data.get("athletes", []) if roster_data else []
     for group in players:
         if not isinstance(group, dict):
             continue
         for player in group.get("items", []):
             pos = player.get("position", {}).get("abbreviation", "")
-            # Always use the abbreviation for display
-            display_pos = pos
-            player_info = {
-                "name": player.get("fullName"),
-                "number": player.get("jersey"),
-                "pos": pos,
-                "display_pos": display_pos,
-                "headshot": player.get("headshot", {}).get("href") if player.get("headshot") else None,
-            }
-            # Pitchers
-            if pos == "SP":
-                pitchers_sp.append(player_info)
-            elif pos == "RP":
-                pitchers_rp.append(player_info)
-            # Position Players
-            elif pos in infield_positions or pos in outfield_positions or pos not in ["SP", "RP", "P"]:
+            player_info = RosterEntry(
+                name=player.get("fullName"),
+                number=player.get("jersey"),
+                pos=pos,
+                # Always use the abbreviation for display
+                display_pos=pos,
+                headshot=player.get("headshot", {}).get("href") if player.get("headshot") else None,
+            )
+            if pos in ("SP", "RP"):
+                pitchers.append(player_info)
+            elif pos != "P":
                 position_players.append(player_info)
+    position_players.sort(key=roster_sort_key)
+    pitchers.sort(key=roster_sort_key)
+    return position_players, pitchers
 
-    # Sort pitchers: SPs then RPs, each A-Z by last name
-    pitchers_sp = sorted(pitchers_sp, key=lambda x: get_last_name(x["name"]))
-    pitchers_rp = sorted(pitchers_rp, key=lambda x: get_last_name(x["name"]))
-    pitchers = pitchers_sp + pitchers_rp
-
-    # Sort position players: infielders A-Z by last name, then outfielders A-Z by last name, then others
-    infielders = [p for p in position_players if p["pos"] in infield_positions]
-    outfielders = [p for p in position_players if p["pos"] in outfield_positions]
-    others = [p for p in position_players if p["pos"] not in infield_positions and p["pos"] not in outfield_positions]
-    infielders = sorted(infielders, key=lambda x: get_last_name(x["name"]))
-    outfielders = sorted(outfielders, key=lambda x: get_last_name(x["name"]))
-    others = sorted(others, key=lambda x: get_last_name(x["name"]))
-    position_players = infielders + outfielders + others
-
-    # Helper to extract a sortable jersey number (handles None and non-integer gracefully)
-    def get_number(num):
-        try:
-            return int(num)
-        except (TypeError, ValueError):
-            return 999  # Put players without a number at the end
-
-    # Define position order for sorting (infielders, outfielders, then others)
-    position_order = {
-        "C": 0, "1B": 1, "2B": 2, "3B": 3, "SS": 4,  # Infielders
-        "LF": 5, "CF": 6, "RF": 7, "OF": 8,          # Outfielders
-        "DH": 9,                                     # Designated Hitter
-        "UT": 10,                                    # Utility
-        "SP": 11, "RP": 12, "P": 13                  # Pitchers (if any in position_players)
-    }
+# --- Section: Roster cache ---
+ROSTER_REFRESH_INTERVAL = 6 * 60 * 60  # seconds between background refreshes of all rosters
 
-    # Sort position players by position, then by jersey number
-    position_players = sorted(
-        position_players,
-        key=lambda x: (position_order.get(x["pos"], 99), get_number(x["number"]))
-    )
+class RosterStore:
+    """
+    Rosters for all 30 teams, already split and sorted by build_roster and kept in memory.
 
-    # Sort pitchers by position (SP first, then RP), then by jersey number
-    pitchers = sorted(
-        pitchers_sp + pitchers_rp,
-        key=lambda x: (position_order.get(x["pos"], 99), get_number(x["number"]))
-    )
+    A roster is rebuilt only when its cached ESPN payload changes. The first lookup in a
+    process starts a background thread that fetches every team's roster and refreshes
+    them all every ROSTER_REFRESH_INTERVAL seconds, so team pages just read a ready list.
+    """
 
-    return render_template_string("""
-    <!DOCTYPE html>
-<html>
-<head>
-    <title>{{team.displayName}} - MLB Team Info</title>
-    <link rel="stylesheet" href="{{ url_for('static', filename='styles.css') }}">
-</head>
-<body>
-    <div class="container">
-        <a href="/" class="back-home-btn back-home-btn-top">Back to Home</a>
-        <div class="team-header-row">
-    {% if team.logo %}
-        <img src="{{team.logo}}" alt="{{team.displayName}} logo" class="team-header-logo">
-    {% endif %}
-    <h1 class="team-header-name team-color-{{team.abbreviation}}">
-        {{team.displayName}}
-    </h1>
-</div>
-            <h2>Today's Games</h2>
-            <div class="games-table-container">
-                <table class="games-table">
-                    <thead>
-                        <tr>
-                            <th>Matchup</th>
-                            <th>Score</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                    {% for game in team_games %}
-                        <tr>
-                            <td>{{game.matchup}}</td>
-                            <td>
-                                {{game.score}}
-                            </td>
-                        </tr>
-                    {% endfor %}
-                    </tbody>
-                </table>
-            </div>
-            <h2>Roster</h2>
-
-<h3 style="margin-top:32px; margin-bottom:10px;">Position Players</h3>
-<table class="games-table" style="margin-bottom: 36px;">
-    <thead>
-        <tr>
-            <th>#</th>
-            <th></th>
-            <th>Name</th>
-            <th>Position</th>
-        </tr>
-    </thead>
-    <tbody>
-    {% for player in position_players %}
-        <tr>
-            <td>{{ player.number }}</td>
-            <td>
-                {% if player.headshot %}
-                    <img src="{{ player.headshot }}" alt="{{ player.name }} headshot" style="width:48px; height:48px; object-fit:cover; vertical-align:middle;">
-                {% endif %}
-            </td>
-            <td>{{ player.name }}</td>
-            <td>{{ player.display_pos }}</td>
-        </tr>
-    {% endfor %}
-    </tbody>
-</table>
-
-<h3 style="margin-top:32px; margin-bottom:10px;">Pitchers</h3>
-<table class="games-table">
-    <thead>
-        <tr>
-            <th>#</th>
-            <th></th>
-            <th>Name</th>
-            <th>Position</th>
-        </tr>
-    </thead>
-    <tbody>
-    {% for player in pitchers %}
-        <tr>
-            <td>{{ player.number }}</td>
-            <td>
-                {% if player.headshot %}
-                    <img src="{{ player.headshot }}" alt="{{ player.name }} headshot" style="width:48px; height:48px; object-fit:cover; vertical-align:middle;">
-                {% endif %}
-            </td>
-            <td>{{ player.name }}</td>
-            <td>{{ player.display_pos }}</td>
-        </tr>
-    {% endfor %}
-    </tbody>
-</table>
-            <a href="/" class="back-home-btn">Back to Home</a>
-        </div>
-    </body>
-    </html>
-    """, team=team, team_games=team_games,
-         position_players=position_players, pitchers=pitchers)
+    def __init__(self, refresh_interval=ROSTER_REFRESH_INTERVAL):
+        self.refresh_interval = refresh_interval
+        self._rosters = {}  # abbr -> (source payload, (position players, pitchers))
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def get(self, abbr, refresh=False):
+        """(position players, pitchers) for a team, or None for an unknown abbreviation."""
+        self.start_prewarm()
+        return self.load(abbr, refresh)
+
+    async def aget(self, abbr, refresh=False):
+        """get, awaiting ESPN instead of blocking on it."""
+        self.start_prewarm()
+        return await self.aload(abbr, refresh)
+
+    def load(self, abbr, refresh=False):
+        """Like get, but without starting the background thread (for warming before a fork)."""
+        roster_url = TEAM_ROSTER_API.get(abbr)
+        if roster_url is None:
+            return None
+        return self._roster(abbr, fetch_api_data(roster_url, refresh=refresh))
+
+    async def aload(self, abbr, refresh=False):
+        """load, awaiting ESPN instead of blocking on it."""
+        roster_url = TEAM_ROSTER_API.get(abbr)
+        if roster_url is None:
+            return None
+        return self._roster(abbr, await async_fetch_api_data(roster_url, refresh=refresh))
+
+    def _roster(self, abbr, data):
+        """The built roster for a team's payload, rebuilt only if the payload changed."""
+        cached = self._rosters.get(abbr)
+        if cached is not None and cached[0] is data:
+            metrics.inc("app_cache_lookups_total", cache="roster", result="hit")
+            return cached[1]
+        metrics.inc("app_cache_lookups_total", cache="roster", result="miss")
+        roster = build_roster(data)
+        self._rosters[abbr] = (data, roster)
+        return roster
+
+    def start_prewarm(self):
+        """Start the background prewarm/refresh thread once per process."""
+        pid = os.getpid()
+        if self._thread is not None and self._pid == pid:
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == pid:
+                return
+            self._pid = pid
+            self._thread = threading.Thread(target=self._run, name="roster-prewarm", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        refresh = False
+        while True:
+            for abbr in TEAM_ROSTER_API:
+                try:
+                    self.load(abbr, refresh=refresh)
+                except Exception as e:
+                    print(f"Error loading roster for {abbr}: {e}")
+                    metrics.inc("app_background_errors_total", task="roster")
+            refresh = True
+            time.sleep(self.refresh_interval)
+
+roster_store = RosterStore()
 
 def get_news_list():
-    news_df = load_news()
+    return news_headlines(load_news())
+
+async def async_get_news_list():
+    return news_headlines(await async_load_news())
+
+@span("shape_news")
+def news_headlines(news_df):
     return news_df.head(5).to_dict(orient="records")
 
-def get_games_list():
-    games_df = load_scoreboard()
-    teams_df = load_teams()
-    games = []
-    for game_id in games_df['game_id'].unique():
-        game = games_df[games_df['game_id'] == game_id]
-        teams = []
-        scores = []
-        abbrs = []
-        inning_status = ""
-        inning_number = ""
-        balls = 0
-        strikes = 0
-        outs = 0
-        on_base = False
-        for _, row in game.iterrows():
-            teams.append(row['team_name'])
-            scores.append(row['score'])
-            abbrs.append(row['team_abbr'])
-            # Extract ball, strike, outs, and on-base data if available
-            balls = row.get('balls', balls)
-            strikes = row.get('strikes', strikes)
-            outs = row.get('outs', outs)
-            on_base = row.get('on_base', on_base)
-        matchup = " vs. ".join(teams)
-        score_str = " - ".join(str(s) for s in scores)
-        status = game['status'].iloc[0]
-        event_time_utc = game['event_time_utc'].iloc[0]
-        winner = None
-        winner_score = None
-        leader = None
-        start_time_str = None
-
-        # Try to extract inning info from status (ESPN API may use "Top Xth", "Bottom Xth", etc.)
-        import re
-        match = re.search(r'(Top|Bottom)\s+(\d+)', status)
-        if match:
-            inning_status = match.group(1)  # "Top" or "Bottom"
-            inning_number = match.group(2)  # inning number as string
-
-        # Helper to get just the team "name" (not city) from abbreviation
-        def get_short_name(abbr):
-            row = teams_df[teams_df["abbreviation"] == abbr]
-            if not row.empty:
-                return row.iloc[0]["name"]
-            return abbr
-
-        # Determine winner if game is Final
-        if status.lower() == "final" and len(teams) == 2 and len(scores) == 2:
-            if scores[0] > scores[1]:
-                winner = f"{get_short_name(abbrs[0])}"
-                winner_score = scores[0]
-            elif scores[1] > scores[0]:
-                winner = f"{get_short_name(abbrs[1])}"
-                winner_score = scores[1]
-        # If not final, indicate leader or tie (capitalize first letter)
-        elif len(teams) == 2 and len(scores) == 2:
-            if status.lower() in ["scheduled", "pre-game", "pre"]:
-                leader = None  # Do not display "Currently Tied" if game has not started
-            elif scores[0] > scores[1]:
-                leader = f"{get_short_name(abbrs[0])} Leading"
-            elif scores[1] > scores[0]:
-                leader = f"{get_short_name(abbrs[1])} Leading"
-            else:
-                leader = "Currently Tied"
+@span("shape_games")
+def get_games_list(games=None, registry=None):
+    """
+    Today's games with their display fields (winner, leader, start time, ...).
 
-            # If in progress and we have inning info, append arrow and inning number
-            if leader and inning_status and inning_number and leader != "Currently Tied":
-                arrow = "↑" if inning_status.lower() == "top" else "↓"
-                leader += f" {arrow}{inning_number}"
+    Without arguments this returns the entries scoreboard_poller keeps up to date
+    incrementally; pass `games` (an index_games result) to derive them from scratch.
+    """
+    if games is None and registry is None:
+        return scoreboard_poller.get_games_list()
+    if games is None:
+        games = get_scoreboard_games()
+    if registry is None:
+        registry = get_team_registry()
+    return [build_game_entry(game, registry) for game in games.values()]
 
-        # If game has not started, show start time in local time zone of first team
-        if status.lower() in ["scheduled", "pre-game", "pre"]:
-            tz = pytz.timezone(get_team_timezone(abbrs[0]))
-            try:
-                dt_utc = datetime.strptime(event_time_utc, "%Y-%m-%dT%H:%MZ")
-            except ValueError:
-                dt_utc = datetime.strptime(event_time_utc, "%Y-%m-%dT%H:%M:%SZ")
-            dt_local = dt_utc.replace(tzinfo=pytz.utc).astimezone(tz)
-            hour = dt_local.strftime("%I").lstrip('0')
-            minute = dt_local.strftime("%M")
-            ampm = dt_local.strftime("%p")
-            tzname = dt_local.strftime("%Z")
-            start_time_str = f"Starts @ {hour}:{minute} {ampm} {tzname}"
-        games.append({
-            "teams": teams,
-            "scores": scores,
-            "matchup": matchup,
-            "score_str": score_str,
-            "status": status,
-            "winner": winner,
-            "winner_score": winner_score,
-            "leader": leader,
-            "start_time_str": start_time_str,
-            "balls": balls,  # Added balls tracker
-            "strikes": strikes,  # Added strikes tracker
-            "outs": outs,  # Added outs tracker
-            "on_base": on_base  # Added on-base tracker
-        })
-    return games
+INNING_ARROWS = {"Top": "↑", "Bottom": "↓"}
+
+def build_game_entry(game, registry):
+    """
+    Derive the display fields for one index_games record.
+
+    Inning and situation were already pulled out by parse_scoreboard and start times
+    are memoized, so this is a handful of lookups per game.
+    """
+    teams = game["teams"]
+    scores = game["scores"]
+    winner, winner_score, leader = game_result(game, registry)
+    start_time_str = None
+    # If game has not started, show start time in local time zone of first team
+    if game["status"].lower() in PREGAME_STATUSES:
+        start_time_str = format_start_time(game["event_time_utc"], get_team_timezone(game["abbrs"][0]))
+    return {
+        "game_id": game["game_id"],
+        "teams": teams,
+        "logos": [registry.logo(t) for t in teams],
+        "scores": scores,
+        "matchup": " vs. ".join(teams),
+        "score_str": " - ".join(str(s) for s in scores),
+        "status": game["status"],
+        "winner": winner,
+        "winner_score": winner_score,
+        "leader": leader,
+        "start_time_str": start_time_str,
+        "inning": game["inning"],
+        "inning_half": game["inning_half"],
+        "balls": game["balls"],
+        "strikes": game["strikes"],
+        "outs": game["outs"],
+        "on_base": [game["on_first"], game["on_second"], game["on_third"]],
+    }
+
+def game_result(game, registry):
+    """(winner, winner_score, leader) for a game; the leader carries an ↑/↓ inning marker while live."""
+    scores = game["scores"]
+    abbrs = game["abbrs"]
+    status = game["status"].lower()
+    if len(scores) != 2:
+        return None, None, None
+    # Determine winner if game is Final
+    if status == "final":
+        if scores[0] > scores[1]:
+            return registry.short_name(abbrs[0]), scores[0], None
+        if scores[1] > scores[0]:
+            return registry.short_name(abbrs[1]), scores[1], None
+        return None, None, None
+    # Do not display "Currently Tied" if game has not started
+    if status in PREGAME_STATUSES:
+        return None, None, None
+    if scores[0] == scores[1]:
+        return None, None, "Currently Tied"
+    leader = f"{registry.short_name(abbrs[0] if scores[0] > scores[1] else abbrs[1])} Leading"
+    arrow = INNING_ARROWS.get(game["inning_half"])
+    if arrow and game["inning"]:
+        leader += f" {arrow}{game['inning']}"
+    return None, None, leader
 
 # Convert published date string to a more readable format
 def format_published_date(date_str):
     if not date_str:
         return ""
     try:
-        # Parse the date string into a datetime object
-        utc_time = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ")
-        # Convert UTC time to local time
-        local_time = utc_time.replace(tzinfo=pytz.utc).astimezone(pytz.timezone('America/New_York'))
-        # Format the local time as a string
-        return local_time.strftime("%B %d, %Y %I:%M %p")
+        return format_local_timestamp(date_str, PUBLISHED_DATE_ZONE, "%B %d, %Y %I:%M %p")
     except Exception as e:
         print(f"Error parsing date: {e}")
         return date_str
@@ -728,288 +1923,219 @@ def format_date_filter(date_str):
     return format_published_date(date_str)
 
 @app.route("/teams", methods=["GET"])
+@cached_page(navbar_versions)
 def teams_page():
-    teams = load_teams()
-    return render_template_string("""
-    <!DOCTYPE html>
-<html>
-<head>
-    <title>Teams - Earley First Pitch</title>
-    <link rel="stylesheet" href="{{ url_for('static', filename='styles.css') }}">
-</head>
-<body>
-    <header class="navbar">
-        <div class="navbar-container">
-            <a href="/" class="navbar-item">Home</a>
-            <a href="/teams" class="navbar-item">Teams</a>
-            <a href="/news" class="navbar-item">News</a>
-            <a href="/about" class="navbar-item">About Us</a>
-        </div>
-    </header>
-    <div class="container">
-        <h1>Teams</h1>
-        <ul class="teams-list">
-        {% for team in teams %}
-            <li><a href="/team?team={{ team.abbreviation }}">{{ team.displayName }}</a></li>
-        {% endfor %}
-        </ul>
-    </div>
-</body>
-</html>
-    """, teams=teams)
+    return render_teams_page(get_team_registry())
+
+def render_teams_page(registry):
+    return render_template("teams.html", teams=registry.teams)
 
 @app.route("/news", methods=["GET"])
+@cached_page(lambda: (get_api_data_version(NEWS_URL), navbar_versions()))
 def news_page():
-    news = get_news_list()
-    return render_template_string("""
-    <!DOCTYPE html>
-<html>
-<head>
-    <title>News - Earley First Pitch</title>
-    <link rel="stylesheet" href="{{ url_for('static', filename='styles.css') }}">
-    <style>
-        .news-container {
-            background: #232526;
-            border-radius: 18px;
-            box-shadow: 0 4px 24px 0 rgba(0,0,0,0.25);
-            padding: 36px 40px 40px 40px;
-            margin: 40px auto;
-            max-width: 800px;
-            min-width: 340px;
-            width: fit-content;
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-        }
-        .news-list {
-            list-style: none;
-            padding: 0;
-            margin: 0;
-            width: 100%;
-        }
-        .news-list li {
-            background: #2d2f31;
-            margin-bottom: 18px;
-            padding: 18px 22px;
-            border-radius: 8px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.08);
-            transition: background 0.2s;
-            font-size: 1.08rem;
-        }
-        .news-list li:last-child {
-            margin-bottom: 0;
-        }
-        .news-list a {
-            color: #ffd54f;
-            text-decoration: none;
-            font-weight: 600;
-            transition: color 0.2s;
-        }
-        .news-list a:hover {
-            color: #fff176;
-            text-decoration: underline;
-        }
-        .news-date {
-            display: block;
-            color: #bdbdbd;
-            font-size: 0.98rem;
-            margin-top: 6px;
-            font-weight: 400;
-        }
-        h1 {
-            color: #ffd54f;
-            margin-bottom: 28px;
-            font-size: 2.1rem;
-            font-weight: 700;
-            letter-spacing: 1px;
-        }
-        @media (max-width: 900px) {
-            .news-container {
-                padding: 18px 6vw 24px 6vw;
-                min-width: unset;
-                max-width: 98vw;
-            }
-        }
-    </style>
-</head>
-<body>
-    <header class="navbar">
-        <div class="navbar-container">
-            <a href="/" class="navbar-item">Home</a>
-            <div class="navbar-item dropdown">
-                <span>Teams</span>
-                <div class="scrollable-menu">
-                    {% for team in teams %}
-                        <a href="/team?team={{ team.abbreviation }}" class="team-item">
-                            {{ team.displayName }}
-                        </a>
-                    {% endfor %}
-                </div>
-            </div>
-            <a href="/news" class="navbar-item">News</a>
-            <div class="navbar-item dropdown season-dropdown">
-                <span>Seasons</span>
-                <div class="scrollable-menu">
-                    {% for y in range(2024, 2014, -1) %}
-                        <a href="/season/{{ y }}" class="team-item">{{ y }}</a>
-                    {% endfor %}
-                </div>
-            </div>
-            <a href="/about" class="navbar-item">About Us</a>
-        </div>
-    </header>
-    <div class="news-container">
-        <h1>Latest MLB News</h1>
-        <ul class="news-list">
-        {% for item in news %}
-            <li>
-                <a href="{{ item.link }}" target="_blank">{{ item.headline }}</a>
-                {% if item.published %}
-                    <span class="news-date">{{ item.published|format_date }}</span>
-                {% endif %}
-            </li>
-        {% endfor %}
-        </ul>
-    </div>
-</body>
-    """, news=news, teams=load_teams())
+    return render_news_page(get_news_list())
+
+def render_news_page(news):
+    return render_template("news.html", news=news)
 
 @app.route("/about", methods=["GET"])
+@cached_page(navbar_versions)
 def about_page():
-    return render_template_string("""
-    <!DOCTYPE html>
-<html>
-<head>
-    <title>About Us - Earley First Pitch</title>
-    <link rel="stylesheet" href="{{ url_for('static', filename='styles.css') }}">
-</head>
-<body>
-    <header class="navbar">
-        <div class="navbar-container">
-            <a href="/" class="navbar-item">Home</a>
-            <a href="/teams" class="navbar-item">Teams</a>
-            <a href="/news" class="navbar-item">News</a>
-            <a href="/about" class="navbar-item">About Us</a>
-        </div>
-    </header>
-    <div class="container">
-        <h1>About Us</h1>
-        <p>Earley First Pitch is your one-stop destination for MLB stats, news, and updates. Stay tuned for the latest information on your favorite teams and players!</p>
-    </div>
-</body>
-</html>
-    """)
+    return render_template("about.html")
+
+# --- Section: Season batter stats store ---
+# Folder holding the batterstatsYYYY.csv files
+CSV_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "CSV")
+SEASON_CSV_RE = re.compile(r"^batterstats(\d{4})\.csv$")
+PLAYER_NAME_COLUMN = "last_name, first_name"
+
+@span("parse_season_csv")
+def read_batter_stats_csv(csv_path):
+    """Read a batterstats CSV into a DataFrame whose stat columns are all numeric."""
+    df = pd.read_csv(csv_path, encoding="utf-8-sig")
+    for col in df.columns:
+        if col not in (PLAYER_NAME_COLUMN, "first_name", "last_name"):
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+    return df
+
+class SeasonStore:
+    """
+    Every batterstatsYYYY.csv in `csv_dir`, parsed once into a typed DataFrame and kept
+    in memory by year, so season pages do no file I/O or parsing. Frames are stored
+    sorted by batting average (best first); display formatting happens at render time.
+    """
+
+    def __init__(self, csv_dir=CSV_DIR):
+        self.csv_dir = csv_dir
+        self._seasons = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Parse all season files now (otherwise done lazily on first use)."""
+        with self._lock:
+            if self._seasons is None:
+                seasons = {}
+                for filename in os.listdir(self.csv_dir):
+                    match = SEASON_CSV_RE.match(filename)
+                    if match:
+                        df = read_batter_stats_csv(os.path.join(self.csv_dir, filename))
+                        if "batting_avg" in df.columns:
+                            df = df.sort_values("batting_avg", ascending=False)
+                        seasons[int(match.group(1))] = df
+                self._seasons = seasons
+        return self._seasons
+
+    def years(self):
+        """Seasons with data, newest first."""
+        return sorted(self._seasons if self._seasons is not None else self.load(), reverse=True)
+
+    def get(self, year):
+        """The typed DataFrame for a season, or None if there is no file for it."""
+        seasons = self._seasons if self._seasons is not None else self.load()
+        return seasons.get(year)
+
+season_store = SeasonStore()
+
+# --- Section: Season stats queries (sorting, filtering, pagination) ---
+SEASON_PAGE_SIZE = 50
+SEASON_MAX_PAGE_SIZE = 1000
+SEASON_FILTER_RE = re.compile(r"^\s*(\w+)\s*(>=|<=|==|!=|>|<|=)\s*(-?(?:\d+\.?\d*|\.\d+))\s*$")
+SEASON_FILTER_OPS = {
+    ">=": np.greater_equal,
+    "<=": np.less_equal,
+    ">": np.greater,
+    "<": np.less,
+    "=": np.equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+
+@span("query_season")
+def query_season_stats(df, sort="batting_avg", descending=True, filters=(), limit=SEASON_PAGE_SIZE, offset=0):
+    """
+    Filter, sort and page a typed season DataFrame.
+
+    `filters` is a sequence of (column, operator, number) tuples such as ("ab", ">=", 400),
+    all of which must hold. Filtering is a vectorized mask over the numeric columns and the
+    sort is stable, so equal values keep the store's batting-average order. Returns the
+    requested page and the number of rows that matched before paging.
+    """
+    if filters:
+        mask = np.ones(len(df), dtype=bool)
+        for column, op, value in filters:
+            mask &= SEASON_FILTER_OPS[op](df[column].to_numpy(), value)
+        df = df[mask]
+    if sort:
+        df = df.sort_values(sort, ascending=not descending, kind="mergesort", na_position="last")
+    total = len(df)
+    return df.iloc[offset:offset + limit], total
+
+def parse_season_query(args, df):
+    """
+    Read sort/filter/paging options for a season from request query arguments.
+
+    Supports ?sort=<column>&order=asc|desc&limit=<n>&offset=<n>, filters written as
+    repeated ?filter=ab>=400, and the shorthands ?ab>=400, ?home_run>20 and ?ab=400.
+    Raises ValueError with a user-facing message for unknown columns or bad values.
+    """
+    numeric_columns = set(df.select_dtypes(include="number").columns)
+    sort = args.get("sort", "batting_avg")
+    if sort not in df.columns:
+        raise ValueError(f"Unknown sort column: {sort}")
+    order = args.get("order", "desc").lower()
+    if order not in ("asc", "desc"):
+        raise ValueError("order must be asc or desc")
+    try:
+        limit = int(args.get("limit", SEASON_PAGE_SIZE))
+        offset = int(args.get("offset", 0))
+    except ValueError:
+        raise ValueError("limit and offset must be integers")
+    if not 1 <= limit <= SEASON_MAX_PAGE_SIZE or offset < 0:
+        raise ValueError(f"limit must be between 1 and {SEASON_MAX_PAGE_SIZE} and offset must not be negative")
+
+    expressions = list(args.getlist("filter"))
+    for key, value in args.items(multi=True):
+        # "?ab>=400" is parsed as key "ab>" with value "400", and "?ab>400" as key "ab>400"
+        if key[-1:] in ("<", ">", "!") and key[:-1] in df.columns:
+            expressions.append(f"{key}={value}")
+        elif key in df.columns:
+            expressions.append(f"{key}={value}")  # an equality filter
+        elif not value and SEASON_FILTER_RE.match(key):
+            expressions.append(key)
+    filters = []
+    for expression in expressions:
+        match = SEASON_FILTER_RE.match(expression)
+        if not match:
+            raise ValueError(f"Invalid filter: {expression}")
+        column, op, value = match.groups()
+        if column not in numeric_columns:
+            raise ValueError(f"Cannot filter on column: {column}")
+        filters.append((column, op, float(value)))
+
+    return {
+        "sort": sort,
+        "descending": order == "desc",
+        "filters": filters,
+        "limit": limit,
+        "offset": offset,
+    }
 
 @app.route("/season/<int:year>")
+@cached_page(navbar_versions)
 def season_stats(year):
-    # Path to your CSV files (adjust as needed)
-    csv_folder = os.path.join(os.getcwd(), "CSV")
-    csv_filename = f"batterstats{year}.csv"
-    csv_path = os.path.join(csv_folder, csv_filename)
-    if not os.path.exists(csv_path):
+    df = season_store.get(year)
+    if df is None:
         return f"No data available for {year}", 404
-
-    columns, rows = process_batter_stats_csv(csv_path)
+    try:
+        query = parse_season_query(request.args, df)
+    except ValueError as e:
+        return str(e), 400
+
+    page, total = query_season_stats(df, **query)
+    if query["offset"] >= total > 0:
+        # Past the end (a stale link, or a hand-edited offset): show the last page
+        query["offset"] = (total - 1) // query["limit"] * query["limit"]
+        page, total = query_season_stats(df, **query)
+    columns, rows = format_batter_stats(page)
+    column_keys = batter_stat_columns(list(page.columns))
+
+    def season_url(**changes):
+        # Encoded by hand rather than as url_for keywords, which would treat arguments
+        # such as ?_scheme= or ?_anchor= as its own options
+        args = request.args.to_dict(flat=False)
+        for key, value in changes.items():
+            args[key] = [value]
+        return f"{url_for('season_stats', year=year)}?{urlencode(args, doseq=True)}"
+
+    offset, limit = query["offset"], query["limit"]
+    sort_links = {}
+    for key in column_keys:
+        if key in df.columns:
+            # Clicking the current sort column flips its direction; other columns start descending
+            flip = "asc" if key == query["sort"] and query["descending"] else "desc"
+            sort_links[key] = season_url(sort=key, order=flip, offset=0)
+    prev_url = season_url(offset=max(offset - limit, 0)) if offset > 0 else None
+    next_url = season_url(offset=offset + limit) if offset + limit < total else None
 
     # Render as HTML table 1:1 with CSV
-    return render_template_string("""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Batter Stats {{ year }}</title>
-        <link rel="stylesheet" href="{{ url_for('static', filename='styles.css') }}">
-        <style>
-            .season-table-container { overflow-x: auto; margin: 32px 0; }
-            .season-table { border-collapse: collapse; width: 100%; font-size: 0.95rem; }
-            .season-table th, .season-table td { border: 1px solid #444; padding: 6px 10px; text-align: center; }
-            .season-table th { background: #232526; color: #fff; }
-            .season-table tr:nth-child(even) { background: #2d2f31; }
-        </style>
-    </head>
-    <body>
-        <header class="navbar">
-            <div class="navbar-container">
-                <a href="/" class="navbar-item">Home</a>
-                <div class="navbar-item dropdown">
-                    <span>Teams</span>
-                    <div class="scrollable-menu">
-                        {% for team in teams %}
-                            <a href="/team?team={{ team.abbreviation }}" class="team-item">
-                                {{ team.displayName }}
-                            </a>
-                        {% endfor %}
-                    </div>
-                </div>
-                <a href="/news" class="navbar-item">News</a>
-                <div class="navbar-item dropdown season-dropdown">
-                    <span>Seasons</span>
-                    <div class="scrollable-menu">
-                        {% for y in range(2024, 2014, -1) %}
-                            <a href="/season/{{ y }}" class="team-item">{{ y }}</a>
-                        {% endfor %}
-                    </div>
-                </div>
-                <a href="/about" class="navbar-item">About Us</a>
-            </div>
-        </header>
-        <div class="container">
-            <h1>Batter Stats {{ year }}</h1>
-            <div class="season-table-container">
-                <table class="season-table">
-                    <thead>
-                        <tr>
-                            {% for col in columns %}
-                                <th>{{ col }}</th>
-                            {% endfor %}
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {% for row in rows %}
-                            <tr>
-                                {% for cell in row %}
-                                    <td>{{ cell }}</td>
-                                {% endfor %}
-                            </tr>
-                        {% endfor %}
-                    </tbody>
-                </table>
-            </div>
-        </div>
-    </body>
-    </html>
-    """, year=year, columns=columns, rows=rows, teams=load_teams())
+    return render_template(
+        "season.html", year=year, columns=columns, rows=rows,
+        column_keys=column_keys, sort_links=sort_links, sort=query["sort"],
+        descending=query["descending"], offset=offset, total=total,
+        prev_url=prev_url, next_url=next_url,
+    )
 
 def process_batter_stats_csv(csv_path):
-    df = pd.read_csv(csv_path)
-
-    if "first_name" in df.columns and "last_name" in df.columns:
-        df["Player Name"] = df["first_name"].astype(str) + " " + df["last_name"].astype(str)
-        df = df.drop(columns=["first_name", "last_name"])
-
-    if "player_id" in df.columns:
-        df = df.drop(columns=["player_id"])
-
+    df = read_batter_stats_csv(csv_path)
     if "batting_avg" in df.columns:
         df = df.sort_values("batting_avg", ascending=False)
+    return format_batter_stats(df)
 
-    col_abbr = {
-        "Last Name, First Name": "Player Name",
-        "Ab": "AB",
-        "Hit": "H",
-        "Batting Avg": "Avg",
-        "Single": "1B",
-        "Double": "2B",
-        "Triple": "3B",
-        "Home Run": "HR",
-        "K Percent": "K%",
-        "Bb Percent": "BB%",
-        "On Base Percent": "OBP",
-        "On Base Plus Slg": "OPS",
-        "B Rbi": "RBI",
-        "Rbi": "RBI",
-    }
-
-    cols = list(df.columns)
+def batter_stat_columns(columns):
+    """The season table's columns in display order (player id dropped, Avg after Year, RBI after HR)."""
+    cols = [col for col in columns if col not in ("player_id", "first_name", "last_name")]
+    if "first_name" in columns and "last_name" in columns:
+        cols.append("Player Name")
 
     # Move Batting Avg after Year if both exist
     if "batting_avg" in cols and "year" in cols:
@@ -1029,7 +2155,32 @@ def process_batter_stats_csv(csv_path):
         hr_idx = cols.index("home_run")
         cols.insert(hr_idx + 1, rbi_col)
 
-    df = df[cols]
+    return cols
+
+@span("format_season")
+def format_batter_stats(df):
+    """Turn a typed season DataFrame into display column names and rows for the season table."""
+    if "first_name" in df.columns and "last_name" in df.columns:
+        df = df.assign(**{"Player Name": df["first_name"].astype(str) + " " + df["last_name"].astype(str)})
+
+    col_abbr = {
+        "Last Name, First Name": "Player Name",
+        "Ab": "AB",
+        "Hit": "H",
+        "Batting Avg": "Avg",
+        "Single": "1B",
+        "Double": "2B",
+        "Triple": "3B",
+        "Home Run": "HR",
+        "K Percent": "K%",
+        "Bb Percent": "BB%",
+        "On Base Percent": "OBP",
+        "On Base Plus Slg": "OPS",
+        "B Rbi": "RBI",
+        "Rbi": "RBI",
+    }
+
+    df = df[batter_stat_columns(list(df.columns))]
 
     if "batting_avg" in df.columns:
         df["batting_avg"] = df["batting_avg"].apply(
@@ -1045,7 +2196,770 @@ def process_batter_stats_csv(csv_path):
 
     return display_columns, rows
 
-# Make sure to have a load_teams() function that returns your teams list for the navbar.
+# --- Section: Career stats (all seasons) ---
+CAREER_COUNT_COLUMNS = ["ab", "hit", "single", "double", "triple", "home_run", "b_rbi"]
+# Rate stats combine across seasons as averages weighted by at-bats
+CAREER_RATE_COLUMNS = ["batting_avg", "on_base_percent", "on_base_plus_slg", "k_percent", "bb_percent"]
+# Stats where a lower value ranks better (percentiles and leaders are flipped)
+LOWER_IS_BETTER = {"k_percent"}
+STAT_LABELS = {
+    "ab": "AB", "hit": "H", "single": "1B", "double": "2B", "triple": "3B", "home_run": "HR", "b_rbi": "RBI",
+    "batting_avg": "Avg", "on_base_percent": "OBP", "on_base_plus_slg": "OPS", "k_percent": "K%", "bb_percent": "BB%",
+}
+LEADERS_LIMIT = 25
+LEADERS_MAX_LIMIT = 500
+LEADERS_RATE_MIN_AB = 1000  # default career at-bats needed to lead a rate stat
+
+class CareerStats:
+    """
+    Every season CSV in one frame indexed by (player_id, year), with the derived tables
+    computed up front in vectorized pandas operations:
+
+    - `seasons`: each player-season plus <stat>_delta (change from the player's previous
+      season on file) and <stat>_pct (league percentile within that season, 100 = best)
+    - `career`: per-player totals of the counting stats and AB-weighted rate stats,
+      with seasons played, first/last year and display name
+
+    A player page is then one index lookup into each table.
+    """
+
+    def __init__(self, seasons):
+        frames = [df for _, df in sorted(seasons.items())]
+        frame = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=["player_id", "year"])
+        frame = frame.dropna(subset=["player_id", "year"]).astype({"player_id": "int64", "year": "int64"})
+        frame = frame.drop_duplicates(["player_id", "year"]).set_index(["player_id", "year"]).sort_index()
+        self.count_columns = [col for col in CAREER_COUNT_COLUMNS if col in frame.columns]
+        self.rate_columns = [col for col in CAREER_RATE_COLUMNS if col in frame.columns]
+        stats = self.count_columns + self.rate_columns
+        names = frame[PLAYER_NAME_COLUMN].astype(str).str.replace(r"^\s*([^,]+),\s*(.+?)\s*$", r"\2 \1", regex=True)
+
+        by_player = frame.groupby(level="player_id")
+        by_year = frame.groupby(level="year")
+        deltas = by_player[stats].diff().add_suffix("_delta")
+        higher = [col for col in stats if col not in LOWER_IS_BETTER]
+        lower = [col for col in stats if col in LOWER_IS_BETTER]
+        percentiles = pd.concat(
+            [by_year[higher].rank(pct=True), by_year[lower].rank(pct=True, ascending=False)], axis=1
+        )[stats].mul(100).round().add_suffix("_pct")
+        self.seasons = pd.concat([frame.assign(name=names), deltas, percentiles], axis=1)
+
+        career = by_player[self.count_columns].sum()
+        if "ab" in frame.columns and self.rate_columns:
+            weights = frame[self.rate_columns].notna().mul(frame["ab"], axis=0)
+            weighted = frame[self.rate_columns].mul(frame["ab"], axis=0)
+            career[self.rate_columns] = (
+                weighted.groupby(level="player_id").sum() / weights.groupby(level="player_id").sum().replace(0, np.nan)
+            )
+        years = frame.index.get_level_values("year").to_series(index=frame.index)
+        career["seasons"] = by_player.size()
+        career["first_year"] = years.groupby(level="player_id").min()
+        career["last_year"] = years.groupby(level="player_id").max()
+        career["name"] = names.groupby(level="player_id").last()
+        self.career = career
+
+    @property
+    def stats(self):
+        return self.count_columns + self.rate_columns
+
+    def player(self, player_id):
+        """(career Series, seasons DataFrame indexed by year) for a player, or None if unknown."""
+        if player_id not in self.career.index:
+            return None
+        return self.career.loc[player_id], self.seasons.xs(player_id, level="player_id")
+
+    @span("career_leaders")
+    def leaders(self, stat, limit=LEADERS_LIMIT, min_ab=0, year=None):
+        """
+        The top `limit` players for `stat`, over careers or in one season (`year`),
+        among those with at least `min_ab` at-bats. Returns a DataFrame indexed by player_id.
+        """
+        if year is None:
+            df = self.career
+        elif year in self.seasons.index.get_level_values("year"):
+            df = self.seasons.xs(year, level="year")
+        else:
+            return self.career.iloc[0:0]
+        if min_ab and "ab" in df.columns:
+            df = df[df["ab"] >= min_ab]
+        df = df.dropna(subset=[stat])
+        return df.nsmallest(limit, stat) if stat in LOWER_IS_BETTER else df.nlargest(limit, stat)
+
+class CareerStore:
+    """CareerStats built once from season_store on first use."""
+
+    def __init__(self, seasons=season_store):
+        self.season_store = seasons
+        self._stats = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        if self._stats is None:
+            with self._lock:
+                if self._stats is None:
+                    seasons = self.season_store.load()
+                    with span("build_career_stats"):
+                        self._stats = CareerStats(seasons)
+        return self._stats
+
+career_store = CareerStore()
+
+@app.template_filter("stat")
+def format_stat(value, column):
+    """Display a stat value: .312-style rates, one decimal for percentages, whole counts."""
+    if value is None or pd.isna(value):
+        return ""
+    if column in ("k_percent", "bb_percent"):
+        return f"{value:.1f}"
+    if column in CAREER_RATE_COLUMNS:
+        text = f"{value:.3f}"
+        return text[1:] if text.startswith("0.") else text
+    return f"{int(value)}"
+
+@app.template_filter("stat_delta")
+def format_stat_delta(value, column):
+    """A signed year-over-year change, blank for a player's first season."""
+    if value is None or pd.isna(value):
+        return ""
+    text = format_stat(abs(value), column)
+    return f"+{text}" if value > 0 else f"-{text}" if value < 0 else text
+
+def parse_leaders_query(args, stats):
+    """
+    Read ?stat=&year=&limit=&min_ab= for the leaders views. Rate stats default to
+    LEADERS_RATE_MIN_AB career at-bats. Raises ValueError with a user-facing message.
+    """
+    stat = args.get("stat", "home_run")
+    if stat not in stats.stats:
+        raise ValueError(f"Unknown stat: {stat}")
+    try:
+        year = args.get("year", type=int) if args.get("year") else None
+        limit = int(args.get("limit", LEADERS_LIMIT))
+        default_min_ab = LEADERS_RATE_MIN_AB if stat in stats.rate_columns and year is None else 0
+        min_ab = int(args.get("min_ab", default_min_ab))
+    except ValueError:
+        raise ValueError("year, limit and min_ab must be integers")
+    if year is None and args.get("year"):
+        raise ValueError("year must be an integer")
+    if not 1 <= limit <= LEADERS_MAX_LIMIT or min_ab < 0:
+        raise ValueError(f"limit must be between 1 and {LEADERS_MAX_LIMIT} and min_ab must not be negative")
+    return {"stat": stat, "year": year, "limit": limit, "min_ab": min_ab}
+
+@app.route("/player/<int:player_id>")
+@cached_page(navbar_versions)
+def player_page(player_id):
+    stats = career_store.get()
+    found = stats.player(player_id)
+    if found is None:
+        return f"No player found with id {player_id}", 404
+    career, seasons = found
+    return render_template(
+        "player.html", player_id=player_id, career=career.to_dict(),
+        seasons=seasons.reset_index().to_dict("records"), stats=stats.stats, labels=STAT_LABELS,
+    )
+
+@app.route("/leaders")
+@cached_page(navbar_versions)
+def leaders_page():
+    stats = career_store.get()
+    try:
+        query = parse_leaders_query(request.args, stats)
+    except ValueError as e:
+        return str(e), 400
+    leaders = stats.leaders(**query)
+    stat_links = {
+        stat: url_for("leaders_page", stat=stat, **({"year": query["year"]} if query["year"] else {}))
+        for stat in stats.stats
+    }
+    return render_template(
+        "leaders.html", leaders=leaders.reset_index().to_dict("records"), stat_links=stat_links,
+        labels=STAT_LABELS, years=season_store.years(), **query,
+    )
+
+# --- Section: Player search ---
+SEARCH_LIMIT = 10
+SEARCH_MAX_LIMIT = 100
+SEARCH_FUZZY_CANDIDATES = 16  # vocabulary tokens scored by edit distance per fuzzy query token
+SEARCH_TOKEN_RE = re.compile(r"[a-z0-9]+")
+SEARCH_NO_MATCH = 1 << 16  # cost of a query word against a name word it does not match
+
+def normalize_search_text(text):
+    """Lowercase, accent-free words: "Acuña Jr., Ronald" -> ["acuna", "jr", "ronald"]."""
+    text = unicodedata.normalize("NFKD", str(text)).encode("ascii", "ignore").decode("ascii")
+    return SEARCH_TOKEN_RE.findall(text.lower())
+
+def trigrams(token):
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def edit_distance(a, b, limit, prefix=False):
+    """
+    Optimal-string-alignment distance (an adjacent swap counts as one edit), capped at
+    limit + 1. With prefix=True, `b` may also run on past `a`: the result is the lesser
+    of the distances to `b` and to its first len(a) characters.
+
+    Bit-parallel (Hyyro, 2003): bit i of each vector holds a column step of row i + 1 of
+    the usual table, so every character of `b` costs a few integer operations.
+    """
+    too_far = limit + 1
+    if len(b) < len(a) - limit or (len(b) > len(a) + limit and not prefix):
+        return too_far
+    if not a:
+        return 0 if prefix else min(len(b), too_far)
+    matches = {}
+    for i, char in enumerate(a):
+        matches[char] = matches.get(char, 0) | 1 << i
+    last = 1 << (len(a) - 1)
+    distance = len(a)
+    typed = too_far
+    up, down, diagonal, previous_matches = -1, 0, 0, 0
+    for j, char in enumerate(b, 1):
+        found = matches.get(char, 0)
+        swapped = ((~diagonal & found) << 1) & previous_matches
+        diagonal = (((found & up) + up) ^ up) | found | down | swapped
+        right = down | ~(diagonal | up)
+        left = diagonal & up
+        if right & last:
+            distance += 1
+        elif left & last:
+            distance -= 1
+        right = (right << 1) | 1
+        up = (left << 1) | ~(diagonal | right)
+        down = right & diagonal
+        previous_matches = found
+        if j == len(a) and prefix:
+            typed = distance
+    return min(distance, typed, too_far)
+
+def letter_mask(word):
+    """Bit set of the letters and digits in a word, for a quick "could be within k edits" test."""
+    mask = 0
+    for char in word:
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+def fuzzy_limit(token):
+    """Typos tolerated for a query word: none below 4 letters, one up to 7, two beyond."""
+    return 0 if len(token) < 4 else 1 if len(token) < 8 else 2
+
+class PlayerSearchIndex:
+    """
+    In-memory name search over players.
+
+    Names are split into normalized words. The index is built over the distinct words,
+    not the players, so it grows with the vocabulary of names rather than the pool:
+    - a sorted word list answers prefix queries with two binary searches;
+    - a trigram -> words map narrows typo-tolerant candidates before an edit-distance
+      check;
+    - word -> players postings, kept in result order, turn matching words into players;
+    - each player's word ids let several-word queries start from the players of their
+      most selective word and score the rest with array lookups.
+
+    Every query word must match a word of the name: exactly (cost 0), as a prefix
+    (cost 1) or, only if no word starts with it, within a few typos (1 + typos).
+    Results rank by total cost, then most recent season, then name.
+    """
+
+    def __init__(self, players):
+        """`players` is an iterable of (player_id, name, first_year, last_year)."""
+        # Players are numbered in tie-break order, so postings lists come out best first
+        self.players = sorted(
+            ({"player_id": player_id, "name": name, "first_year": first_year, "last_year": last_year}
+             for player_id, name, first_year, last_year in players),
+            key=lambda player: (-(player["last_year"] or 0), player["name"]),
+        )
+        names = [set(normalize_search_text(player["name"])) for player in self.players]
+        self.words = sorted(set().union(*names))
+        word_ids = {word: word_id for word_id, word in enumerate(self.words)}
+        self.postings = [[] for _ in self.words]
+        for index, words in enumerate(names):
+            for word in words:
+                self.postings[word_ids[word]].append(index)
+        # The same postings back to back, so the players under words [start, end) are one slice
+        self._posting_offsets = np.fromiter(itertools.accumulate(map(len, self.postings), initial=0),
+                                            dtype=np.int64, count=len(self.words) + 1)
+        self._flat_postings = np.fromiter(itertools.chain.from_iterable(self.postings), dtype=np.int32,
+                                          count=int(self._posting_offsets[-1]))
+        # Word ids of each player's name, one row per position, padded with -1 (the last entry of a _cost_table)
+        width = max(map(len, names), default=0)
+        self._name_words = np.full((width, len(names)), -1, dtype=np.int32)
+        for index, words in enumerate(names):
+            self._name_words[:len(words), index] = sorted(word_ids[word] for word in words)
+        self._masks = [letter_mask(word) for word in self.words]
+        self._lengths = np.fromiter(map(len, self.words), dtype=np.int32, count=len(self.words))
+        grams = {}
+        for word_id, word in enumerate(self.words):
+            for gram in trigrams(word):
+                grams.setdefault(gram, []).append(word_id)
+        self._trigrams = {gram: np.array(word_ids, dtype=np.int32) for gram, word_ids in grams.items()}
+
+    def _match_word(self, token):
+        """
+        How one query word matches the vocabulary: (start, end) of the words it is a
+        prefix of, and {word_id: 1 + typos} for near misses when that range is empty.
+        """
+        start = bisect.bisect_left(self.words, token)
+        end = bisect.bisect_left(self.words, token + "\x7f", start)
+        typos = {}
+        limit = fuzzy_limit(token)
+        if limit and start == end:
+            grams = trigrams(token)
+            postings = [self._trigrams[gram] for gram in grams if gram in self._trigrams]
+            # Each edit changes at most four trigrams (a swap), and the word may run on past the
+            # token's last one, so closer words share at least this many; none are much shorter
+            required = max(len(grams) - 4 * limit - 1, 1)
+            candidates = []
+            if postings:
+                shared = np.bincount(np.concatenate(postings), minlength=len(self.words))
+                candidates = np.flatnonzero((shared >= required) & (self._lengths >= len(token) - limit))
+                if len(candidates) > SEARCH_FUZZY_CANDIDATES:
+                    most = np.argpartition(-shared[candidates], SEARCH_FUZZY_CANDIDATES)[:SEARCH_FUZZY_CANDIDATES]
+                    candidates = candidates[most]
+                candidates = candidates.tolist()
+            mask = letter_mask(token)
+            for word_id in candidates:
+                # Each edit introduces at most one letter the word does not have
+                if bin(mask & ~self._masks[word_id]).count("1") > limit:
+                    continue
+                # Typos anywhere in a finished word, or in the part of a longer word typed so far
+                distance = edit_distance(token, self.words[word_id], limit, prefix=True)
+                if distance <= limit:
+                    typos[word_id] = 1 + distance
+        return start, end, typos
+
+    def _tier_words(self, token, start, end, typos):
+        """(cost, word ids) for each way `token` can match, cheapest first."""
+        if start < end:
+            exact = self.words[start] == token
+            if exact:
+                yield 0, [start]
+            yield 1, range(start + exact, end)
+        else:
+            for cost in sorted(set(typos.values())):
+                yield cost, [word_id for word_id, c in typos.items() if c == cost]
+
+    def _tiers(self, token, start, end, typos):
+        """Like _tier_words, with the players of each tier merged into one stream in index order."""
+        for cost, word_ids in self._tier_words(token, start, end, typos):
+            yield cost, heapq.merge(*(self.postings[word_id] for word_id in word_ids))
+
+    def _cost_table(self, token, start, end, typos):
+        """Cost of `token` against every word id, SEARCH_NO_MATCH where it does not match."""
+        table = np.full(len(self.words) + 1, SEARCH_NO_MATCH, dtype=np.int32)
+        if start < end:
+            table[start:end] = 1
+            if self.words[start] == token:
+                table[start] = 0
+        elif typos:
+            table[list(typos)] = list(typos.values())
+        return table
+
+    def _candidates(self, start, end, typos):
+        """Players named with any word the match covers, possibly repeated."""
+        offsets, flat = self._posting_offsets, self._flat_postings
+        if start < end:
+            return flat[offsets[start]:offsets[end]]
+        return np.concatenate([flat[offsets[word_id]:offsets[word_id + 1]] for word_id in typos] or [flat[:0]])
+
+    @span("player_search")
+    def search(self, query, limit=SEARCH_LIMIT):
+        """Best matching players for `query`, as dicts with player_id, name, first_year, last_year."""
+        tokens = set(normalize_search_text(query))
+        if not tokens:
+            return []
+        if len(tokens) == 1:
+            # One word: its matches stream in (cost, index) order, so the first `limit` are the answer
+            token = tokens.pop()
+            results = []
+            seen = set()
+            for _, candidates in self._tiers(token, *self._match_word(token)):
+                for index in candidates:
+                    if index not in seen:
+                        seen.add(index)
+                        results.append(index)
+                        if len(results) == limit:
+                            return [self.players[i] for i in results]
+            return [self.players[i] for i in results]
+
+        # Several words: take the players of the most selective word, then score every word
+        # against each candidate's name at once, rather than intersecting large player sets
+        matches = [(token, *self._match_word(token)) for token in tokens]
+        candidates = np.sort(min((self._candidates(*match[1:]) for match in matches), key=len))
+        if not len(candidates):
+            return []
+        # A player with two words under the same match is listed twice
+        candidates = candidates[np.concatenate(([True], candidates[1:] != candidates[:-1]))]
+        names = self._name_words[:, candidates]
+        totals = np.zeros(len(candidates), dtype=np.int32)
+        for match in matches:
+            table = self._cost_table(*match)
+            costs = table[names[0]]
+            for words in names[1:]:
+                np.minimum(costs, table[words], out=costs)
+            totals += costs
+        found = totals < SEARCH_NO_MATCH
+        candidates, totals = candidates[found], totals[found]
+        best = np.lexsort((candidates, totals))[:limit]
+        return [self.players[i] for i in candidates[best].tolist()]
+
+class PlayerSearchStore:
+    """PlayerSearchIndex over every player in career_store, built once."""
+
+    def __init__(self, careers=career_store):
+        self.career_store = careers
+        self._index = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    career = self.career_store.get().career
+                    with span("build_search_index"):
+                        self._index = PlayerSearchIndex(zip(
+                            career.index.tolist(), career["name"].tolist(),
+                            career["first_year"].tolist(), career["last_year"].tolist(),
+                        ))
+        return self._index
+
+player_search = PlayerSearchStore()
+
+def parse_search_query(args):
+    """Read ?q=&limit= for search. Raises ValueError with a user-facing message."""
+    try:
+        limit = int(args.get("limit", SEARCH_LIMIT))
+    except ValueError:
+        raise ValueError("limit must be an integer")
+    if not 1 <= limit <= SEARCH_MAX_LIMIT:
+        raise ValueError(f"limit must be between 1 and {SEARCH_MAX_LIMIT}")
+    return args.get("q", "").strip(), limit
+
+@app.route("/search")
+def search_page():
+    try:
+        query, limit = parse_search_query(request.args)
+    except ValueError as e:
+        return str(e), 400
+    results = player_search.get().search(query, limit) if query else []
+    return render_template("search.html", query=query, results=results)
+
+# --- Section: JSON API ---
+def _json_default(value):
+    # NumPy scalars that slipped through DataFrame conversions
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Record):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def json_response(payload, status=200):
+    """
+    Serialize `payload` as compact JSON with a content-hash ETag.
+
+    Conditional requests whose If-None-Match matches the hash get an empty 304, so
+    pollers only download a body when the data has changed.
+    """
+    body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=_json_default).encode("utf-8")
+    response = app.response_class(body, status=status, mimetype="application/json")
+    if status == 200:
+        response.set_etag(hashlib.sha1(body).hexdigest())
+        response.headers["Cache-Control"] = "no-cache"
+        response.make_conditional(request)
+    return response
+
+def json_error(message, status):
+    return json_response({"error": message}, status=status)
+
+@app.route("/api/games", methods=["GET"])
+def api_games():
+    return json_response({"games": get_games_list()})
+
+@app.route("/api/team/<abbr>", methods=["GET"])
+def api_team(abbr):
+    return team_api_response(abbr, get_team_registry())
+
+def team_api_response(abbr, registry):
+    team = registry.get(abbr)
+    if team is None:
+        return json_error(f"No team found for {abbr}", 404)
+    return json_response({"team": team, "games": get_team_games(abbr)})
+
+@app.route("/api/roster/<abbr>", methods=["GET"])
+def api_roster(abbr):
+    return roster_api_response(abbr, roster_store.get(abbr))
+
+def roster_api_response(abbr, roster):
+    if roster is None:
+        return json_error(f"No roster found for {abbr}", 404)
+    position_players, pitchers = roster
+    return json_response({"team": abbr, "position_players": position_players, "pitchers": pitchers})
+
+@app.route("/api/news", methods=["GET"])
+def api_news():
+    return news_api_response(get_news_list())
+
+def news_api_response(news):
+    return json_response({"news": news})
+
+@app.route("/api/season/<int:year>", methods=["GET"])
+def api_season(year):
+    """A page of a season's batter stats, with the same query arguments as /season/<year>."""
+    df = season_store.get(year)
+    if df is None:
+        return json_error(f"No data available for {year}", 404)
+    try:
+        query = parse_season_query(request.args, df)
+    except ValueError as e:
+        return json_error(str(e), 400)
+    page, total = query_season_stats(df, **query)
+    columns = list(page.columns)
+    rows = page.astype(object).where(page.notna(), None).values.tolist()
+    return json_response({
+        "year": year,
+        "total": total,
+        "offset": query["offset"],
+        "limit": query["limit"],
+        "columns": columns,
+        "rows": rows,
+    })
+
+def career_records(df):
+    """A career/seasons DataFrame as JSON-ready records, NaN as null."""
+    return df.reset_index().astype(object).where(lambda d: d.notna(), None).to_dict("records")
+
+@app.route("/api/player/<int:player_id>", methods=["GET"])
+def api_player(player_id):
+    found = career_store.get().player(player_id)
+    if found is None:
+        return json_error(f"No player found with id {player_id}", 404)
+    career, seasons = found
+    career = career.astype(object).where(career.notna(), None).to_dict()
+    return json_response({"player_id": player_id, "career": career, "seasons": career_records(seasons)})
+
+@app.route("/api/search", methods=["GET"])
+def api_search():
+    """Player name search with the same query arguments as /search."""
+    try:
+        query, limit = parse_search_query(request.args)
+    except ValueError as e:
+        return json_error(str(e), 400)
+    return json_response({"query": query, "results": player_search.get().search(query, limit) if query else []})
+
+@app.route("/api/leaders", methods=["GET"])
+def api_leaders():
+    """Leaders with the same query arguments as /leaders."""
+    stats = career_store.get()
+    try:
+        query = parse_leaders_query(request.args, stats)
+    except ValueError as e:
+        return json_error(str(e), 400)
+    return json_response({**query, "leaders": career_records(stats.leaders(**query))})
+
+# --- Section: Live score stream ---
+SCORE_STREAM_BUFFER = 512  # recent messages kept so reconnecting clients can catch up
+SCORE_STREAM_HEARTBEAT = 15  # seconds between keep-alive comments on an idle stream
+SCORE_STREAM_RETRY_MS = 5000
+# Open streams allowed per process; clients turned away fall back to polling the JSON
+# API. Under a threaded WSGI server each stream occupies a thread for as long as its page
+# is open, so there this must stay well below the threads available for normal requests
+# (gunicorn.conf.py sets it from `threads`). Streams served by asgi.py (alisten) hold
+# no thread, and it raises the limit.
+SCORE_STREAM_MAX_CLIENTS = int(os.environ.get("SCORE_STREAM_MAX_CLIENTS", 16))
+
+class ScoreStream:
+    """
+    Fan-out of scoreboard_events to Server-Sent Events clients.
+
+    Each change is encoded once into an SSE message with a sequence number as its id
+    and kept in a bounded buffer; every connected client just waits on a shared
+    condition and writes out the messages newer than the last one it sent. One
+    upstream poll therefore serves any number of clients, and a browser reconnecting
+    with Last-Event-ID resumes where it left off (or is told to resync if it fell
+    out of the buffer).
+    """
+
+    def __init__(self, buffer_size=SCORE_STREAM_BUFFER, heartbeat=SCORE_STREAM_HEARTBEAT,
+                 max_clients=SCORE_STREAM_MAX_CLIENTS):
+        self.heartbeat = heartbeat
+        self.max_clients = max_clients
+        self.clients = 0
+        self._buffer = deque(maxlen=buffer_size)  # (seq, abbrs, message)
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._wakeups = {}  # event loop -> asyncio.Event its alisten clients are waiting on
+
+    @property
+    def seq(self):
+        """Sequence number of the latest message; pages pass it as ?since= so nothing is missed."""
+        return self._seq
+
+    def publish(self, events):
+        """scoreboard_events subscriber: encode and buffer each event, then wake the clients."""
+        _, games, entries = scoreboard_poller.get_snapshot_parts()
+        entries = {entry["game_id"]: entry for entry in entries}
+        messages = []
+        for event in events:
+            payload = dict(event)
+            game = games.get(event["game_id"])
+            entry = entries.get(event["game_id"])
+            if game is not None and entry is not None:
+                payload["winner"] = entry["winner"]
+                payload["leader"] = entry["leader"]
+                payload["start_time_str"] = entry["start_time_str"]
+                payload["score_display"] = team_score_display(game)
+            data = json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=_json_default)
+            messages.append((frozenset(event["abbrs"]), "score", data))
+        with self._cond:
+            for abbrs, kind, data in messages:
+                self._seq += 1
+                self._buffer.append((self._seq, abbrs, f"id: {self._seq}\nevent: {kind}\ndata: {data}\n\n"))
+            self._cond.notify_all()
+            wakeups, self._wakeups = self._wakeups, {}
+        for loop, wakeup in wakeups.items():
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:
+                pass  # the loop has closed; its clients are gone
+
+    def connect(self):
+        """Reserve a client slot; False if max_clients streams are already open in this process."""
+        with self._cond:
+            if self.clients >= self.max_clients:
+                return False
+            self.clients += 1
+            return True
+
+    def disconnect(self):
+        with self._cond:
+            self.clients -= 1
+
+    def listen(self, team=None, last_seq=None):
+        """Yield SSE messages for one client, optionally only the games of `team`."""
+        yield f"retry: {SCORE_STREAM_RETRY_MS}\n\n"
+        last_seq, resync = self._resume(last_seq)
+        if resync:
+            # Restarted server or a gap we can no longer fill: have the page reload
+            yield f"id: {last_seq}\nevent: resync\ndata: {{}}\n\n"
+        while True:
+            with self._cond:
+                if self._seq == last_seq:
+                    self._cond.wait(self.heartbeat)
+            messages, last_seq = self._next_messages(team, last_seq)
+            yield from messages
+
+    async def alisten(self, team=None, last_seq=None):
+        """listen for coroutines: clients wait on the event loop rather than each holding a thread."""
+        yield f"retry: {SCORE_STREAM_RETRY_MS}\n\n"
+        last_seq, resync = self._resume(last_seq)
+        if resync:
+            yield f"id: {last_seq}\nevent: resync\ndata: {{}}\n\n"
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                # Checked under the lock publish takes, so a message cannot slip in between
+                wakeup = self._wakeups.setdefault(loop, asyncio.Event()) if self._seq == last_seq else None
+            if wakeup is not None:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), self.heartbeat)
+                except asyncio.TimeoutError:
+                    pass
+            messages, last_seq = self._next_messages(team, last_seq)
+            for message in messages:
+                yield message
+
+    def _next_messages(self, team, last_seq):
+        """What a client of `team` that last saw `last_seq` is sent next (at least a keep-alive), and the new last_seq."""
+        pending, last_seq = self._catch_up(last_seq)
+        if pending is None:
+            return [f"id: {last_seq}\nevent: resync\ndata: {{}}\n\n"], last_seq
+        messages = [message for _, abbrs, message in pending if team is None or team in abbrs]
+        return messages or [": keep-alive\n\n"], last_seq
+
+    def _resume(self, last_seq):
+        """
+        Where a client that last saw `last_seq` (None for a new client) starts: the
+        sequence number to continue from, and whether it must resync instead.
+        """
+        with self._cond:
+            if last_seq is None:
+                return self._seq, False
+            if last_seq > self._seq or (self._buffer and last_seq < self._buffer[0][0] - 1):
+                return self._seq, True
+            return last_seq, False
+
+    def _catch_up(self, last_seq):
+        """The buffered messages after `last_seq` (None if some already fell out) and the latest sequence number."""
+        with self._cond:
+            if self._buffer and last_seq < self._buffer[0][0] - 1:
+                return None, self._seq
+            return [item for item in self._buffer if item[0] > last_seq], self._seq
+
+score_stream = ScoreStream()
+scoreboard_events.subscribe(score_stream.publish)
+
+@app.route("/stream/scores", methods=["GET"])
+def stream_scores():
+    """Server-Sent Events with per-game score and status changes, optionally for one team (?team=NYY)."""
+    team = request.args.get("team") or None
+    last_seq = request.headers.get("Last-Event-ID", type=int)
+    if last_seq is None:
+        last_seq = request.args.get("since", type=int)
+    if not score_stream.connect():
+        response = app.response_class("Too many live score streams; poll the JSON API instead.\n",
+                                      status=503, mimetype="text/plain")
+        response.headers["Retry-After"] = str(SCORE_STREAM_RETRY_MS // 1000)
+        return response
+    scoreboard_poller.start()
+    response = app.response_class(
+        score_stream.listen(team, last_seq),
+        mimetype="text/event-stream",
+    )
+    # Runs once the server stops iterating: at the first failed write after the client leaves
+    response.call_on_close(score_stream.disconnect)
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"  # don't let a fronting nginx buffer the stream
+    return response
+
+# --- Section: Production serving ---
+def warm_caches():
+    """
+    Build everything shared and slow to build, so a prefork server (see gunicorn.conf.py)
+    can do it once in its master process before forking the workers.
+
+    Workers then start with templates compiled, seasons, career stats and the search
+    index loaded, and the teams, navbar and rosters fetched, all shared copy-on-write
+    instead of built per worker. No threads are left running: the fetch pool is shut
+    down and ESPN connections are closed, because neither survives a fork. ESPN errors
+    are reported and skipped; workers fetch what is missing on first use.
+    """
+    precompile_templates()
+    player_search.get()  # loads season_store and career_store on the way
+    try:
+        get_navbar_html()
+        run_concurrently(*[lambda abbr=abbr: roster_store.load(abbr) for abbr in TEAM_ROSTER_API])
+    except Exception as e:
+        print(f"Error warming ESPN data: {e}")
+    shutdown_fetch_pool()
+    close_http_session()
+
+def start_background_threads():
+    """Start this process's scoreboard poller, roster refresher and metrics flusher (in each worker, after the fork)."""
+    scoreboard_poller.start()
+    roster_store.start_prewarm()
+    metrics.start_flusher()
+
+# --- Section: Metrics endpoint ---
+metrics.gauge("app_page_cache_bytes", "Total size of the pages in page_cache.", lambda: page_cache.size)
+metrics.gauge("app_scoreboard_age_seconds", "Seconds since the scoreboard poller last refreshed (-1 before the first poll).",
+              lambda: round(time.time() - scoreboard_poller.updated_at, 3) if scoreboard_poller.updated_at else -1)
+metrics.gauge("app_score_stream_clients", "Open live score streams.", lambda: score_stream.clients)
+metrics.gauge("app_score_stream_seq", "Sequence number of the latest live score message.", lambda: score_stream.seq)
+
+@app.route("/metrics", methods=["GET"])
+def metrics_page():
+    """Metrics in the Prometheus text exposition format: every worker's, with METRICS_DIR set."""
+    return app.response_class(metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
 
 if __name__ == "__main__":
+    precompile_templates()
+    player_search.get()
     app.run(debug=True)
\ No newline at end of file
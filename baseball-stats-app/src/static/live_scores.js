@@ -0,0 +1,98 @@
+// Live score updates for the home and team pages.
+// Subscribes to /stream/scores and rewrites the score cell of each changed game in
+// place; games starting or leaving the slate (or a lost stream position) reload the page.
+// When the server turns the stream away (it caps open streams per process) or the
+// browser has no EventSource, the page polls the JSON API instead.
+(function () {
+    var POLL_INTERVAL_MS = 30000;
+    var table = document.querySelector("[data-live-scores]");
+    if (!table) {
+        return;
+    }
+    var page = table.getAttribute("data-live-scores");
+
+    function span(className, text) {
+        var el = document.createElement("span");
+        el.className = className;
+        el.textContent = text;
+        return el;
+    }
+
+    function renderHomeScore(cell, game) {
+        cell.textContent = "";
+        if (game.start_time_str) {
+            cell.appendChild(span("game-start-time", game.start_time_str));
+            return;
+        }
+        cell.appendChild(document.createTextNode(game.scores[0] + " - " + game.scores[1] + " "));
+        if (game.winner) {
+            cell.appendChild(span("winner-rect", game.winner + " Win"));
+        } else if (game.leader) {
+            cell.appendChild(span("leader-rect", game.leader));
+        }
+    }
+
+    function renderScore(row, game) {
+        var cell = row.querySelector("[data-score]");
+        if (page === "home") {
+            renderHomeScore(cell, game);
+        } else {
+            cell.textContent = game.score_display;
+        }
+    }
+
+    function poll() {
+        fetch(table.getAttribute("data-poll-url"), {headers: {"Accept": "application/json"}})
+            .then(function (response) {
+                return response.ok ? response.json() : null;
+            })
+            .then(function (data) {
+                if (!data) {
+                    return;
+                }
+                var rows = table.querySelectorAll("tr[data-game-id]");
+                if (rows.length !== data.games.length) {
+                    window.location.reload();
+                    return;
+                }
+                data.games.forEach(function (game) {
+                    var row = table.querySelector('tr[data-game-id="' + game.game_id + '"]');
+                    if (!row) {
+                        window.location.reload();
+                        return;
+                    }
+                    // The team API names its display string "score"
+                    renderScore(row, page === "home" ? game : {score_display: game.score});
+                });
+            })
+            .catch(function () {});
+    }
+
+    function startPolling() {
+        window.setInterval(poll, POLL_INTERVAL_MS);
+    }
+
+    if (!window.EventSource) {
+        startPolling();
+        return;
+    }
+    var source = new EventSource(table.getAttribute("data-stream-url"));
+    source.addEventListener("score", function (message) {
+        var game = JSON.parse(message.data);
+        var row = table.querySelector('tr[data-game-id="' + game.game_id + '"]');
+        if (game.type !== "changed" || !row) {
+            window.location.reload();
+            return;
+        }
+        renderScore(row, game);
+    });
+    source.addEventListener("resync", function () {
+        window.location.reload();
+    });
+    source.addEventListener("error", function () {
+        // A refused stream (503) closes the source for good; network drops just reconnect
+        if (source.readyState === EventSource.CLOSED) {
+            startPolling();
+        }
+    });
+})();
@@ -0,0 +1,11 @@
+"""
+WSGI entry point for production servers, e.g. gunicorn (settings in ../gunicorn.conf.py):
+
+    cd baseball-stats-app && gunicorn wsgi:app
+
+Importing this module warms the shared caches, so with preload_app the master process
+does it once for all workers.
+"""
+from main import app, warm_caches
+
+warm_caches()
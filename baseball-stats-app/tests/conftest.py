@@ -0,0 +1,43 @@
+import os
+import re
+import sys
+
+import pytest
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(APP_DIR, "src"))
+sys.path.insert(0, os.path.join(APP_DIR, "benchmarks"))
+
+import espn_payloads  # noqa: E402
+import main  # noqa: E402
+
+
+def synthetic_upstream(url):
+    """Serve the synthetic ESPN payloads from benchmarks/espn_payloads.py instead of calling ESPN."""
+    path = url.split("?", 1)[0].rstrip("/")
+    if path.endswith("/scoreboard"):
+        return espn_payloads.scoreboard_payload()
+    if path.endswith("/news"):
+        return espn_payloads.news_payload()
+    match = re.search(r"/teams/(\d+)/roster$", path)
+    if match:
+        return espn_payloads.roster_payload(match.group(1))
+    match = re.search(r"/teams/(\d+)$", path)
+    if match:
+        return espn_payloads.team_details_payload(match.group(1))
+    return espn_payloads.teams_payload()
+
+
+async def synthetic_async_upstream(url):
+    return synthetic_upstream(url)
+
+
+# For the whole session, so the poller and roster threads the app starts never reach ESPN either
+main._request_api_data = synthetic_upstream
+main._async_request_api_data = synthetic_async_upstream
+
+
+@pytest.fixture
+def client():
+    main.page_cache.clear()
+    return main.app.test_client()
@@ -0,0 +1,121 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import main
+
+URL = f"{main.ESPN_API_BASE}/cache-test"
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Stand-in for ESPN: answers `URL` from `responses` in order (exceptions are raised)."""
+    fake = SimpleNamespace(responses=[], calls=0)
+
+    def request(url):
+        fake.calls += 1
+        result = fake.responses.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def async_request(url):
+        await asyncio.sleep(0.01)
+        return request(url)
+
+    monkeypatch.setattr(main, "_request_api_data", request)
+    monkeypatch.setattr(main, "_async_request_api_data", async_request)
+    yield fake
+    with main._api_cache_lock:
+        main._api_cache.pop(URL, None)
+        main._api_versions.pop(URL, None)
+
+
+def expire(url, servable=True):
+    """Make the cached copy of `url` expired, and with servable=False too old to serve at all."""
+    with main._api_cache_lock:
+        _, data, servable_until = main._api_cache[url]
+        now = time.monotonic()
+        main._api_cache[url] = (now - 1, data, servable_until if servable else now - 1)
+
+
+def wait_for_refresh(url):
+    pending = main._api_inflight.get(url)
+    if pending is not None:
+        assert pending.wait(5)
+
+
+def test_expired_copy_is_served_while_refreshing(upstream):
+    upstream.responses += [{"v": 1}, {"v": 2}]
+    assert main.fetch_api_data(URL) == {"v": 1}
+    expire(URL)
+    assert main.fetch_api_data(URL) == {"v": 1}
+    wait_for_refresh(URL)
+    assert main.fetch_api_data(URL) == {"v": 2}
+    assert upstream.calls == 2
+
+
+def test_failed_refresh_keeps_the_expired_copy_for_a_while(upstream):
+    upstream.responses += [{"v": 1}, RuntimeError("ESPN is down")]
+    main.fetch_api_data(URL)
+    expire(URL)
+    assert main.fetch_api_data(URL) == {"v": 1}
+    wait_for_refresh(URL)
+    # Retried only after API_REFRESH_RETRY_DELAY
+    assert main.fetch_api_data(URL) == {"v": 1}
+    assert upstream.calls == 2
+
+
+def test_copy_past_max_staleness_is_not_served(upstream):
+    upstream.responses += [{"v": 1}, RuntimeError("ESPN is down"), {"v": 2}]
+    main.fetch_api_data(URL)
+    expire(URL, servable=False)
+    with pytest.raises(RuntimeError):
+        main.fetch_api_data(URL)
+    assert main.fetch_api_data(URL) == {"v": 2}
+
+
+def test_refresh_that_cannot_start_releases_the_url(upstream, monkeypatch):
+    upstream.responses += [{"v": 1}, {"v": 2}]
+    main.fetch_api_data(URL)
+    expire(URL)
+
+    class ShutDownPool:
+        def submit(self, *args):
+            raise RuntimeError("cannot schedule new futures after shutdown")
+
+    monkeypatch.setattr(main, "get_fetch_pool", ShutDownPool)
+    assert main.fetch_api_data(URL) == {"v": 1}
+    assert URL not in main._api_inflight
+    assert main.fetch_api_data(URL, refresh=True) == {"v": 2}
+
+
+def test_async_callers_share_one_fetch(upstream):
+    pytest.importorskip("httpx")
+    upstream.responses += [{"v": 1}]
+
+    async def fetch_together():
+        return await asyncio.gather(*[main.async_fetch_api_data(URL) for _ in range(5)])
+
+    assert asyncio.run(fetch_together()) == [{"v": 1}] * 5
+    assert upstream.calls == 1
+    assert URL not in main._api_inflight
+
+
+def test_async_expired_copy_is_served_while_refreshing(upstream):
+    pytest.importorskip("httpx")
+    upstream.responses += [{"v": 1}, {"v": 2}]
+
+    async def fetch_twice():
+        first = await main.async_fetch_api_data(URL)
+        expire(URL)
+        stale = await main.async_fetch_api_data(URL)
+        await main.get_async_client().inflight[URL].wait()
+        return first, stale, await main.async_fetch_api_data(URL)
+
+    assert asyncio.run(fetch_twice()) == ({"v": 1}, {"v": 1}, {"v": 2})
+    # The sync path sees what the async refresh cached
+    assert main.fetch_api_data(URL) == {"v": 2}
+    assert upstream.calls == 2
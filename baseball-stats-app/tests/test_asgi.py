@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("httpx")
+
+import asgi  # noqa: E402
+import conftest  # noqa: E402
+import main  # noqa: E402
+
+
+def request(path, query=b"", headers=()):
+    """Run one GET through the ASGI app; returns (status, headers, body) once the response ends."""
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": path, "query_string": query, "headers": list(headers),
+             "http_version": "1.1", "scheme": "http", "server": ("testserver", 80), "client": ("127.0.0.1", 5000)}
+    asyncio.run(asgi.app(scope, receive, send))
+    start = sent[0]
+    return start["status"], dict(start["headers"]), b"".join(m.get("body", b"") for m in sent[1:])
+
+
+@pytest.mark.parametrize("path, query", [
+    ("/", b""), ("/team", b"team=NYY"), ("/team", b"team=XXX"), ("/teams", b""), ("/news", b""),
+    ("/api/team/NYY", b""), ("/api/team/XXX", b""), ("/api/roster/NYY", b""), ("/api/news", b""),
+    ("/about", b""), ("/api/games", b""), ("/nope", b""),
+])
+def test_async_views_answer_like_the_flask_views(client, path, query):
+    expected = client.get(path, query_string=query.decode())
+    main.page_cache.clear()
+    status, headers, body = request(path, query)
+    assert status == expected.status_code
+    assert headers[b"content-type"] == expected.headers["Content-Type"].encode()
+    # Pages embed the live score stream position, which other tests move on
+    assert len(body) == len(expected.data) if path in ("/", "/team") else body == expected.data
+
+
+def test_async_views_fetch_espn_through_httpx(monkeypatch):
+    fetched = []
+
+    async def upstream(url):
+        fetched.append(url)
+        return conftest.synthetic_upstream(url)
+
+    def no_blocking_fetch(url):
+        raise AssertionError(f"{url} fetched through requests")
+
+    monkeypatch.setattr(main, "_async_request_api_data", upstream)
+    monkeypatch.setattr(main, "_request_api_data", no_blocking_fetch)
+    for url in (main.TEAMS_URL, main.NEWS_URL):
+        main._api_cache.pop(url, None)
+    main.page_cache.clear()
+    assert request("/api/team/NYY")[0] == 200
+    assert request("/news")[0] == 200
+    assert fetched == [main.TEAMS_URL, main.NEWS_URL]
+
+
+def test_stream_refuses_clients_beyond_the_cap(monkeypatch):
+    monkeypatch.setattr(main.score_stream, "max_clients", main.score_stream.clients)
+    status, headers, _ = request("/stream/scores")
+    assert status == 503
+    assert headers[b"retry-after"]
+
+
+def test_stream_ends_when_the_client_leaves():
+    clients = main.score_stream.clients
+    sent = []
+
+    async def stream():
+        left = asyncio.Event()
+
+        async def receive():
+            await left.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+            if message.get("body", b"").startswith(b"retry:"):
+                left.set()
+
+        scope = {"type": "http", "method": "GET", "path": "/stream/scores", "query_string": b"", "headers": []}
+        await asyncio.wait_for(asgi.app(scope, receive, send), 1)
+
+    asyncio.run(stream())
+    assert sent[0]["status"] == 200
+    assert main.score_stream.clients == clients
@@ -0,0 +1,66 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import main
+
+
+def season(year, rows):
+    """A season frame like season_store's: (player_id, name, ab, home_run, batting_avg, k_percent) rows."""
+    return pd.DataFrame(rows, columns=["player_id", main.PLAYER_NAME_COLUMN, "ab", "home_run",
+                                       "batting_avg", "k_percent"]).assign(year=year)
+
+
+@pytest.fixture
+def stats():
+    return main.CareerStats({
+        2022: season(2022, [
+            (1, "One, Player", 100, 10, 0.300, 20.0),
+            (2, "Two, Player", 300, 5, 0.200, 30.0),
+            (3, "Three, Player", 0, 0, 0.250, 40.0),
+        ]),
+        2023: season(2023, [
+            (1, "One, Player", 300, 20, np.nan, 10.0),
+            (2, "Two, Player", 150, 15, 0.280, 25.0),
+        ]),
+    })
+
+
+def test_rate_stats_are_weighted_by_at_bats(stats):
+    career = stats.career
+    assert career.loc[1, "ab"] == 400 and career.loc[1, "home_run"] == 30
+    # Seasons without a value carry no weight
+    assert career.loc[1, "batting_avg"] == pytest.approx(0.300)
+    assert career.loc[1, "k_percent"] == pytest.approx((20 * 100 + 10 * 300) / 400)
+    assert career.loc[2, "batting_avg"] == pytest.approx((0.2 * 300 + 0.28 * 150) / 450)
+    # No at-bats at all: no rate, rather than a division by zero
+    assert math.isnan(career.loc[3, "batting_avg"])
+    assert career.loc[2, ["seasons", "first_year", "last_year", "name"]].tolist() == [2, 2022, 2023, "Player Two"]
+
+
+def test_percentiles_flip_for_lower_is_better(stats):
+    seasons = stats.seasons.xs(2022, level="year")
+    assert seasons["home_run_pct"].tolist() == [100, 67, 33]
+    # The lowest strikeout rate ranks best
+    assert seasons["k_percent_pct"].tolist() == [100, 67, 33]
+
+
+def test_deltas_are_per_player(stats):
+    _, seasons = stats.player(2)
+    assert math.isnan(seasons.loc[2022, "ab_delta"])
+    assert seasons.loc[2023, "ab_delta"] == -150
+    assert seasons.loc[2023, "home_run_delta"] == 10
+    assert stats.player(99) is None
+
+
+def test_leaders(stats):
+    assert stats.leaders("home_run").index.tolist() == [1, 2, 3]
+    # Lower is better, and a player without a rate is left out
+    assert stats.leaders("k_percent").index.tolist() == [1, 2]
+    assert stats.leaders("home_run", min_ab=420).index.tolist() == [2]
+    assert stats.leaders("home_run", limit=1).index.tolist() == [1]
+    assert stats.leaders("home_run", year=2023).index.tolist() == [1, 2]
+    assert stats.leaders("home_run", year=2023, min_ab=200).index.tolist() == [1]
+    assert stats.leaders("home_run", year=1999).empty
@@ -0,0 +1,68 @@
+import json
+import os
+import time
+
+import main
+
+
+def write_snapshot(directory, pid, written_at, counters=(), gauges=None):
+    with open(os.path.join(directory, f"{pid}-0.json"), "w") as f:
+        json.dump({"pid": pid, "written_at": written_at, "counters": list(counters),
+                   "histograms": [], "gauges": gauges or {}}, f)
+
+
+def test_single_process_metrics():
+    metrics = main.Metrics()
+    metrics.inc("app_requests_total", route="/", status=200)
+    metrics.inc("app_requests_total", route="/", status=200)
+    metrics.observe("app_request_duration_seconds", 0.003, route="/")
+    metrics.gauge("open_things", "Things open.", lambda: 3)
+    text = metrics.render()
+    assert 'app_requests_total{route="/",status="200"} 2' in text
+    assert 'app_request_duration_seconds_bucket{route="/",le="0.0025"} 0' in text
+    assert 'app_request_duration_seconds_bucket{route="/",le="0.005"} 1' in text
+    assert 'app_request_duration_seconds_count{route="/"} 1' in text
+    assert "open_things 3" in text
+
+
+def test_workers_are_summed_through_the_directory(tmp_path):
+    worker, other = main.Metrics(directory=str(tmp_path)), main.Metrics(directory=str(tmp_path))
+    worker.inc("app_requests_total", route="/", status=200)
+    other.inc("app_requests_total", 2, route="/", status=200)
+    other.inc("app_requests_total", route="/news", status=200)
+    worker.observe("app_request_duration_seconds", 0.003, route="/")
+    other.observe("app_request_duration_seconds", 0.02, route="/")
+    other.flush()
+
+    text = worker.render()
+    assert 'app_requests_total{route="/",status="200"} 3' in text
+    assert 'app_requests_total{route="/news",status="200"} 1' in text
+    assert 'app_request_duration_seconds_bucket{route="/",le="0.005"} 1' in text
+    assert 'app_request_duration_seconds_bucket{route="/",le="0.025"} 2' in text
+    assert 'app_request_duration_seconds_sum{route="/"} 0.023000' in text
+
+
+def test_exited_workers_keep_counting_but_lose_their_gauges(tmp_path):
+    metrics = main.Metrics(directory=str(tmp_path))
+    metrics.gauge("open_things", "Things open.", lambda: 3)
+    counter = ["app_requests_total", [["route", "/"]], 5]
+    write_snapshot(tmp_path, 1, time.time(), [counter], {"open_things": 7})
+    write_snapshot(tmp_path, 2, time.time() - 2 * main.METRICS_GAUGE_MAX_AGE, [counter], {"open_things": 9})
+
+    text = metrics.render()
+    assert 'app_requests_total{route="/"} 10' in text
+    assert 'open_things{pid="1"} 7' in text
+    assert 'open_things{pid="2"}' not in text
+    assert f'open_things{{pid="{os.getpid()}"}} 3' in text
+    assert text.count("# TYPE open_things gauge") == 1
+
+
+def test_flush_without_gauges(tmp_path):
+    metrics = main.Metrics(directory=str(tmp_path))
+    metrics.inc("app_requests_total", route="/")
+    metrics.gauge("open_things", "Things open.", lambda: 3)
+    metrics.flush(gauges=False)
+    (path,) = tmp_path.glob("*.json")
+    snapshot = json.loads(path.read_text())
+    assert snapshot["gauges"] == {}
+    assert snapshot["counters"] == [["app_requests_total", [["route", "/"]], 1]]
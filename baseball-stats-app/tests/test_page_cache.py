@@ -0,0 +1,80 @@
+import main
+
+
+def test_get_returns_entry_for_matching_versions():
+    cache = main.PageCache()
+    cache.put("a", (1,), b"body", "text/html")
+    assert cache.get("a", (1,)) == ((1,), b"body", "text/html")
+    assert cache.get("b", (1,)) is None
+
+
+def test_changed_versions_evict_the_entry():
+    cache = main.PageCache()
+    cache.put("a", (1,), b"body", "text/html")
+    assert cache.get("a", (2,)) is None
+    assert cache.size == 0
+    # Gone for good, not just hidden from the newer versions
+    assert cache.get("a", (1,)) is None
+
+
+def test_put_replaces_and_tracks_size():
+    cache = main.PageCache()
+    cache.put("a", (1,), b"12345", "text/html")
+    cache.put("a", (2,), b"123", "text/html")
+    assert cache.size == 3
+    assert cache.get("a", (2,))[1] == b"123"
+
+
+def test_evicts_least_recently_used_beyond_max_bytes():
+    cache = main.PageCache(max_bytes=10)
+    cache.put("a", (), b"1234", "text/html")
+    cache.put("b", (), b"1234", "text/html")
+    cache.get("a", ())  # "b" is now the least recently used
+    cache.put("c", (), b"1234", "text/html")
+    assert cache.get("b", ()) is None
+    assert cache.get("a", ()) is not None
+    assert cache.get("c", ()) is not None
+    assert cache.size == 8
+
+
+def test_oversized_bodies_are_not_cached():
+    cache = main.PageCache(max_bytes=4)
+    cache.put("a", (), b"12345", "text/html")
+    assert cache.get("a", ()) is None
+    assert cache.size == 0
+
+
+# Registered at import, since Flask refuses new routes once the app has served a request
+renders = []
+versions = [1]
+
+
+@main.app.route("/_test/cached")
+@main.cached_page(lambda: tuple(versions))
+def cached_test_page():
+    renders.append(1)
+    return f"render {len(renders)}"
+
+
+def test_cached_page_serves_hits_until_versions_change(client):
+    assert client.get("/_test/cached").get_data(as_text=True) == "render 1"
+    assert client.get("/_test/cached").get_data(as_text=True) == "render 1"
+    assert client.get("/_test/cached?x=1").get_data(as_text=True) == "render 2"
+    versions[0] = 2
+    assert client.get("/_test/cached").get_data(as_text=True) == "render 3"
+
+
+def test_navbar_pages_render_while_the_teams_cannot_be_loaded(client, monkeypatch):
+    fetch = main.fetch_api_data
+
+    def teams_down(url, *args, **kwargs):
+        if url == main.TEAMS_URL:
+            raise RuntimeError("ESPN is down")
+        return fetch(url, *args, **kwargs)
+
+    monkeypatch.setattr(main, "fetch_api_data", teams_down)
+    monkeypatch.setattr(main, "_team_registry", None)
+    monkeypatch.setattr(main, "_navbar_fragment", (None, None))
+    assert main.navbar_versions() == (0, tuple(main.season_store.years()))
+    for path in ("/about", "/leaders"):
+        assert client.get(path).status_code == 200, path
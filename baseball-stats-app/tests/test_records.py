@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+import espn_payloads
+import main
+
+
+def test_record_reads_as_attributes_and_items():
+    side = main.TeamSide(name="Yankees", abbr="NYY", score=3)
+    assert side.name == side["name"] == "Yankees"
+    assert side.get("missing", 0) == 0
+    assert side.to_dict() == {"name": "Yankees", "abbr": "NYY", "score": 3}
+    assert side == main.TeamSide(name="Yankees", abbr="NYY", score=3)
+    assert side != main.TeamSide(name="Yankees", abbr="NYY", score=4)
+
+
+def test_unset_record_fields_are_none_in_to_dict():
+    entry = main.RosterEntry(name="Aaron Judge", pos="RF")
+    assert entry.to_dict()["number"] is None
+    with pytest.raises(KeyError):
+        entry["number"]
+
+
+def test_game_records_pair_up_home_and_away():
+    games = main.index_games(main.parse_scoreboard(espn_payloads.scoreboard_payload()))
+    game = next(iter(games.values()))
+    assert isinstance(game, main.GameRecord)
+    assert {game.home.abbr, game.away.abbr} == set(game.abbrs)
+    assert json.loads(json.dumps(game, default=main._json_default))["game_id"] == game.game_id
+
+
+def test_player_stats_is_a_live_mapping():
+    player = main.PlayerStats("Aaron Judge", "NYY")
+    player.add_stat("hr", 1)
+    player.stats["hr"] = 99
+    player.stats["rbi"] = 5
+    assert player.get_stat("hr") == 99
+    assert player.stats == {"hr": 99, "rbi": 5}
+    del player.stats["hr"]
+    assert dict(player.stats) == {"rbi": 5}
+    assert player.get_stat("hr") is None
+    player.stats = {"avg": 0.3}
+    assert list(player.stats.items()) == [("avg", 0.3)]
+
+
+def test_players_with_the_same_stats_share_a_layout():
+    a, b = main.PlayerStats("a", "NYY"), main.PlayerStats("b", "BOS")
+    for player in (a, b):
+        player.add_stat("hr", 1)
+        player.add_stat("rbi", 2)
+    assert a._layout is b._layout
+    b.add_stat("sb", 3)
+    assert a.stats == {"hr": 1, "rbi": 2}
+
+
+def test_team_holds_the_players_themselves():
+    team = main.TeamStats("NYY")
+    judge = main.PlayerStats("Aaron Judge", "NYY")
+    judge.add_stat("hr", 1)
+    team.add_player(judge)
+    judge.add_stat("rbi", 5)
+    assert team.get_player("Aaron Judge").get_stat("rbi") == 5
+    team.get_player("Aaron Judge").add_stat("sb", 2)
+    assert judge.get_stat("sb") == 2
+    assert team.players == {"Aaron Judge": judge}
+    assert team.get_player("nobody") is None
+
+
+def test_team_column_reads_one_stat_for_every_player():
+    team = main.TeamStats("NYY")
+    for name, hr in (("a", 10), ("b", None), ("c", 3)):
+        player = main.PlayerStats(name, "NYY")
+        if hr is not None:
+            player.add_stat("hr", hr)
+        team.add_player(player)
+    assert team.column("hr") == [10, None, 3]
+    assert team.column("sb") == [None, None, None]
@@ -0,0 +1,102 @@
+import asyncio
+import json
+
+import main
+
+
+def stream_with(events_abbrs, buffer_size=8):
+    stream = main.ScoreStream(buffer_size=buffer_size, heartbeat=0.01)
+    for i, abbrs in enumerate(events_abbrs):
+        stream.publish([{"type": "changed", "game_id": f"g{i}", "abbrs": abbrs, "changes": ["score"]}])
+    return stream
+
+
+def take(listener, count):
+    return [next(listener) for _ in range(count)]
+
+
+def message_ids(messages):
+    return [int(m.split("\n", 1)[0][len("id: "):]) for m in messages if m.startswith("id: ")]
+
+
+def test_new_client_starts_at_the_latest_message():
+    stream = stream_with([["NYY", "BOS"], ["LAD", "SF"]])
+    retry, keep_alive = take(stream.listen(), 2)
+    assert retry.startswith("retry: ")
+    assert keep_alive == ": keep-alive\n\n"
+
+
+def test_resume_after_last_event_id():
+    stream = stream_with([["NYY", "BOS"], ["LAD", "SF"], ["NYY", "TB"]])
+    messages = take(stream.listen(last_seq=1), 3)
+    assert message_ids(messages) == [2, 3]
+    data = json.loads(messages[1].split("data: ", 1)[1])
+    assert data["game_id"] == "g1"
+
+
+def test_team_filter():
+    stream = stream_with([["NYY", "BOS"], ["LAD", "SF"], ["NYY", "TB"]])
+    messages = take(stream.listen(team="NYY", last_seq=0), 3)
+    assert message_ids(messages) == [1, 3]
+
+
+def test_resync_when_resume_point_left_the_buffer():
+    stream = stream_with([["NYY", "BOS"]] * 5, buffer_size=2)
+    retry, resync = take(stream.listen(last_seq=1), 2)
+    assert resync == "id: 5\nevent: resync\ndata: {}\n\n"
+
+
+def test_resync_after_server_restart():
+    stream = stream_with([["NYY", "BOS"]])
+    _, resync = take(stream.listen(last_seq=40), 2)
+    assert resync.startswith("id: 1\nevent: resync")
+
+
+def test_publish_while_listening():
+    stream = stream_with([])
+    listener = stream.listen()
+    take(listener, 2)  # retry, then a keep-alive once it is waiting
+    stream.publish([{"type": "changed", "game_id": "g9", "abbrs": ["NYY"], "changes": ["score"]}])
+    assert message_ids([next(listener)]) == [1]
+
+
+def test_async_listener_wakes_on_publish():
+    stream = stream_with([])
+    stream.heartbeat = 5
+
+    async def listen():
+        listener = stream.alisten(team="NYY")
+        await anext(listener)  # retry
+        waiting = asyncio.ensure_future(anext(listener))
+        await asyncio.sleep(0.05)
+        # From another thread, as the scoreboard poller does
+        await asyncio.to_thread(stream.publish, [{"type": "changed", "game_id": "g9", "abbrs": ["NYY"], "changes": ["score"]}])
+        message = await asyncio.wait_for(waiting, 1)
+        await listener.aclose()
+        return message
+
+    assert message_ids([asyncio.run(listen())]) == [1]
+
+
+def test_stream_route_resumes_from_last_event_id(client):
+    seq = main.score_stream.seq
+    main.score_stream.publish([{"type": "changed", "game_id": "route", "abbrs": ["NYY"], "changes": ["score"]}])
+    response = client.get("/stream/scores", headers={"Last-Event-ID": str(seq)})
+    assert response.mimetype == "text/event-stream"
+    chunks = response.iter_encoded()
+    next(chunks)  # retry
+    assert message_ids([next(chunks).decode()]) == [seq + 1]
+    response.close()
+
+
+def test_stream_route_refuses_clients_beyond_the_cap(client, monkeypatch):
+    monkeypatch.setattr(main.score_stream, "max_clients", main.score_stream.clients + 1)
+    first = client.get("/stream/scores")
+    assert first.status_code == 200
+    refused = client.get("/stream/scores")
+    assert refused.status_code == 503
+    assert refused.headers["Retry-After"]
+    first.close()
+    second = client.get("/stream/scores")
+    assert second.status_code == 200
+    second.close()
@@ -0,0 +1,106 @@
+import threading
+import time
+
+import espn_payloads
+import main
+
+
+def games(seed=0):
+    return main.index_games(main.parse_scoreboard(espn_payloads.scoreboard_payload(seed=seed)))
+
+
+def test_identical_polls_have_no_events():
+    assert main.diff_games(games(), games()) == []
+
+
+def test_added_and_removed_games():
+    previous, current = games(), games()
+    removed_id = next(iter(previous))
+    del current[removed_id]
+    added = games()
+    added_id = next(iter(added))
+    added[added_id].game_id = "new-game"
+    current["new-game"] = added[added_id]
+
+    events = {event["game_id"]: event for event in main.diff_games(previous, current)}
+    assert set(events) == {removed_id, "new-game"}
+    assert events[removed_id]["type"] == "removed"
+    assert events["new-game"]["type"] == "added"
+    assert events["new-game"]["changes"] == ["added"]
+
+
+def test_changed_fields_are_named_once_each():
+    previous, current = games(), games()
+    game_id = next(iter(current))
+    game = current[game_id]
+    game.scores = [score + 1 for score in game.scores]
+    game.balls += 1
+    game.outs = (game.outs + 1) % 3
+    game.status_detail = "Bot 9th"
+
+    (event,) = main.diff_games(previous, current)
+    assert event["type"] == "changed"
+    assert event["game_id"] == game_id
+    assert event["changes"] == ["score", "status", "situation"]
+    assert event["scores"] == game.scores
+    assert event["on_base"] == [game.on_first, game.on_second, game.on_third]
+
+
+def test_event_bus_isolates_failing_subscribers():
+    bus = main.EventBus()
+    received = []
+
+    def broken(events):
+        raise RuntimeError("boom")
+
+    bus.subscribe(broken)
+    bus.subscribe(received.append)
+    bus.publish(["event"])
+    bus.unsubscribe(received.append)
+    bus.publish(["ignored"])
+    assert received == [["event"]]
+
+
+def scoreboard_down(monkeypatch, block=None):
+    """Make scoreboard fetches fail, after waiting for `block` (a threading.Event) if given."""
+    fetch = main.fetch_api_data
+
+    def fetch_api_data(url, *args, **kwargs):
+        if url == main.SCOREBOARD_URL:
+            if block is not None:
+                block.wait(5)
+            raise RuntimeError("ESPN is down")
+        return fetch(url, *args, **kwargs)
+
+    monkeypatch.setattr(main, "fetch_api_data", fetch_api_data)
+
+
+def timed(call):
+    started = time.perf_counter()
+    result = call()
+    return result, time.perf_counter() - started
+
+
+def test_failed_first_poll_does_not_block_later_callers(monkeypatch):
+    scoreboard_down(monkeypatch)
+    poller = main.ScoreboardPoller(interval=60)
+    try:
+        assert poller.get_games(timeout=5) == {}
+        _, elapsed = timed(lambda: poller.get_games_list(timeout=5))
+        assert elapsed < 0.5
+    finally:
+        poller.stop()
+
+
+def test_only_the_first_caller_waits_for_a_hanging_poll(monkeypatch):
+    hanging = threading.Event()
+    scoreboard_down(monkeypatch, block=hanging)
+    poller = main.ScoreboardPoller(interval=60)
+    try:
+        games, elapsed = timed(lambda: poller.get_games(timeout=0.2))
+        assert games == {} and elapsed >= 0.2
+        _, elapsed = timed(lambda: poller.get_version(timeout=5))
+        assert elapsed < 0.1
+    finally:
+        hanging.set()
+        poller.stop()
@@ -0,0 +1,116 @@
+import random
+
+import pytest
+
+import bench_search
+import main
+
+
+def reference_distance(a, b):
+    """The full optimal-string-alignment table, without banding or bit tricks."""
+    table = [[i + j if not i * j else 0 for j in range(len(b) + 1)] for i in range(len(a) + 1)]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            table[i][j] = min(table[i - 1][j] + 1, table[i][j - 1] + 1, table[i - 1][j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                table[i][j] = min(table[i][j], table[i - 2][j - 2] + 1)
+    return table[-1][-1]
+
+
+def test_edit_distance_matches_reference():
+    rng = random.Random(0)
+    for _ in range(3000):
+        a = "".join(rng.choice("abc") for _ in range(rng.randrange(8)))
+        b = "".join(rng.choice("abc") for _ in range(rng.randrange(10)))
+        for limit in (0, 1, 2):
+            assert main.edit_distance(a, b, limit) == min(reference_distance(a, b), limit + 1), (a, b, limit)
+            typed = min(reference_distance(a, b), reference_distance(a, b[:len(a)]))
+            assert main.edit_distance(a, b, limit, prefix=True) == min(typed, limit + 1), (a, b, limit)
+
+
+@pytest.mark.parametrize("a, b, limit, expected", [
+    ("iglesias", "iglesias", 2, 0),
+    ("iglseias", "iglesias", 2, 1),  # one swap
+    ("iglesia", "iglesias", 1, 1),
+    ("glesias", "iglesias", 2, 1),
+    ("igl", "iglesias", 2, 3),  # too short, capped at limit + 1
+])
+def test_edit_distance_examples(a, b, limit, expected):
+    assert main.edit_distance(a, b, limit) == expected
+
+
+def test_edit_distance_prefix_compares_typed_part():
+    assert main.edit_distance("escbo", "escobar", 1, prefix=True) == 1
+    assert main.edit_distance("escbo", "escobar", 1) == 2
+
+
+@pytest.fixture
+def index():
+    return main.PlayerSearchIndex([
+        ("ramirjo01", "José Ramírez", 2013, 2024),
+        ("ramirha01", "Harold Ramírez", 2019, 2024),
+        ("ramirma02", "Manny Ramirez", 1993, 2011),
+        ("ramoswi01", "Wilson Ramos", 2010, 2021),
+        ("iglesjo01", "José Iglesias", 2011, 2024),
+        ("acunaro01", "Ronald Acuña Jr.", 2018, 2024),
+        ("abreujo02", "José Abreu", 2014, 2024),
+    ])
+
+
+def ids(results):
+    return [player["player_id"] for player in results]
+
+
+def test_prefix_ranks_recent_players_first(index):
+    assert ids(index.search("ram")) == ["ramirha01", "ramirjo01", "ramoswi01", "ramirma02"]
+
+
+def test_exact_word_beats_prefix(index):
+    assert ids(index.search("ramos", limit=1)) == ["ramoswi01"]
+    assert ids(index.search("jose")) == ["abreujo02", "iglesjo01", "ramirjo01"]
+
+
+def test_accents_and_punctuation_are_ignored(index):
+    assert ids(index.search("Acuna jr")) == ["acunaro01"]
+
+
+def test_typos_are_tolerated_only_without_prefix_matches(index):
+    assert ids(index.search("iglseias")) == ["iglesjo01"]
+    assert ids(index.search("manny ramierz")) == ["ramirma02"]
+    assert index.search("qqqq") == []
+
+
+def test_every_word_must_match(index):
+    assert ids(index.search("jose ram")) == ["ramirjo01"]
+    assert index.search("jose ramos") == []
+
+
+def test_several_words_rank_by_total_cost(index):
+    # "jose" matches exactly for all three, "a" is a prefix of Abreu and Acuna only
+    assert ids(index.search("jose a")) == ["abreujo02"]
+    assert ids(index.search("j i")) == ["iglesjo01"]
+
+
+def test_several_words_match_scoring_every_player():
+    index = main.PlayerSearchIndex(bench_search.synthetic_players(3000, seed=1))
+    word_ids = {word: word_id for word_id, word in enumerate(index.words)}
+    names = [{word_ids[word] for word in main.normalize_search_text(player["name"])} for player in index.players]
+
+    def word_cost(word_id, token, start, end, typos):
+        if start <= word_id < end:
+            return 0 if index.words[word_id] == token else 1
+        return typos.get(word_id)
+
+    def naive(query, limit):
+        matches = [(token, *index._match_word(token)) for token in set(main.normalize_search_text(query))]
+        scored = []
+        for position, words in enumerate(names):
+            costs = [min((cost for cost in (word_cost(word_id, *match) for word_id in words) if cost is not None),
+                         default=None) for match in matches]
+            if None not in costs:
+                scored.append((sum(costs), position))
+        return [index.players[position] for _, position in sorted(scored)[:limit]]
+
+    for _, query in bench_search.queries(index, 40, seed=2):
+        if " " in query:
+            assert index.search(query, 10) == naive(query, 10), query
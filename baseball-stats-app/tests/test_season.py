@@ -0,0 +1,87 @@
+import pandas as pd
+import pytest
+from werkzeug.datastructures import MultiDict
+
+import main
+
+
+@pytest.fixture
+def season():
+    return pd.DataFrame({
+        "last_name, first_name": ["A, a", "B, b", "C, c", "D, d"],
+        "ab": [500, 300, 450, 120],
+        "home_run": [30, 5, 22, 1],
+        "batting_avg": [0.300, 0.250, 0.280, 0.310],
+    })
+
+
+def test_parse_season_query_defaults(season):
+    query = main.parse_season_query(MultiDict(), season)
+    assert query == {"sort": "batting_avg", "descending": True, "filters": [],
+                     "limit": main.SEASON_PAGE_SIZE, "offset": 0}
+
+
+def test_parse_season_query_filters_and_shorthands(season):
+    # "?ab>=400" arrives as key "ab>" with value "400"; "?home_run>20" as a bare key
+    args = MultiDict([("filter", "batting_avg<0.3"), ("ab>", "400"), ("home_run>20", ""), ("ab", "500"),
+                      ("order", "ASC")])
+    query = main.parse_season_query(args, season)
+    assert query["descending"] is False
+    assert query["filters"] == [("batting_avg", "<", 0.3), ("ab", ">=", 400.0), ("home_run", ">", 20.0),
+                                ("ab", "=", 500.0)]
+
+
+@pytest.mark.parametrize("args", [
+    {"sort": "nope"},
+    {"order": "sideways"},
+    {"limit": "0"},
+    {"limit": "x"},
+    {"offset": "-1"},
+    {"filter": "ab>>4"},
+    {"filter": "last_name, first_name>1"},
+    {"ab": "many"},
+    {"last_name, first_name": "A, a"},
+])
+def test_parse_season_query_rejects_bad_input(season, args):
+    with pytest.raises(ValueError):
+        main.parse_season_query(MultiDict(args), season)
+
+
+def test_query_season_stats_filters_sorts_and_pages(season):
+    page, total = main.query_season_stats(season, sort="ab", descending=True,
+                                          filters=[("home_run", ">=", 5)], limit=2, offset=1)
+    assert total == 3
+    assert page["ab"].tolist() == [450, 300]
+
+
+def test_query_season_stats_sort_is_stable(season):
+    tied = season.assign(ab=[100, 100, 100, 100])
+    page, _ = main.query_season_stats(tied, sort="ab", descending=True)
+    assert page["last_name, first_name"].tolist() == tied["last_name, first_name"].tolist()
+
+
+def test_season_page_sort_links_keep_filters(client):
+    year = main.season_store.years()[0]
+    response = client.get(f"/season/{year}?ab>=400&sort=hit")
+    assert response.status_code == 200
+    assert "ab%3E=400" in response.get_data(as_text=True)
+
+
+@pytest.mark.parametrize("arg", ["_scheme=x", "_anchor=x", "_external=1", "_method=POST"])
+def test_season_page_ignores_url_for_options_in_query(client, arg):
+    year = main.season_store.years()[0]
+    assert client.get(f"/season/{year}?{arg}").status_code == 200
+
+
+def test_season_page_errors(client):
+    assert client.get("/season/1800").status_code == 404
+    year = main.season_store.years()[0]
+    assert client.get(f"/season/{year}?sort=nope").status_code == 400
+
+
+def test_season_page_offset_past_the_end_shows_the_last_page(client):
+    year = main.season_store.years()[0]
+    total = len(main.season_store.get(year))
+    text = client.get(f"/season/{year}?offset=100000&limit=50").get_data(as_text=True)
+    last = (total - 1) // 50 * 50
+    assert f"Showing {last + 1}&ndash;{total} of {total}" in text